@@ -0,0 +1,59 @@
+import threading
+import rmt
+from time import perf_counter
+from rmt.exchanges.mt4 import StandInServer
+
+################################################################################
+# Measures the throughput of `MetaTrader4` requests sent by several threads, as
+# the size of its pool of REQ sockets grows from 1 to `THREADS`.
+#
+# The stand-in server delays each reply by `LATENCY` seconds, as a remote Expert
+# Server would, so a single socket is bound to about `1 / LATENCY` requests per
+# second, whereas a pool should scale about linearly with its size.
+################################################################################
+LATENCY  = 0.002
+THREADS  = 8
+DURATION = 2.0
+
+def worker(exchange: rmt.exchanges.MetaTrader4, stop_time: float, counts: list, index: int):
+    n = 0
+
+    while perf_counter() < stop_time:
+        if n % 3 == 0:
+            exchange.get_tick('EURUSD')
+        elif n % 3 == 1:
+            exchange.get_current_bar('EURUSD')
+        else:
+            exchange.get_history_bars('EURUSD', timeframe=rmt.Timeframe.H1)
+
+        n += 1
+
+    counts[index] = n
+
+with StandInServer(latency=LATENCY) as server:
+    print('%-10s %-14s %s' % ('pool size', 'requests/s', 'metrics'))
+
+    for pool_size in [1, 2, 4, 8]:
+        exchange = rmt.exchanges.MetaTrader4(
+            host      = '127.0.0.1',
+            req_port  = server.req_port(),
+            sub_port  = server.sub_port(),
+            pool_size = pool_size
+        )
+
+        counts    = [0] * THREADS
+        stop_time = perf_counter() + DURATION
+        threads   = [
+            threading.Thread(target=worker, args=(exchange, stop_time, counts, i))
+            for i in range(THREADS)
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        print('%-10s %-14.0f %s' % (pool_size, sum(counts) / DURATION, exchange.socket_pool_metrics()))
+
+        exchange.disconnect()
\ No newline at end of file
@@ -0,0 +1,77 @@
+import json
+from timeit            import Timer
+from rmt.exchanges.mt4 import CommandResultCode, JsonCodec, StdJsonCodec, OrjsonCodec, message
+
+################################################################################
+# Compares the cost of decoding messages received from the Expert Server by each
+# JSON codec installed, and by the former `str` based path ('str+json'), which
+# decoded a frame into a `str`, sliced off its content, then parsed the slice with
+# `json.loads()`.
+#
+# Payloads are shaped like those of the Expert: a tick event, a `getTick` response,
+# and `getHistoryBars` responses of 100 and 5000 bars.
+################################################################################
+REPEAT = 5
+
+def history_response(count: int) -> bytes:
+    bars = [
+        [1600000000 + 60 * i, 1.17001 + i * 1e-5, 1.17012 + i * 1e-5, 1.16993 + i * 1e-5, 1.17005 + i * 1e-5]
+        for i in range(count)
+    ]
+
+    return b'0 ' + json.dumps(bars).encode()
+
+payloads = [
+    ('tick event',         b'tick.EURUSD [1600000000,1.17001,1.17014]', 'event'),
+    ('getTick response',   b'0 {"time":1600000000,"bid":1.17001,"ask":1.17014}', 'response'),
+    ('100 bars response',  history_response(100), 'response'),
+    ('5000 bars response', history_response(5000), 'response')
+]
+
+def str_parse_event(msg: bytes):
+    msg   = msg.decode()
+    index = msg.find(' ')
+
+    return msg[:index], json.loads(msg[(index + 1):])
+
+def str_parse_response(msg: bytes):
+    msg   = msg.decode()
+    index = msg.find(' ')
+
+    return CommandResultCode(int(msg[:index])), json.loads(msg[(index + 1):])
+
+# Topics are cached by the exchanges, so that a tick's symbol is not decoded for
+# every tick.
+topics: message.TopicCache = {}
+
+codecs = [StdJsonCodec()]
+
+try:
+    codecs.append(OrjsonCodec())
+except ValueError:
+    print('orjson is not installed, only the standard codec is measured\n')
+
+print('default codec: %s\n' % JsonCodec.default())
+print('%-20s %-10s %14s' % ('payload', 'decoder', 'us/message'))
+
+for name, payload, kind in payloads:
+    if kind == 'event':
+        timer = Timer(lambda: str_parse_event(payload))
+    else:
+        timer = Timer(lambda: str_parse_response(payload))
+
+    number = timer.autorange()[0]
+    best   = min(timer.repeat(REPEAT, number)) / number
+
+    print('%-20s %-10s %14.2f' % (name, 'str+json', best * 1e6))
+
+    for codec in codecs:
+        if kind == 'event':
+            timer = Timer(lambda: message.parse_event(payload, codec, topics))
+        else:
+            timer = Timer(lambda: message.parse_response(payload, codec))
+
+        number = timer.autorange()[0]
+        best   = min(timer.repeat(REPEAT, number)) / number
+
+        print('%-20s %-10s %14.2f' % (name, codec.name(), best * 1e6))
\ No newline at end of file
@@ -0,0 +1,56 @@
+import json
+from datetime          import datetime, timezone
+from timeit            import Timer
+from rmt               import Tick
+from rmt.exchanges.mt4 import JsonCodec, binary_format, events, message, responses
+
+################################################################################
+# Compares the size and decoding cost of tick events and history responses in
+# JSON and in binary format, from the received bytes to `Tick` and `Bar` objects.
+################################################################################
+REPEAT = 5
+BARS   = 5000
+
+codec = JsonCodec.default()
+tick  = Tick(datetime.fromtimestamp(1600000000, timezone.utc), 1.17001, 1.17014)
+bars  = [
+    [1600000000 + 60 * i, 1.17001 + i * 1e-5, 1.17012 + i * 1e-5, 1.16993 + i * 1e-5, 1.17005 + i * 1e-5]
+    for i in range(BARS)
+]
+
+json_tick   = b'tick.EURUSD ' + json.dumps([1600000000, tick.bid, tick.ask]).encode()
+binary_tick = b'btick.EURUSD ' + binary_format.pack_tick(tick)
+json_bars   = b'0 ' + json.dumps(bars).encode()
+binary_bars = [b'0 {"format":"binary"}', binary_format.pack_bars(bars)]
+
+def decode_json_tick():
+    static_name, dynamic_name, content = message.parse_event(json_tick, codec)
+    return events.TickEvent(dynamic_name, content).tick()
+
+def decode_binary_tick():
+    static_name, dynamic_name, content = message.split_event(binary_tick)
+    return events.BinaryTickEvent(dynamic_name, content).tick()
+
+def decode_json_bars():
+    return responses.GetHistoryBarsResponse(message.read_response('getHistoryBars', json_bars, codec)).bars()
+
+def decode_binary_bars():
+    content = message.read_response('getHistoryBars', binary_bars[0], codec)
+    return responses.GetHistoryBarsResponse(content, binary_bars[1]).bars()
+
+cases = [
+    ('tick, JSON',             len(json_tick),                           decode_json_tick),
+    ('tick, binary',           len(binary_tick),                         decode_binary_tick),
+    ('%s bars, JSON' % BARS,   len(json_bars),                           decode_json_bars),
+    ('%s bars, binary' % BARS, sum(len(frame) for frame in binary_bars), decode_binary_bars)
+]
+
+print('JSON codec: %s\n' % codec)
+print('%-20s %10s %14s' % ('message', 'bytes', 'us/message'))
+
+for name, size, decode in cases:
+    timer  = Timer(decode)
+    number = timer.autorange()[0]
+    best   = min(timer.repeat(REPEAT, number)) / number
+
+    print('%-20s %10s %14.2f' % (name, size, best * 1e6))
\ No newline at end of file
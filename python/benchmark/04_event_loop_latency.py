@@ -0,0 +1,65 @@
+import threading
+import rmt
+from datetime          import datetime, timezone
+from time              import perf_counter, sleep
+from rmt.exchanges.mt4 import StandInServer
+
+################################################################################
+# Measures the latency from the publication of a tick by the stand-in server to
+# the call of a callback connected to `tick_received`, when events are processed
+# by `run_until()`, and by calling `process_events()` then sleeping for
+# `SLEEP_INTERVAL` seconds in a loop.
+################################################################################
+TICKS          = 200
+TICK_INTERVAL  = 0.005
+SLEEP_INTERVAL = 0.010
+
+def publish_ticks(server: StandInServer, publish_times: list):
+    for i in range(TICKS):
+        publish_times.append(perf_counter())
+        server.publish_tick('EURUSD', rmt.Tick(datetime.now(timezone.utc), 1.17 + i * 1e-5, 1.1702 + i * 1e-5))
+        sleep(TICK_INTERVAL)
+
+def sleep_loop(exchange: rmt.exchanges.MetaTrader4, received_times: list):
+    while len(received_times) < TICKS:
+        exchange.process_events()
+        sleep(SLEEP_INTERVAL)
+
+def run_loop(exchange: rmt.exchanges.MetaTrader4, received_times: list):
+    exchange.run_until(lambda: len(received_times) >= TICKS)
+
+with StandInServer() as server:
+    print('%-14s %12s %12s %12s' % ('loop', 'mean (ms)', 'p99 (ms)', 'max (ms)'))
+
+    for name, loop in [('sleep polling', sleep_loop), ('run_until', run_loop)]:
+        exchange = rmt.exchanges.MetaTrader4(
+            host     = '127.0.0.1',
+            req_port = server.req_port(),
+            sub_port = server.sub_port()
+        )
+
+        received_times = []
+        publish_times  = []
+
+        exchange.tick_received.connect(lambda symbol, tick: received_times.append(perf_counter()))
+        exchange.subscribe('EURUSD')
+
+        # Lets the subscription reach the server before ticks are published.
+        sleep(0.2)
+
+        publisher = threading.Thread(target=publish_ticks, args=(server, publish_times))
+        publisher.start()
+
+        loop(exchange, received_times)
+        publisher.join()
+
+        latencies = sorted((r - p) * 1000 for p, r in zip(publish_times, received_times))
+
+        print('%-14s %12.3f %12.3f %12.3f' % (
+            name,
+            sum(latencies) / len(latencies),
+            latencies[int(len(latencies) * 0.99) - 1],
+            latencies[-1]
+        ))
+
+        exchange.disconnect()
\ No newline at end of file
@@ -0,0 +1,62 @@
+from datetime import datetime, timezone
+from timeit   import Timer
+from rmt      import Signal, Tick
+
+try:
+    from PyQt5.QtCore import QObject, pyqtSignal
+except ImportError:
+    QObject = None
+
+################################################################################
+# Compares the cost of emitting a tick through a `pyqtSignal`, as `Exchange` used
+# to, and through a `Signal`, with no Qt event loop running. 100 strategies each
+# handle the ticks of a symbol of their own, which are filtered by their callbacks
+# when connected to a `pyqtSignal`, and by key when connected to a `Signal`.
+################################################################################
+REPEAT     = 5
+STRATEGIES = 100
+
+tick = Tick(datetime.fromtimestamp(1600000000, timezone.utc), 1.17001, 1.17014)
+
+def strategy(own_symbol: str):
+    def on_tick(symbol: str, tick: Tick):
+        if symbol != own_symbol:
+            return
+
+    return on_tick
+
+class SignalExchange:
+    tick_received = Signal(str, Tick)
+
+cases = []
+
+if QObject is not None:
+    class QtExchange(QObject):
+        tick_received = pyqtSignal(str, Tick)
+
+    for count in (0, 1, STRATEGIES):
+        exchange = QtExchange()
+
+        for i in range(count):
+            exchange.tick_received.connect(strategy('SYM%d' % i))
+
+        cases.append(('pyqtSignal, %d slots' % count, exchange))
+else:
+    print('PyQt5 is not installed, only `Signal` is measured\n')
+
+for count in (0, 1, STRATEGIES):
+    exchange = SignalExchange()
+
+    for i in range(count):
+        exchange.tick_received.connect(strategy('SYM%d' % i), 'SYM%d' % i)
+
+    cases.append(('Signal, %d keyed slots' % count, exchange))
+
+print('%-28s %14s' % ('signal', 'us/emit'))
+
+for name, exchange in cases:
+    timer  = Timer(lambda: exchange.tick_received.emit('SYM0', tick))
+    number = timer.autorange()[0]
+    best   = min(timer.repeat(REPEAT, number)) / number
+
+    print('%-28s %14.3f' % (name, best * 1e6))
\ No newline at end of file
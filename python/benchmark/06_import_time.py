@@ -0,0 +1,62 @@
+import os
+import subprocess
+import sys
+
+################################################################################
+# Measures the time taken to import `rmt` and its exchange bindings, each in a
+# fresh interpreter, and fails if an import loads a module it should not, such as
+# PyQt5 or zmq for the core data types. Exits with status 1 on such a regression.
+################################################################################
+REPEAT = 10
+
+# Statement, and modules it must not import.
+cases = [
+    ('import rmt',                                   ['zmq', 'PyQt5', 'asyncio', 'numpy', 'rmt.exchanges', 'rmt.strategy', 'rmt.bar_aggregator']),
+    ('from rmt import Tick, Bar, Order, Instrument', ['zmq', 'PyQt5', 'asyncio', 'numpy', 'rmt.exchanges', 'rmt.strategy', 'rmt.bar_aggregator']),
+    ('import rmt.exchanges.mt4',                     ['PyQt5', 'asyncio', 'numpy']),
+    ('from rmt.exchanges import MetaTrader4',        ['PyQt5', 'asyncio', 'numpy'])
+]
+
+script = """
+import sys
+from time import perf_counter
+start = perf_counter()
+%s
+elapsed = perf_counter() - start
+print(elapsed, ' '.join(name for name in %r if name in sys.modules))
+"""
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+env  = dict(os.environ, PYTHONPATH=root)
+
+def measure(statement: str, forbidden_modules: list):
+    best     = None
+    imported = []
+
+    for _ in range(REPEAT):
+        output = subprocess.run(
+            [sys.executable, '-c', script % (statement, forbidden_modules)],
+            env=env, check=True, stdout=subprocess.PIPE, universal_newlines=True
+        ).stdout.split()
+
+        elapsed  = float(output[0])
+        imported = output[1:]
+        best     = elapsed if best is None else min(best, elapsed)
+
+    return best, imported
+
+regressions = []
+
+print('%-48s %10s  %s' % ('statement', 'ms', 'forbidden modules imported'))
+
+for statement, forbidden_modules in cases:
+    best, imported = measure(statement, forbidden_modules)
+
+    print('%-48s %10.1f  %s' % (statement, best * 1e3, ', '.join(imported) or '-'))
+
+    if imported:
+        regressions.append(statement)
+
+if regressions:
+    print('\nregression: %s' % '; '.join(regressions))
+    sys.exit(1)
\ No newline at end of file
@@ -0,0 +1,64 @@
+import tracemalloc
+from datetime import datetime, timezone
+from time     import perf_counter
+from rmt      import Tick, TickStore
+
+################################################################################
+# Compares keeping the received ticks of a symbol as a list of `Tick` objects with
+# keeping them in a `TickStore`: memory held, time to receive a tick, and time to
+# compute the mean spread of the last 10000 ticks.
+#
+# Receiving a tick is simulated by creating a `Tick`, as events do, then either
+# keeping it in the list or appending it to the store, which lets it go.
+################################################################################
+TICKS  = 1000000
+WINDOW = 10000
+
+quotes = [(1600000000 + i * 0.1, 1.17001 + i * 1e-9, 1.17014 + i * 1e-9) for i in range(TICKS)]
+
+def receive(append):
+    for time, bid, ask in quotes:
+        append(Tick(datetime.fromtimestamp(time, timezone.utc), bid, ask))
+
+def measure(name: str, create, mean_spread):
+    # Memory is measured on a run of its own, since tracing allocations slows it down.
+    tracemalloc.start()
+    container = create()
+    memory    = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    del container
+
+    start        = perf_counter()
+    container    = create()
+    receive_time = perf_counter() - start
+
+    start        = perf_counter()
+    spread       = mean_spread(container)
+    compute_time = perf_counter() - start
+
+    print('%-12s %12.1f %14.2f %16.1f   (mean spread: %.5f)'
+          % (name, memory / 2**20, receive_time / TICKS * 1e6, compute_time * 1e6, spread))
+
+def create_list():
+    ticks = []
+    receive(ticks.append)
+    return ticks
+
+def list_mean_spread(ticks) -> float:
+    window = ticks[-WINDOW:]
+    return sum(tick.ask - tick.bid for tick in window) / len(window)
+
+def create_store():
+    store = TickStore(capacity=TICKS)
+    receive(lambda tick: store.append('EURUSD', tick))
+    return store
+
+def store_mean_spread(store) -> float:
+    window = store.last('EURUSD', WINDOW)
+    return float((window.asks() - window.bids()).mean())
+
+print('%-12s %12s %14s %16s' % ('container', 'memory MiB', 'us/tick', 'us/mean spread'))
+
+measure('list[Tick]', create_list,  list_mean_spread)
+measure('TickStore',  create_store, store_mean_spread)
\ No newline at end of file
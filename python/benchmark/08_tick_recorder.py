@@ -0,0 +1,62 @@
+import logging
+import os
+import shutil
+import tempfile
+from datetime import datetime, timezone
+from time     import perf_counter
+from rmt      import Tick, TickRecorder, TickRecording
+
+################################################################################
+# Compares recording ticks by logging `str(tick)` to a file with recording them
+# with a `TickRecorder`, by time per tick and bytes per tick, then measures the
+# time taken by `TickRecording` to read one hour of a symbol out of the recording.
+################################################################################
+TICKS   = 500000
+SYMBOLS = ['EURUSD', 'GBPUSD', 'USDJPY', 'XAUUSD', 'US100']
+
+ticks = [
+    (SYMBOLS[i % len(SYMBOLS)],
+     Tick(datetime.fromtimestamp(1600000000 + i * 0.05, timezone.utc), 1.17001 + i * 1e-9, 1.17014 + i * 1e-9))
+    for i in range(TICKS)
+]
+
+directory = tempfile.mkdtemp()
+
+try:
+    log_path = os.path.join(directory, 'ticks.log')
+    handler  = logging.FileHandler(log_path)
+    logger   = logging.getLogger('ticks')
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+    start = perf_counter()
+
+    for symbol, tick in ticks:
+        logger.info('%s %s', symbol, tick)
+
+    handler.close()
+    log_time = perf_counter() - start
+
+    recording_path = os.path.join(directory, 'recording')
+    start = perf_counter()
+
+    with TickRecorder(recording_path) as recorder:
+        for symbol, tick in ticks:
+            recorder.append(symbol, tick)
+
+    record_time = perf_counter() - start
+    record_size = sum(os.path.getsize(os.path.join(recording_path, name)) for name in os.listdir(recording_path))
+
+    print('%-16s %12s %12s' % ('recording', 'us/tick', 'bytes/tick'))
+    print('%-16s %12.2f %12.1f' % ('str(tick) log', log_time / TICKS * 1e6, os.path.getsize(log_path) / TICKS))
+    print('%-16s %12.2f %12.1f' % ('TickRecorder', record_time / TICKS * 1e6, record_size / TICKS))
+
+    start     = perf_counter()
+    recording = TickRecording(recording_path)
+    window    = recording.read('XAUUSD', 1600010000, 1600013600)
+    read_time = perf_counter() - start
+
+    print('\nread 1 hour of XAUUSD (%s ticks): %.2f ms' % (len(window), read_time * 1e3))
+finally:
+    shutil.rmtree(directory)
\ No newline at end of file
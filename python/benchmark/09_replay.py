@@ -0,0 +1,71 @@
+from datetime import datetime, timezone
+from time     import perf_counter
+from rmt      import Strategy, Tick
+from rmt.exchanges.replay import ReplayExchange
+
+################################################################################
+# Measures how fast `ReplayExchange` feeds ticks through a `Strategy`, which
+# does no work of its own, and how long a month of ticks would then take.
+#
+# Ticks are generated on the fly, four symbols at 500 ms intervals each, which is
+# about 20 million ticks a month; a month of EURUSD alone is closer to 3 million.
+#
+# Also checks that a strategy which calls `stop()` from `on_tick()` halts the
+# replay at that tick, and that running again resumes it.
+################################################################################
+TICKS   = 1000000
+SYMBOLS = ['EURUSD', 'GBPUSD', 'USDJPY', 'XAUUSD']
+
+TICKS_PER_MONTH = len(SYMBOLS) * 2 * 86400 * 30
+
+def generate_ticks():
+    for i in range(TICKS):
+        timestamp = 1600000000 + (i // len(SYMBOLS)) * 0.5
+        bid       = 1.17001 + (i % 1000) * 1e-5
+
+        yield SYMBOLS[i % len(SYMBOLS)], Tick(datetime.fromtimestamp(timestamp, timezone.utc), bid, bid + 0.00013)
+
+class CountingStrategy(Strategy):
+    def __init__(self, exchange: ReplayExchange):
+        super().__init__(exchange)
+        self.ticks = 0
+
+    def on_tick(self, symbol: str, server_time: datetime, bid: float, ask: float):
+        self.ticks += 1
+
+def measure(name: str, ticks):
+    exchange = ReplayExchange(ticks)
+    exchange.subscribe_all()
+    strategy = CountingStrategy(exchange)
+
+    start   = perf_counter()
+    exchange.run()
+    elapsed = perf_counter() - start
+
+    print('%-28s %12.0f %16.1f' % (name, strategy.ticks / elapsed, TICKS_PER_MONTH / (strategy.ticks / elapsed)))
+
+print('%-28s %12s %16s' % ('source', 'ticks/s', 's/month (4 sym)'))
+
+# Generating ticks costs about as much as replaying them, so ticks are also
+# replayed from a list, as from a source which is faster than the replay.
+measure('generator', generate_ticks())
+measure('list', list(generate_ticks()))
+
+class StoppingStrategy(CountingStrategy):
+    def on_tick(self, symbol: str, server_time: datetime, bid: float, ask: float):
+        super().on_tick(symbol, server_time, bid, ask)
+
+        if self.ticks % 10 == 0:
+            self.exchange.stop()
+
+exchange = ReplayExchange(generate_ticks())
+exchange.subscribe_all()
+strategy = StoppingStrategy(exchange)
+
+exchange.run()
+assert strategy.ticks == 10 and not exchange.is_finished(), 'replay went on after stop(): %s ticks' % strategy.ticks
+
+exchange.run()
+assert strategy.ticks == 20, 'replay did not resume at the next tick: %s ticks' % strategy.ticks
+
+print('stop() from on_tick() halts the replay at that tick')
\ No newline at end of file
@@ -0,0 +1,52 @@
+from datetime import datetime, timezone
+from time     import perf_counter
+from rmt      import BarAggregator, Tick, Timeframe
+from rmt.exchanges.mt4 import MetaTrader4, StandInServer
+
+################################################################################
+# Compares the cost of building bars locally with `BarAggregator` with that of
+# fetching the last closed bar from the server on each bar close, as strategies
+# used to do, over the stand-in server with a simulated network latency.
+#
+# Ticks are of one symbol at 500 ms intervals, so an M1 bar closes every 120 ticks.
+################################################################################
+TICKS    = 200000
+REQUESTS = 200
+LATENCY  = 0.002
+
+ticks = [
+    Tick(datetime.fromtimestamp(1600000000 + i * 0.5, timezone.utc), 1.17001 + (i % 1000) * 1e-5, 1.17014)
+    for i in range(TICKS)
+]
+
+print('%-40s %12s %12s' % ('case', 'us/tick', 'us/bar'))
+
+for timeframes in ([Timeframe.M1], list(Timeframe)):
+    aggregator = BarAggregator(timeframes=timeframes)
+    closed     = []
+    aggregator.bar_closed.connect(lambda symbol, timeframe, bar: closed.append(bar))
+
+    start = perf_counter()
+
+    for tick in ticks:
+        aggregator.add('EURUSD', tick)
+
+    elapsed = perf_counter() - start
+    m1_bars = len(aggregator.bars('EURUSD', Timeframe.M1))
+
+    print('%-40s %12.2f %12.1f' % (
+        'aggregate (%d timeframes)' % len(timeframes), elapsed / TICKS * 1e6, elapsed / m1_bars * 1e6
+    ))
+
+with StandInServer(latency=LATENCY) as server:
+    exchange = MetaTrader4(req_port=server.req_port(), sub_port=server.sub_port(), binary_format=True)
+    end_time = datetime.fromtimestamp(1600000000, timezone.utc)
+
+    start = perf_counter()
+
+    for _ in range(REQUESTS):
+        exchange.get_history_bars('EURUSD', end_time, end_time, Timeframe.M1)
+
+    elapsed = perf_counter() - start
+
+    print('%-40s %12s %12.1f' % ('get_history_bars (%.0f ms latency)' % (LATENCY * 1e3), '-', elapsed / REQUESTS * 1e6))
\ No newline at end of file
@@ -0,0 +1,39 @@
+import shutil
+import tempfile
+from datetime import datetime, timedelta, timezone
+from time     import perf_counter
+from rmt      import Timeframe
+from rmt.exchanges.mt4 import MetaTrader4, StandInServer
+
+################################################################################
+# Measures the warm-up of a strategy which loads a week of M1 bars for several
+# symbols, without a bar cache, then with a cold cache and with a warm cache, as
+# after a restart, over the stand-in server with a simulated network latency.
+################################################################################
+SYMBOLS = ['EURUSD', 'GBPUSD', 'USDJPY', 'XAUUSD', 'US100']
+BARS    = 7 * 24 * 60
+LATENCY = 0.002
+
+directory = tempfile.mkdtemp()
+
+def warm_up(server: StandInServer, bar_cache):
+    exchange   = MetaTrader4(req_port=server.req_port(), sub_port=server.sub_port(), bar_cache=bar_cache,
+                             binary_format=True)
+    start_time = datetime.now(timezone.utc) - timedelta(minutes=BARS)
+
+    start = perf_counter()
+
+    for symbol in SYMBOLS:
+        exchange.get_history_bars(symbol, start_time, None, Timeframe.M1)
+
+    return perf_counter() - start, exchange.bar_cache()
+
+try:
+    with StandInServer(latency=LATENCY) as server:
+        print('%-16s %10s %10s' % ('cache', 'ms', 'hit ratio'))
+
+        for name, bar_cache in [('none', None), ('cold', directory), ('warm', directory)]:
+            elapsed, cache = warm_up(server, bar_cache)
+            print('%-16s %10.1f %10s' % (name, elapsed * 1e3, '-' if cache is None else '%.4f' % cache.hit_ratio()))
+finally:
+    shutil.rmtree(directory)
\ No newline at end of file
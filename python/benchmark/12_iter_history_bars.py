@@ -0,0 +1,77 @@
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from time     import perf_counter
+from rmt      import Timeframe
+from rmt.exchanges.mt4 import MetaTrader4, RetryPolicy, StandInServer
+
+################################################################################
+# Compares fetching a year of M1 bars in one request with iterating over them in
+# chunks, sequentially and with prefetching, over the stand-in server with a
+# simulated network latency. Chunks are consumed and dropped, as by a tool which
+# computes statistics over a long history.
+#
+# Peak memory is measured by tracemalloc in a separate run, as tracing slows
+# allocations down. The stand-in server runs in this process and builds bars in
+# Python, so it competes with the client for the GIL, and prefetching gains less
+# than with the Expert Server, whose work overlaps with the client's.
+#
+# A year of bars in one request takes the stand-in server longer than the default
+# timeout of history requests, much longer while memory is traced, so requests
+# are given a timeout of their own, and are not retried, since a retry would only
+# queue the same work again on the server.
+################################################################################
+BARS       = 365 * 24 * 60
+CHUNK_SIZE = 20000
+LATENCY    = 0.005
+POOL_SIZE  = 3
+TIMEOUT    = 600.0
+
+def fetch_all(exchange: MetaTrader4, start_time: datetime):
+    return len(exchange.get_history_bars('EURUSD', start_time, None, Timeframe.M1, TIMEOUT))
+
+def fetch_chunks(prefetch: int):
+    def fetch(exchange: MetaTrader4, start_time: datetime):
+        count = 0
+
+        for chunk in exchange.iter_history_bars('EURUSD', start_time, None, Timeframe.M1, CHUNK_SIZE, TIMEOUT, prefetch):
+            count += len(chunk)
+
+        return count
+
+    return fetch
+
+def first_bar_time(exchange: MetaTrader4, start_time: datetime, fetch) -> float:
+    start = perf_counter()
+
+    if fetch is fetch_all:
+        exchange.get_history_bars('EURUSD', start_time, None, Timeframe.M1, TIMEOUT)
+    else:
+        next(iter(exchange.iter_history_bars('EURUSD', start_time, None, Timeframe.M1, CHUNK_SIZE, TIMEOUT)))
+
+    return perf_counter() - start
+
+cases = [
+    ('one request',      fetch_all),
+    ('chunks',           fetch_chunks(0)),
+    ('chunks, prefetch', fetch_chunks(2))
+]
+
+with StandInServer(latency=LATENCY) as server:
+    exchange   = MetaTrader4(req_port=server.req_port(), sub_port=server.sub_port(), pool_size=POOL_SIZE,
+                             retry_policy=RetryPolicy(max_retries=0), binary_format=True)
+    start_time = datetime.now(timezone.utc) - timedelta(minutes=BARS)
+
+    print('%-20s %10s %12s %10s %12s' % ('case', 'bars', 'total ms', 'first ms', 'peak MiB'))
+
+    for name, fetch in cases:
+        start   = perf_counter()
+        count   = fetch(exchange, start_time)
+        elapsed = perf_counter() - start
+        first   = first_bar_time(exchange, start_time, fetch)
+
+        tracemalloc.start()
+        fetch(exchange, start_time)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print('%-20s %10d %12.1f %10.1f %12.1f' % (name, count, elapsed * 1e3, first * 1e3, peak / 2**20))
\ No newline at end of file
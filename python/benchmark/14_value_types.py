@@ -0,0 +1,75 @@
+import gc
+import tracemalloc
+from datetime import datetime, timezone
+from time     import perf_counter
+from rmt      import Tick, Bar, Order, Instrument, Side, OrderType, OrderStatus
+from rmt.bar  import _new_bar
+
+################################################################################
+# Measures the memory taken by `Tick`, `Bar`, `Order` and `Instrument` objects,
+# the time taken to create them, and the time taken by a full garbage collection
+# while they are alive, against classes which store the same attributes in a
+# `__dict__`, as these types did before they had `__slots__`.
+#
+# Arguments are shared between objects, so that only the objects themselves are
+# measured. Times are the best of a few runs.
+################################################################################
+COUNT  = 200000
+REPEAT = 3
+
+time = datetime.now(timezone.utc)
+
+cases = [
+    (Tick, (time, 1.17001, 1.17014)),
+    (Bar,  (time, 1.17001, 1.17101, 1.16901, 1.17051, 42)),
+    (Order, (
+        'EURUSD', Side.BUY, OrderType.MARKET_ORDER, 0.01, OrderStatus.FILLED, 1.17001, time,
+        None, None, 1.16, 1.18, None, 0, '', 0.0, 0.0, 0.0
+    )),
+    (Instrument, (
+        'EURUSD', 'Euro vs US Dollar', 'EUR', 'USD', 'EUR', 5, 0.00001, 0.00001,
+        100000.0, 0.01, 0.01, 100.0, 0, 0, 0
+    ))
+]
+
+def with_dict(cls: type) -> type:
+    """Returns a class whose instances store the attributes of `cls` in a `__dict__`."""
+
+    return type('Dict' + cls.__name__, (), {'__init__': cls.__init__})
+
+def create(factory, args: tuple) -> list:
+    return [factory(*args) for _ in range(COUNT)]
+
+def measure(factory, args: tuple):
+    elapsed    = None
+    gc_elapsed = None
+
+    for _ in range(REPEAT):
+        start   = perf_counter()
+        objects = create(factory, args)
+        elapsed = min(elapsed or float('inf'), perf_counter() - start)
+
+        start      = perf_counter()
+        gc.collect()
+        gc_elapsed = min(gc_elapsed or float('inf'), perf_counter() - start)
+
+        del objects
+
+    tracemalloc.start()
+    objects = create(factory, args)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del objects
+
+    return size / COUNT, elapsed / COUNT, gc_elapsed
+
+print('%-26s %10s %10s %10s' % ('type', 'bytes', 'ns/new', 'gc ms'))
+
+for cls, args in cases:
+    for name, factory in [(cls.__name__ + ' (__dict__)', with_dict(cls)), (cls.__name__, cls)]:
+        size, elapsed, gc_elapsed = measure(factory, args)
+        print('%-26s %10.1f %10.1f %10.1f' % (name, size, elapsed * 1e9, gc_elapsed * 1e3))
+
+size, elapsed, gc_elapsed = measure(_new_bar, cases[1][1])
+print('%-26s %10.1f %10.1f %10.1f' % ('Bar (decoder)', size, elapsed * 1e9, gc_elapsed * 1e3))
\ No newline at end of file
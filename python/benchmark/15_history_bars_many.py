@@ -0,0 +1,54 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from time     import perf_counter
+from rmt      import HistoryRequest, Timeframe
+from rmt.exchanges.mt4 import MetaTrader4, AsyncMetaTrader4, StandInServer
+
+################################################################################
+# Measures the warm-up of many symbols in several timeframes, 200 bars each, by
+# `get_history_bars_many()` over socket pools of increasing size, against the
+# stand-in server with a simulated network latency. One worker is the same as
+# calling `get_history_bars()` in a loop. The last row sends all requests at once
+# from `AsyncMetaTrader4`, over its single DEALER socket.
+################################################################################
+SYMBOLS    = ['SYM%03d' % i for i in range(100)]
+TIMEFRAMES = [Timeframe.M1, Timeframe.M15, Timeframe.H1]
+BARS       = 200
+LATENCY    = 0.01
+POOL_SIZES = [1, 2, 4, 8, 16]
+
+now      = datetime.now(timezone.utc)
+requests = [
+    HistoryRequest(symbol, start_time=now - timedelta(seconds=BARS * timeframe.seconds()), timeframe=timeframe)
+    for symbol in SYMBOLS
+    for timeframe in TIMEFRAMES
+]
+
+async def fetch_async(server: StandInServer) -> list:
+    async with AsyncMetaTrader4(req_port=server.req_port(), sub_port=server.sub_port(), binary_format=True) as exchange:
+        await exchange.uses_binary_format()
+
+        return [result async for result in exchange.get_history_bars_many(requests)]
+
+with StandInServer(latency=LATENCY) as server:
+    print('%d requests, %.0f ms latency' % (len(requests), LATENCY * 1e3))
+    print('%-10s %10s %12s %10s' % ('workers', 'ms', 'requests/s', 'failed'))
+
+    for pool_size in POOL_SIZES:
+        exchange = MetaTrader4(req_port=server.req_port(), sub_port=server.sub_port(), pool_size=pool_size,
+                               binary_format=True)
+        exchange.uses_binary_format()
+
+        start   = perf_counter()
+        results = list(exchange.get_history_bars_many(requests))
+        elapsed = perf_counter() - start
+        failed  = sum(1 for result in results if not result.succeeded())
+
+        print('%-10d %10.1f %12.1f %10d' % (pool_size, elapsed * 1e3, len(requests) / elapsed, failed))
+
+    start   = perf_counter()
+    results = asyncio.run(fetch_async(server))
+    elapsed = perf_counter() - start
+    failed  = sum(1 for result in results if not result.succeeded())
+
+    print('%-10s %10.1f %12.1f %10d' % ('async', elapsed * 1e3, len(requests) / elapsed, failed))
\ No newline at end of file
@@ -0,0 +1,47 @@
+import os
+import re
+import runpy
+import sys
+import traceback
+
+################################################################################
+# Runs the benchmarks from the `python` directory, which puts `rmt` on the path:
+#
+#   python -m benchmark                    runs all benchmarks, in order
+#   python -m benchmark 02 replay          runs those whose name contains 02 or replay
+#   python -m benchmark.02_json_codec      runs a single benchmark
+#
+# Exits with status 1 if any benchmark fails, e.g. if benchmark 06 finds that an
+# import loads a module it should not.
+################################################################################
+_BENCHMARK_PATTERN = re.compile(r'^(\d\d_\w+)\.py$')
+
+directory = os.path.dirname(os.path.abspath(__file__))
+names     = sorted(
+    match.group(1)
+    for match in map(_BENCHMARK_PATTERN.match, os.listdir(directory))
+    if match is not None
+)
+
+if len(sys.argv) > 1:
+    names = [name for name in names if any(arg in name for arg in sys.argv[1:])]
+
+failed = []
+
+for name in names:
+    print('=== %s' % name, flush=True)
+
+    try:
+        runpy.run_module('%s.%s' % (__package__, name), run_name='__main__')
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            failed.append(name)
+    except Exception:
+        traceback.print_exc()
+        failed.append(name)
+
+    print(flush=True)
+
+if failed:
+    print('failed: %s' % ', '.join(failed))
+    sys.exit(1)
\ No newline at end of file
@@ -1,3 +1,5 @@
+import importlib
+from typing      import Any, List
 from .           import error
 from .           import jsonutil
 from .tick       import Tick
@@ -5,6 +7,36 @@ from .instrument import Instrument
 from .order      import Side, OrderType, OrderStatus, Order
 from .bar        import Bar
 from .timeframe  import Timeframe
-from .exchange   import Exchange
-from .strategy   import Strategy
-from .           import exchanges
\ No newline at end of file
+from .signals    import Signal, BoundSignal
+from .history_request import HistoryRequest, HistoryResult
+from .exchange        import Exchange
+
+# Imported on first access, so that tools which only use the core types above do
+# not pay for the exchange bindings and their dependencies, such as zmq or NumPy,
+# nor for the strategy and bar building layers.
+_lazy_submodules = {'exchanges'}
+
+_lazy_attributes = {
+    'BarAggregator':  'bar_aggregator',
+    'BarCache':       'bar_cache',
+    'BarDrift':       'bar_aggregator',
+    'BarSeries':      'bar_series',
+    'QtSignalBridge': 'qt_signal_bridge',
+    'Strategy':       'strategy',
+    'TickStore':      'tick_store',
+    'TickWindow':     'tick_store',
+    'TickRecorder':   'tick_recorder',
+    'TickRecording':  'tick_recorder'
+}
+
+def __getattr__(name: str) -> Any:
+    if name in _lazy_attributes:
+        return getattr(importlib.import_module('.' + _lazy_attributes[name], __name__), name)
+
+    if name in _lazy_submodules:
+        return importlib.import_module('.' + name, __name__)
+
+    raise AttributeError("module '%s' has no attribute '%s'" % (__name__, name))
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_lazy_attributes) | _lazy_submodules)
\ No newline at end of file
@@ -3,6 +3,15 @@ from typing   import Optional
 from rmt      import Side
 
 class Bar:
+    """Stores the prices and volume of an instrument over a period of time.
+
+    The fields of a bar are read-only properties, and bars have no `__dict__`, so
+    that millions of them may be held at little cost; see also `BarSeries`.
+    Nothing stops code from assigning the underlying slots, which must not be done.
+    """
+
+    __slots__ = ('_time', '_open', '_high', '_low', '_close', '_volume')
+
     def __init__(self,
                  time:   datetime,
                  open:   float,
@@ -60,4 +69,21 @@ class Bar:
         return (
             'Bar(%s, O: %s, H: %s, L: %s, C: %s, V: %s)'
             % (self.time.strftime('%Y-%m-%d %H:%M'), self.open, self.high, self.low, self.close, self.volume)
-        )
\ No newline at end of file
+        )
+
+def _new_bar(time: datetime, open: float, high: float, low: float, close: float, volume: int) -> Bar:
+    """Creates a bar from values which are known to be of the right types, such as
+    those of a decoder, without the conversions done by `Bar()`."""
+
+    bar = _object_new(Bar)
+
+    bar._time   = time
+    bar._open   = open
+    bar._high   = high
+    bar._low    = low
+    bar._close  = close
+    bar._volume = volume
+
+    return bar
+
+_object_new = object.__new__
\ No newline at end of file
@@ -0,0 +1,460 @@
+import logging
+from bisect      import bisect_left, bisect_right
+from datetime    import datetime, timezone
+from time        import monotonic
+from typing      import Dict, Iterable, List, Optional, Tuple
+from rmt         import Exchange, Tick, Bar, Timeframe, Signal
+
+class BarDrift:
+    """Difference between a bar built from ticks and the bar of the exchange server."""
+
+    def __init__(self,
+                 symbol:       str,
+                 timeframe:    Timeframe,
+                 time:         datetime,
+                 local_bar:    Optional[Bar],
+                 server_bar:   Optional[Bar],
+                 fields:       List[str]
+    ):
+        self._symbol     = symbol
+        self._timeframe  = timeframe
+        self._time       = time
+        self._local_bar  = local_bar
+        self._server_bar = server_bar
+        self._fields     = fields
+
+    def symbol(self) -> str:
+        return self._symbol
+
+    def timeframe(self) -> Timeframe:
+        return self._timeframe
+
+    def time(self) -> datetime:
+        return self._time
+
+    def local_bar(self) -> Optional[Bar]:
+        """Bar built from ticks, or `None` if no tick of that bar was received."""
+
+        return self._local_bar
+
+    def server_bar(self) -> Optional[Bar]:
+        """Bar of the exchange server, or `None` if the server has no such bar."""
+
+        return self._server_bar
+
+    def fields(self) -> List[str]:
+        """Names of the fields which differ, among `open`, `high`, `low`, `close` and
+        `volume`, or `['bar']` if either bar is missing."""
+
+        return self._fields
+
+    def __str__(self) -> str:
+        return 'BarDrift(%s %s %s, fields: %s, local: %s, server: %s)' % (
+            self._symbol, self._timeframe.value, self._time.strftime('%Y-%m-%d %H:%M'),
+            ', '.join(self._fields), self._local_bar, self._server_bar
+        )
+
+class _BarSeries:
+    """Closed bars and current bar of a symbol in a timeframe."""
+
+    def __init__(self, timeframe: Timeframe, history: Optional[int]):
+        self.timeframe = timeframe
+        self.history   = history
+
+        # Up to twice `history` bars are held, so that old bars are dropped in bulk.
+        self.bars:      List[Bar] = []
+        self.bar_times: List[int] = []
+
+        # Current bar, which is open until a tick of a later bar is received.
+        self.start: Optional[int] = None
+        self.end    = 0
+        self.open   = 0.0
+        self.high   = 0.0
+        self.low    = 0.0
+        self.close  = 0.0
+        self.volume = 0
+
+    def current_bar(self) -> Optional[Bar]:
+        if self.start is None:
+            return None
+
+        return Bar(datetime.fromtimestamp(self.start, timezone.utc), self.open, self.high, self.low, self.close, self.volume)
+
+    def set_current_bar(self, bar: Bar):
+        self.start  = int(bar.time.timestamp())
+        self.end    = self.timeframe.next_bar_start(self.start)
+        self.open   = bar.open
+        self.high   = bar.high
+        self.low    = bar.low
+        self.close  = bar.close
+        self.volume = bar.volume
+
+    def add_closed_bar(self, bar: Bar):
+        self.bars.append(bar)
+        self.bar_times.append(int(bar.time.timestamp()))
+
+        if self.history is not None and len(self.bars) > 2 * self.history:
+            del self.bars[:len(self.bars) - self.history]
+            del self.bar_times[:len(self.bar_times) - self.history]
+
+    def first(self) -> int:
+        """Index of the first bar kept."""
+
+        return 0 if self.history is None else max(len(self.bars) - self.history, 0)
+
+    def closed_bars(self, start_time: Optional[datetime], end_time: Optional[datetime]) -> List[Bar]:
+        first = self.first()
+        start = first               if start_time is None else bisect_left(self.bar_times,  start_time.timestamp(), first)
+        end   = len(self.bar_times) if end_time   is None else bisect_right(self.bar_times, end_time.timestamp(),  first)
+
+        return self.bars[start:end]
+
+class BarAggregator:
+    """Builds the bars of every timeframe from the ticks of an exchange.
+
+    Description
+    -----------
+    Bars are built from bid prices, with the number of ticks as volume, as MT4 does.
+    A bar is closed by the first tick of a later bar, at which point `bar_closed`
+    is emitted with the symbol, the timeframe, and the closed bar. As no tick is
+    received while a market is closed, no bar is built for that time either.
+
+    `seed()` fetches the current bar of a symbol in each timeframe from the exchange,
+    so that bars opened before the first tick is received are complete, and up to
+    `history` closed bars before it. Until a symbol is seeded, its first bars start
+    at its first tick. Seeding costs two requests per timeframe, once. If `seed`
+    is true, the `symbols` given are seeded when the aggregator is created.
+
+    Bars may differ from those of the server if ticks are missed, e.g. by conflation
+    or by dropping from a full buffer, or if the server amends its history. `reconcile()`
+    compares the bars closed since the previous reconciliation with those of the
+    server, logs and returns any drift, and replaces local bars by server bars. Each
+    reconciliation costs one request per timeframe and symbol, so it's never done
+    while a tick is being added. Instead, if `reconcile_interval` is given, the
+    caller may call `reconcile_if_due()` between rounds of events, e.g. after each
+    `Exchange.run_until()` or from a timer, which reconciles once that many seconds
+    have elapsed since the previous reconciliation.
+
+    The aggregator handles the ticks emitted by `tick_received` of the exchange it
+    is attached to, of all symbols or of `symbols` only. Ticks may also be added
+    with `add()` by one thread at a time.
+    """
+
+    bar_closed = Signal(str, Timeframe, Bar)
+    """Event emitted when a bar closes, with the symbol, the timeframe, and the bar.
+    A callback may be connected to the bars of one symbol by passing it as key."""
+
+    def __init__(self,
+                 exchange:           Optional[Exchange]            = None,
+                 symbols:            Optional[Iterable[str]]       = None,
+                 timeframes:         Optional[Iterable[Timeframe]] = None,
+                 history:            Optional[int]                 = 1000,
+                 seed:               bool                          = False,
+                 reconcile_interval: Optional[float]               = None,
+                 tolerance:          float                         = 1e-8
+    ):
+        if history is not None and history < 0:
+            raise ValueError('history must not be negative (got: %s)' % history)
+
+        self._timeframes = list(Timeframe) if timeframes is None else list(timeframes)
+        self._history    = history
+        self._tolerance  = tolerance
+        self._logger     = logging.getLogger(BarAggregator.__name__)
+
+        self._series: Dict[str, List[_BarSeries]] = {}
+
+        # Time of the last bar reconciled, per symbol and timeframe.
+        self._reconciled_times: Dict[Tuple[str, Timeframe], int] = {}
+        self._reconcile_interval = reconcile_interval
+        self._last_reconciliation = monotonic()
+
+        self._exchange: Optional[Exchange] = None
+        self._symbols:  Optional[List[str]] = None
+
+        if exchange is not None:
+            self.attach(exchange, symbols)
+
+            if seed and self._symbols is not None:
+                for symbol in self._symbols:
+                    self.seed(symbol)
+
+    def timeframes(self) -> List[Timeframe]:
+        return self._timeframes.copy()
+
+    def symbols(self) -> List[str]:
+        return sorted(self._series)
+
+    def attach(self, exchange: Exchange, symbols: Optional[Iterable[str]] = None):
+        """Builds bars from the ticks of `symbols`, or of all symbols, received by `exchange`."""
+
+        self.detach()
+
+        self._exchange = exchange
+        self._symbols  = None if symbols is None else list(symbols)
+
+        if self._symbols is None:
+            exchange.tick_received.connect(self.add)
+        else:
+            for symbol in self._symbols:
+                exchange.tick_received.connect(self.add, symbol)
+
+    def detach(self):
+        if self._exchange is None:
+            return
+
+        if self._symbols is None:
+            self._exchange.tick_received.disconnect(self.add)
+        else:
+            for symbol in self._symbols:
+                self._exchange.tick_received.disconnect(self.add, symbol)
+
+        self._exchange = None
+        self._symbols  = None
+
+    def seed(self, symbol: str, exchange: Optional[Exchange] = None, tick: Optional[Tick] = None):
+        """Fetches the current bar and recent closed bars of a symbol in each timeframe.
+
+        The bars of every timeframe are fetched before any is replaced, so if a request
+        fails, the bars of the symbol are left as they were.
+
+        If `tick` is given, it's a tick just received, which the current bars of the
+        server already count, so it's only added to a timeframe whose current bar
+        of the server closed before it. It must then not be passed to `add()`.
+
+        Raises
+        ------
+        RequestError
+            If a request could not be delivered to, or understood by the exchange.
+        """
+
+        exchange = self._exchange_or(exchange)
+        fetched  = []
+
+        for series in self._series_of(symbol):
+            current = exchange.get_current_bar(symbol, series.timeframe)
+            start   = int(current.time.timestamp())
+            first   = start
+
+            for _ in range(self._history or 0):
+                first = series.timeframe.bar_start(first - 1)
+
+            closed_bars = []
+
+            if first < start:
+                closed_bars = exchange.get_history_bars(
+                    symbol,
+                    datetime.fromtimestamp(first, timezone.utc),
+                    datetime.fromtimestamp(start - 1, timezone.utc),
+                    series.timeframe
+                )
+
+            fetched.append((series, current, closed_bars))
+
+        for series, current, closed_bars in fetched:
+            start = int(current.time.timestamp())
+
+            series.bars.clear()
+            series.bar_times.clear()
+
+            for bar in closed_bars:
+                series.add_closed_bar(bar)
+
+            series.set_current_bar(current)
+
+            # Seeded bars are the server's own, so need no reconciliation.
+            self._reconciled_times[(symbol, series.timeframe)] = start - 1
+
+            if tick is not None and tick.server_time.timestamp() >= series.end:
+                bar_time = datetime.fromtimestamp(series.timeframe.bar_start(tick.server_time.timestamp()), timezone.utc)
+
+                series.add_closed_bar(current)
+                series.set_current_bar(Bar(bar_time, tick.bid, tick.bid, tick.bid, tick.bid, 1))
+
+                self.bar_closed.emit(symbol, series.timeframe, current)
+
+    def add(self, symbol: str, tick: Tick):
+        timestamp = tick.server_time.timestamp()
+        price     = tick.bid
+        closed    = None
+
+        for series in self._series_of(symbol):
+            if timestamp >= series.end or series.start is None:
+                if series.start is not None:
+                    bar = series.current_bar()
+                    series.add_closed_bar(bar)
+
+                    if closed is None:
+                        closed = []
+
+                    closed.append((series.timeframe, bar))
+
+                series.start  = series.timeframe.bar_start(timestamp)
+                series.end    = series.timeframe.next_bar_start(series.start)
+                series.open   = price
+                series.high   = price
+                series.low    = price
+                series.close  = price
+                series.volume = 1
+
+                continue
+
+            if price > series.high:
+                series.high = price
+            elif price < series.low:
+                series.low = price
+
+            series.close   = price
+            series.volume += 1
+
+        if closed is not None:
+            for timeframe, bar in closed:
+                self.bar_closed.emit(symbol, timeframe, bar)
+
+    def bars(self,
+             symbol:     str,
+             timeframe:  Timeframe,
+             start_time: Optional[datetime] = None,
+             end_time:   Optional[datetime] = None
+    ) -> List[Bar]:
+        """Returns the closed bars of a symbol from `start_time` to `end_time`, inclusive,
+        of which at most `history` are kept."""
+
+        series = self._find_series(symbol, timeframe)
+
+        if series is None:
+            return []
+
+        return series.closed_bars(start_time, end_time)
+
+    def current_bar(self, symbol: str, timeframe: Timeframe) -> Optional[Bar]:
+        """Returns the bar of a symbol which is still open, or `None` if no tick of the
+        symbol was received."""
+
+        series = self._find_series(symbol, timeframe)
+
+        if series is None:
+            return None
+
+        return series.current_bar()
+
+    def reconcile(self,
+                  symbols:    Optional[Iterable[str]]       = None,
+                  timeframes: Optional[Iterable[Timeframe]] = None,
+                  exchange:   Optional[Exchange]            = None
+    ) -> List[BarDrift]:
+        """Compares the bars closed since the previous reconciliation with the bars of
+        the server, and replaces local bars by those of the server.
+
+        Returns
+        -------
+        List[BarDrift]
+            Bars which differ. Each is also logged as a warning.
+        """
+
+        exchange   = self._exchange_or(exchange)
+        symbols    = self.symbols() if symbols is None else list(symbols)
+        timeframes = None if timeframes is None else set(timeframes)
+        drifts     = []
+
+        self._last_reconciliation = monotonic()
+
+        for symbol in symbols:
+            for series in self._series.get(symbol, []):
+                if timeframes is None or series.timeframe in timeframes:
+                    drifts.extend(self._reconcile_series(exchange, symbol, series))
+
+        for drift in drifts:
+            self._logger.warning('bar drift: %s', drift)
+
+        return drifts
+
+    def reconcile_if_due(self, exchange: Optional[Exchange] = None) -> List[BarDrift]:
+        """Reconciles all bars if `reconcile_interval` seconds elapsed since the previous
+        reconciliation, otherwise returns no drift. See `reconcile()`."""
+
+        if self._reconcile_interval is None or monotonic() - self._last_reconciliation < self._reconcile_interval:
+            return []
+
+        return self.reconcile(exchange=exchange)
+
+    #===============================================================================
+    # Internals
+    #===============================================================================
+    def _exchange_or(self, exchange: Optional[Exchange]) -> Exchange:
+        exchange = exchange or self._exchange
+
+        if exchange is None:
+            raise ValueError('bar aggregator is not attached to an exchange')
+
+        return exchange
+
+    def _series_of(self, symbol: str) -> List[_BarSeries]:
+        series = self._series.get(symbol)
+
+        if series is None:
+            series = [_BarSeries(timeframe, self._history) for timeframe in self._timeframes]
+            self._series[symbol] = series
+
+        return series
+
+    def _find_series(self, symbol: str, timeframe: Timeframe) -> Optional[_BarSeries]:
+        for series in self._series.get(symbol, []):
+            if series.timeframe == timeframe:
+                return series
+
+        return None
+
+    def _reconcile_series(self, exchange: Exchange, symbol: str, series: _BarSeries) -> List[BarDrift]:
+        timeframe  = series.timeframe
+        reconciled = self._reconciled_times.get((symbol, timeframe))
+        bars       = series.bars
+        times      = series.bar_times
+        first      = series.first()
+
+        if reconciled is not None:
+            first = bisect_right(times, reconciled, first)
+
+        if first == len(times):
+            return []
+
+        start_time = datetime.fromtimestamp(times[first], timezone.utc)
+        end_time   = datetime.fromtimestamp(times[-1],    timezone.utc)
+
+        server_bars = {
+            int(bar.time.timestamp()): bar
+            for bar in exchange.get_history_bars(symbol, start_time, end_time, timeframe)
+        }
+
+        drifts = []
+
+        for i in range(first, len(times)):
+            server_bar = server_bars.pop(times[i], None)
+            fields     = self._differing_fields(bars[i], server_bar)
+
+            if fields:
+                drifts.append(BarDrift(symbol, timeframe, bars[i].time, bars[i], server_bar, fields))
+
+            if server_bar is not None:
+                bars[i] = server_bar
+
+        # Bars of the server in which no tick was received here.
+        for time, server_bar in sorted(server_bars.items()):
+            drifts.append(BarDrift(symbol, timeframe, server_bar.time, None, server_bar, ['bar']))
+
+        self._reconciled_times[(symbol, timeframe)] = times[-1]
+
+        return drifts
+
+    def _differing_fields(self, local_bar: Bar, server_bar: Optional[Bar]) -> List[str]:
+        if server_bar is None:
+            return ['bar']
+
+        fields = [
+            name for name in ('open', 'high', 'low', 'close')
+            if abs(getattr(local_bar, name) - getattr(server_bar, name)) > self._tolerance
+        ]
+
+        if local_bar.volume != server_bar.volume:
+            fields.append('volume')
+
+        return fields
\ No newline at end of file
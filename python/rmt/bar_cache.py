@@ -0,0 +1,255 @@
+import os
+import logging
+import threading
+import numpy as np
+from datetime     import datetime, timezone
+from typing       import Callable, Dict, Optional, Tuple
+from urllib.parse import quote
+from rmt          import Timeframe
+from .bar_series  import BAR_DTYPE, BarSeries
+
+_HEADER_DTYPE = np.dtype([
+    ('magic', 'S8'),
+    ('start', '<i8'),
+    ('end',   '<i8')
+])
+
+_MAGIC = b'RMTBARS1'
+
+BarFetcher = Callable[[datetime, Optional[datetime]], BarSeries]
+"""Function fetching the bars from a start time to an end time, inclusive, or up
+to the last bar if the end time is `None`, from the exchange server."""
+
+class BarCache:
+    """Stores history bars on disk, so that only bars not yet stored are fetched.
+
+    Description
+    -----------
+    Bars of each symbol and timeframe are stored in a file of their own, made of a
+    header and of bars laid out as `BAR_DTYPE`, in order of time. The header holds
+    the time range covered by the file, such that every bar of the server within
+    that range is in the file. The file is memory-mapped, so only the bars requested
+    are read from disk.
+
+    When bars are requested, only the part of their range before or after the range
+    covered is fetched from the server, and merged into the file. The last bar
+    fetched is never stored, as it may still be open, so a request up to the current
+    time always fetches at least that bar. A request of older bars which does not
+    overlap the range covered is passed on to the server, whereas a request of newer
+    bars which does not overlap it replaces the file, so that the range covered is
+    always contiguous. A request without a start time is always passed on.
+
+    The cache may be shared by threads, but not by processes.
+    """
+
+    def __init__(self, directory: str):
+        os.makedirs(directory, exist_ok=True)
+
+        self._directory = directory
+        self._logger    = logging.getLogger(BarCache.__name__)
+        self._lock      = threading.Lock()
+        self._files: Dict[Tuple[str, Timeframe], _BarFile] = {}
+
+        self._hit_count  = 0
+        self._miss_count = 0
+
+    def directory(self) -> str:
+        return self._directory
+
+    def hit_count(self) -> int:
+        """Number of bars read from disk."""
+
+        return self._hit_count
+
+    def miss_count(self) -> int:
+        """Number of bars fetched from the server."""
+
+        return self._miss_count
+
+    def hit_ratio(self) -> float:
+        """Ratio of bars read from disk to all bars returned, or 0 if none was returned."""
+
+        total = self._hit_count + self._miss_count
+
+        return self._hit_count / total if total != 0 else 0.0
+
+    def coverage(self, symbol: str, timeframe: Timeframe) -> Optional[Tuple[datetime, datetime]]:
+        """Returns the time range covered by the bars stored of a symbol, inclusive,
+        or `None` if no bar is stored."""
+
+        bar_file = self._file(symbol, timeframe)
+
+        if bar_file.start is None:
+            return None
+
+        return datetime.fromtimestamp(bar_file.start, timezone.utc), datetime.fromtimestamp(bar_file.end, timezone.utc)
+
+    def get_history_bar_series(self,
+                               symbol:     str,
+                               start_time: Optional[datetime],
+                               end_time:   Optional[datetime],
+                               timeframe:  Timeframe,
+                               fetch:      BarFetcher
+    ) -> BarSeries:
+        """Returns the bars of a symbol from `start_time` to `end_time`, inclusive,
+        read from disk or fetched by `fetch` and stored.
+
+        Raises
+        ------
+        RequestError
+            If `fetch` raises it.
+        """
+
+        if start_time is None:
+            return self._count(0, fetch(start_time, end_time))
+
+        start    = int(start_time.timestamp())
+        end      = None if end_time is None else int(end_time.timestamp())
+        bar_file = self._file(symbol, timeframe)
+
+        with bar_file.lock:
+            if bar_file.start is not None and end is not None and end < bar_file.start:
+                return self._count(0, fetch(start_time, end_time))
+
+            if bar_file.start is None or start > bar_file.end + 1:
+                records = fetch(start_time, end_time).records()
+
+                if len(records) != 0:
+                    bar_file.write(records[:-1], start, int(records['time'][-1]) - 1)
+
+                return self._count(0, BarSeries(records))
+
+            fetched = 0
+
+            if start < bar_file.start:
+                head = fetch(start_time, _time(bar_file.start - 1)).records()
+                head = head[head['time'] < bar_file.start]
+
+                bar_file.write(np.concatenate((head, bar_file.bars)), start, bar_file.end)
+                fetched += len(head)
+
+            last_bar = None
+
+            if end is None or end > bar_file.end:
+                tail = fetch(_time(bar_file.end + 1), end_time).records()
+                tail = tail[tail['time'] > bar_file.end]
+
+                if len(tail) != 0:
+                    last_bar = tail[-1:]
+                    bar_file.append(tail[:-1], int(last_bar['time'][0]) - 1)
+                    fetched += len(tail)
+
+            records = bar_file.read(start, end)
+
+            if last_bar is not None:
+                records = np.concatenate((records, last_bar))
+
+            bars = BarSeries(records)
+
+            self._logger.debug('%s %s: %s bars cached, %s fetched', symbol, timeframe.value, len(bars) - fetched, fetched)
+
+            return self._count(len(bars) - fetched, bars)
+
+    #===============================================================================
+    # Internals
+    #===============================================================================
+    def _file(self, symbol: str, timeframe: Timeframe) -> '_BarFile':
+        with self._lock:
+            bar_file = self._files.get((symbol, timeframe))
+
+            if bar_file is None:
+                name     = '%s-%s.bars' % (quote(symbol, safe=''), timeframe.value)
+                bar_file = _BarFile(os.path.join(self._directory, name))
+
+                self._files[(symbol, timeframe)] = bar_file
+
+            return bar_file
+
+    def _count(self, hit_count: int, bars: BarSeries) -> BarSeries:
+        with self._lock:
+            self._hit_count  += hit_count
+            self._miss_count += len(bars) - hit_count
+
+        return bars
+
+class _BarFile:
+    def __init__(self, path: str):
+        self.path  = path
+        self.lock  = threading.Lock()
+        self.start: Optional[int] = None
+        self.end:   Optional[int] = None
+        self.bars  = np.empty(0, BAR_DTYPE)
+
+        self._load()
+
+    def read(self, start: int, end: Optional[int]) -> np.ndarray:
+        times = self.bars['time']
+        lo    = int(np.searchsorted(times, start, 'left'))
+        hi    = len(times) if end is None else int(np.searchsorted(times, end, 'right'))
+
+        # Copied, so that the file may be replaced while the bars are in use.
+        return np.array(self.bars[lo:hi])
+
+    def write(self, records: np.ndarray, start: int, end: int):
+        """Replaces the file with `records`, covering `start` to `end`."""
+
+        records = np.ascontiguousarray(records)
+
+        # Written under a temporary name, lest a partial file be taken for a valid one.
+        with open(self.path + '.tmp', 'wb') as file:
+            file.write(_header(start, end))
+            file.write(records.tobytes())
+
+        self.bars = np.empty(0, BAR_DTYPE)
+        os.replace(self.path + '.tmp', self.path)
+
+        self._load()
+
+    def append(self, records: np.ndarray, end: int):
+        """Appends `records` to the file, which then covers up to `end`."""
+
+        count = len(self.bars)
+        self.bars = np.empty(0, BAR_DTYPE)
+
+        with open(self.path, 'r+b') as file:
+            # Bars beyond the range covered, e.g. appended by a killed process, are dropped.
+            file.truncate(_HEADER_DTYPE.itemsize + count * BAR_DTYPE.itemsize)
+            file.seek(0, os.SEEK_END)
+            file.write(records.tobytes())
+            file.flush()
+
+            # The header is written last, so that the range covered is never ahead of the bars.
+            file.seek(0)
+            file.write(_header(self.start, end))
+
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+
+        header = np.fromfile(self.path, _HEADER_DTYPE, 1)
+
+        if len(header) == 0 or header['magic'][0] != _MAGIC:
+            logging.getLogger(BarCache.__name__).warning('Ignoring file which is not a bar cache: %s', self.path)
+            return
+
+        self.start = int(header['start'][0])
+        self.end   = int(header['end'][0])
+
+        count = (os.path.getsize(self.path) - _HEADER_DTYPE.itemsize) // BAR_DTYPE.itemsize
+
+        if count == 0:
+            self.bars = np.empty(0, BAR_DTYPE)
+            return
+
+        bars  = np.memmap(self.path, BAR_DTYPE, 'r', offset=_HEADER_DTYPE.itemsize, shape=(count,))
+        count = int(np.searchsorted(bars['time'], self.end, 'right'))
+
+        self.bars = bars[:count]
+
+def _header(start: int, end: int) -> bytes:
+    return np.array([(_MAGIC, start, end)], _HEADER_DTYPE).tobytes()
+
+def _time(timestamp: int) -> datetime:
+    return datetime.fromtimestamp(timestamp, timezone.utc)
\ No newline at end of file
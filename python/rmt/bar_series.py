@@ -0,0 +1,160 @@
+import numpy as np
+from datetime import datetime, timezone
+from typing   import Iterable, Iterator, List, Optional, Sequence, Union, overload
+from rmt      import Bar
+from rmt.bar  import _new_bar
+
+BAR_DTYPE = np.dtype([
+    ('time',   '<i8'),
+    ('open',   '<f8'),
+    ('high',   '<f8'),
+    ('low',    '<f8'),
+    ('close',  '<f8'),
+    ('volume', '<i8')
+])
+"""Layout of a bar, 48 bytes without padding, as in the binary format of the Expert
+Server: open time as a POSIX timestamp in seconds, prices, and volume."""
+
+class BarSeries:
+    """Bars of a symbol in a timeframe, held in columns rather than as `Bar` objects.
+
+    Description
+    -----------
+    A series holds its bars in a structured array laid out as `BAR_DTYPE`, about
+    48 bytes per bar. Columns are returned as arrays, so that bars are processed
+    with vectorized operations, whereas a `Bar` is only created when the series
+    is indexed or iterated over. Slicing a series returns a series sharing the
+    same memory.
+
+    A series built by `from_bytes()` shares memory with the bytes it's built from,
+    and is read-only.
+    """
+
+    def __init__(self, records: Optional[np.ndarray] = None):
+        if records is None:
+            records = np.empty(0, BAR_DTYPE)
+        elif records.dtype != BAR_DTYPE:
+            raise ValueError('expected records of dtype %s (got: %s)' % (BAR_DTYPE, records.dtype))
+
+        self._records = records
+
+    @staticmethod
+    def from_bytes(data: bytes) -> 'BarSeries':
+        """Builds a series from bars in the binary format of the Expert Server, without copying.
+
+        Raises
+        ------
+        ValueError
+            If the length of `data` is not a multiple of the size of a bar.
+        """
+
+        if len(data) % BAR_DTYPE.itemsize != 0:
+            raise ValueError('expected multiple of %s bytes of binary bars (got: %s)' % (BAR_DTYPE.itemsize, len(data)))
+
+        return BarSeries(np.frombuffer(data, BAR_DTYPE))
+
+    @staticmethod
+    def from_tuples(bars: Sequence[tuple]) -> 'BarSeries':
+        """Builds a series from tuples of time as a POSIX timestamp, open, high, low,
+        close, and volume."""
+
+        return BarSeries(np.array(bars, BAR_DTYPE))
+
+    @staticmethod
+    def from_bars(bars: Iterable[Bar]) -> 'BarSeries':
+        return BarSeries.from_tuples([
+            (int(bar.time.timestamp()), bar.open, bar.high, bar.low, bar.close, bar.volume)
+            for bar in bars
+        ])
+
+    def records(self) -> np.ndarray:
+        """Structured array of the bars, laid out as `BAR_DTYPE`."""
+
+        return self._records
+
+    def times(self) -> np.ndarray:
+        """Open times, as POSIX timestamps in seconds."""
+
+        return self._records['time']
+
+    def opens(self) -> np.ndarray:
+        return self._records['open']
+
+    def highs(self) -> np.ndarray:
+        return self._records['high']
+
+    def lows(self) -> np.ndarray:
+        return self._records['low']
+
+    def closes(self) -> np.ndarray:
+        return self._records['close']
+
+    def volumes(self) -> np.ndarray:
+        return self._records['volume']
+
+    def sides(self) -> np.ndarray:
+        """Side of each bar, as in `Bar.side()`: 1 for `Side.BUY`, -1 for `Side.SELL`,
+        and 0 for `None`."""
+
+        return np.sign(self.closes() - self.opens()).astype(np.int8)
+
+    def is_bullish(self) -> np.ndarray:
+        """Whether each bar is bullish, as in `Bar.is_bullish()`."""
+
+        return self.closes() > self.opens()
+
+    def is_bearish(self) -> np.ndarray:
+        """Whether each bar is bearish, as in `Bar.is_bearish()`."""
+
+        return self.closes() < self.opens()
+
+    def bar(self, index: int) -> Bar:
+        time, o, h, l, c, v = self._records[index].tolist()
+
+        return _new_bar(datetime.fromtimestamp(time, timezone.utc), o, h, l, c, v)
+
+    def between(self, start_time: Optional[datetime] = None, end_time: Optional[datetime] = None) -> 'BarSeries':
+        """Returns the bars from `start_time` to `end_time`, inclusive, of a series
+        in order of time."""
+
+        times = self.times()
+        start = 0          if start_time is None else int(np.searchsorted(times, start_time.timestamp(), 'left'))
+        end   = len(times) if end_time   is None else int(np.searchsorted(times, end_time.timestamp(),   'right'))
+
+        return BarSeries(self._records[start:end])
+
+    def to_list(self) -> List[Bar]:
+        return list(self)
+
+    @overload
+    def __getitem__(self, index: int) -> Bar: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> 'BarSeries': ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Bar, 'BarSeries']:
+        if isinstance(index, slice):
+            return BarSeries(self._records[index])
+
+        return self.bar(index)
+
+    def __iter__(self) -> Iterator[Bar]:
+        # Columns are converted at once, since `tolist()` is much faster than reading items one by one.
+        for time, o, h, l, c, v in zip(self.times().tolist(),
+                                       self.opens().tolist(),
+                                       self.highs().tolist(),
+                                       self.lows().tolist(),
+                                       self.closes().tolist(),
+                                       self.volumes().tolist()):
+            yield _new_bar(datetime.fromtimestamp(time, timezone.utc), o, h, l, c, v)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __str__(self) -> str:
+        if len(self) == 0:
+            return 'BarSeries(0 bars)'
+
+        return 'BarSeries(%s bars, %s to %s)' % (
+            len(self), self.bar(0).time.strftime('%Y-%m-%d %H:%M'), self.bar(-1).time.strftime('%Y-%m-%d %H:%M')
+        )
\ No newline at end of file
@@ -15,5 +15,8 @@ class RequestError(RMTError):
 class RequestTimeout(RequestError):
     pass
 
+class UnknownCommand(RequestError):
+    pass
+
 class ExecutionError(RMTError):
     pass
\ No newline at end of file
@@ -1,23 +1,39 @@
-from datetime     import datetime
-from typing       import Dict, List, Optional, Set
-from PyQt5.QtCore import QObject, pyqtSignal
-from rmt          import Side, Order, Tick, Bar, OrderType, Timeframe, Instrument, error
-
-class Exchange(QObject):
-    """Provides access to market data and allows execution of trades."""
+from datetime import datetime, timezone
+from time     import monotonic
+from typing   import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from rmt      import (Side, Order, Tick, Bar, OrderType, Timeframe, Instrument, Signal, error,
+                      HistoryRequest, HistoryResult)
+
+class Exchange:
+    """Provides access to market data and allows execution of trades.
+
+    Events are notified through signals (see `Signal`), which require no Qt event
+    loop. Callbacks are called by the thread which processes events, so a Qt
+    application should process events from its own thread, e.g. by means of
+    `MetaTrader4.attach_to_qt_event_loop()`.
+
+    Exchanges were formerly `QObject`s with `pyqtSignal`s, and no longer are, so Qt
+    code which connects to them across threads, e.g. by queued connections, or which
+    otherwise uses them as `QObject`s, should connect to a `QtSignalBridge` instead.
+    """
 
-    tick_received = pyqtSignal(str, Tick)
+    tick_received = Signal(str, Tick)
     """Event emitted when a quote update of an instrument is received.
     
     This event is emitted by `Exchange.refresh_rates()` when a new tick of
     a subscribed instrument is received. The parameters passed in are the
     instrument's symbol and its new tick.
+
+    A callback may be connected to the ticks of one instrument only, by passing
+    its symbol to `connect()`:
+
+        exchange.tick_received.connect(on_eurusd_tick, 'EURUSD')
     
     To access the current tick, irrespective of whether it's a new tick or
     not, `Exchange.get_tick()` may be called.
     """
 
-    order_placed = pyqtSignal(Order)
+    order_placed = Signal(Order)
     """Event emitted when a limit order or a stop order is placed.
 
     This event is emitted by the methods `Exchange.place_limit_order()` and
@@ -29,7 +45,7 @@ class Exchange(QObject):
     or a stop order by calling `Order.type()`.
     """
 
-    order_canceled = pyqtSignal(Order)
+    order_canceled = Signal(Order)
     """Event emitted when a limit order or stop order is canceled.
 
     This event is emitted by `Exchange.cancel_order()` when a pending order
@@ -40,7 +56,7 @@ class Exchange(QObject):
     by calling `Order.type()`.
     """
 
-    order_expired = pyqtSignal(Order)
+    order_expired = Signal(Order)
     """Event emitted when a limit order or stop order expires.
     
     This event is emitted when the exchange automatically cancels a pending order
@@ -52,7 +68,7 @@ class Exchange(QObject):
     a limit order or a stop order, call `Order.type()`.
     """
 
-    order_filled = pyqtSignal(Order)
+    order_filled = Signal(Order)
     """Event emitted when an order is filled.
     
     This event is emitted by `Exchange.place_market_order()` immediately before it
@@ -69,7 +85,7 @@ class Exchange(QObject):
     marker order, a limit order, or a stop order, call `Order.type()`.
     """
 
-    order_closed = pyqtSignal(Order)
+    order_closed = Signal(Order)
     """Event emitted when a filled order is closed
     
     This event is emitted by `Exchange.close_order()` immediately after it closes an
@@ -88,44 +104,149 @@ class Exchange(QObject):
         super().__init__()
 
         self._closed_bars: Dict[str, List[Bar]] = {}
+        self._stop_requested = False
 
-    def get_tick(self, symbol: str) -> Tick:
+    def get_tick(self, symbol: str, timeout: Optional[float] = None) -> Tick:
         """Returns the last quotes of an instrument."""
 
         return Tick()
 
-    def get_instrument(self, symbol: str) -> Instrument:
+    def get_instrument(self, symbol: str, timeout: Optional[float] = None) -> Instrument:
         raise error.NotImplementedException(self.__class__, 'get_instrument')
 
     def get_history_bars(self,
                          symbol:     str,
                          start_time: Optional[datetime] = None,
                          end_time:   Optional[datetime] = None,
-                         timeframe:  Timeframe = Timeframe.M1
+                         timeframe:  Timeframe = Timeframe.M1,
+                         timeout:    Optional[float] = None
     ) -> List[Bar]:
         raise error.NotImplementedException(self.__class__, 'get_history_bars')
     
     def get_history_bar(self,
                         symbol:    str,
                         time:      datetime,
-                        timeframe: Timeframe = Timeframe.M1
+                        timeframe: Timeframe = Timeframe.M1,
+                        timeout:   Optional[float] = None
     ) -> Optional[Bar]:
         """Returns a bar of an instrument at a specified time."""
 
-        bars = self.get_history_bars(symbol, time, time, timeframe)
+        bars = self.get_history_bars(symbol, time, time, timeframe, timeout)
 
         if len(bars) == 0:
             return None
         
         return bars[0]
 
+    def get_history_bars_many(self,
+                              requests:    Iterable[HistoryRequest],
+                              max_workers: int = 1,
+                              timeout:     Optional[float] = None
+    ) -> Iterator[HistoryResult]:
+        """Fetches the history bars of several symbols or timeframes, and yields the
+        result of each request as it completes.
+
+        Description
+        -----------
+        Requests are sent by up to `max_workers` threads at a time, or one by one by
+        the calling thread if `max_workers` is 1, so results may be yielded in any
+        order. A request which fails does not stop the others: its result holds the
+        error, which `HistoryResult.bars()` raises.
+
+        If the caller stops iterating, requests not yet sent are dropped.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum time to wait for each request, in seconds.
+        """
+
+        if max_workers < 1:
+            raise ValueError('max workers must be at least 1 (got: %s)' % max_workers)
+
+        if max_workers == 1:
+            for request in requests:
+                yield self._get_history_result(request, timeout)
+
+            return
+
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        executor = ThreadPoolExecutor(max_workers, thread_name_prefix='rmt-history')
+        futures  = [executor.submit(self._get_history_result, request, timeout) for request in requests]
+
+        try:
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+            executor.shutdown(wait=False)
+
+    def get_history_bar_series(self,
+                               symbol:     str,
+                               start_time: Optional[datetime] = None,
+                               end_time:   Optional[datetime] = None,
+                               timeframe:  Timeframe = Timeframe.M1,
+                               timeout:    Optional[float] = None
+    ) -> 'BarSeries':
+        """Returns the bars of `get_history_bars()` as a `BarSeries`, which holds them
+        in NumPy arrays rather than as `Bar` objects. Requires NumPy."""
+
+        from rmt.bar_series import BarSeries
+
+        return BarSeries.from_bars(self.get_history_bars(symbol, start_time, end_time, timeframe, timeout))
+
+    def iter_history_bars(self,
+                          symbol:     str,
+                          start_time: datetime,
+                          end_time:   Optional[datetime] = None,
+                          timeframe:  Timeframe = Timeframe.M1,
+                          chunk_size: int = 10000,
+                          timeout:    Optional[float] = None
+    ) -> Iterator[List[Bar]]:
+        """Yields the bars of an instrument from `start_time` to `end_time`, inclusive,
+        or up to the current bar if `end_time` is `None`, in chunks.
+
+        Description
+        -----------
+        The range is split into windows of `chunk_size` bars, which are requested
+        one by one, so that a range of years takes no more memory than a chunk and
+        no request takes much longer than another. Windows without bars, e.g. over
+        a weekend, yield no chunk.
+
+        Parameters
+        ----------
+        chunk_size : int
+            Number of bars of a window, which is the most bars a chunk holds.
+
+        timeout : float, optional
+            Maximum time to wait for each chunk, in seconds.
+
+        Raises
+        ------
+        RequestError
+            If a request could not be delivered to, or understood by the exchange.
+
+        ValueError
+            If `chunk_size` is less than 1.
+        """
+
+        for window_start, window_end in self._history_windows(symbol, start_time, end_time, timeframe, chunk_size, timeout):
+            bars = self.get_history_bars(symbol, window_start, window_end, timeframe, timeout)
+
+            if bars:
+                yield bars
+
     def get_current_bar(self,
                         symbol:    str,
-                        timeframe: Timeframe = Timeframe.M1
+                        timeframe: Timeframe = Timeframe.M1,
+                        timeout:   Optional[float] = None
     ) -> Bar:
         raise error.NotImplementedException(self.__class__, 'get_current_bar')
 
-    def subscribe(self, symbol: str):
+    def subscribe(self, symbol: str, timeout: Optional[float] = None):
         """Begins to receive quote updates of an instrument.
 
         Parameters
@@ -133,6 +254,9 @@ class Exchange(QObject):
         symbol : str
             Instrument symbol.
 
+        timeout : float, optional
+            Seconds to wait for the request to complete. (default: exchange-defined)
+
         Raises
         ------
         UnknownSymbol
@@ -141,7 +265,7 @@ class Exchange(QObject):
 
         raise error.NotImplementedException(self.__class__, 'subscribe')
 
-    def subscribe_all(self):
+    def subscribe_all(self, timeout: Optional[float] = None):
         """Begins to receive quote updates of all instruments.
 
         Raises
@@ -193,7 +317,8 @@ class Exchange(QObject):
                     take_profit:  Optional[float] = None,
                     comment:      str = '',
                     magic_number: int = 0,
-                    expiration:   Optional[datetime] = None
+                    expiration:   Optional[datetime] = None,
+                    timeout:      Optional[float]    = None
     ) -> int:
         """Places an order to buy or sell an instrument.
 
@@ -266,6 +391,9 @@ class Exchange(QObject):
         magic_number : int, optional
             Order magic number. This may be used as a user-defined identifier.
 
+        timeout : float, optional
+            Seconds to wait for the request to complete. (default: exchange-defined)
+
         Raises
         ------
         ValueError
@@ -290,7 +418,8 @@ class Exchange(QObject):
                      stop_loss:   Optional[float]    = None,
                      take_profit: Optional[float]    = None,
                      price:       Optional[float]    = None,
-                     expiration:  Optional[datetime] = None
+                     expiration:  Optional[datetime] = None,
+                     timeout:     Optional[float]    = None
     ):
         """Modifies an order.
 
@@ -314,6 +443,9 @@ class Exchange(QObject):
         expiration : datetime, optional
             Time at which to expire the order. (default: current expiration time)
 
+        timeout : float, optional
+            Seconds to wait for the request to complete. (default: exchange-defined)
+
         Raises
         ------
         OrderNotFound
@@ -329,7 +461,8 @@ class Exchange(QObject):
                     ticket:   int,
                     price:    Optional[float] = None,
                     slippage: int             = 0,
-                    lots:     Optional[float] = None
+                    lots:     Optional[float] = None,
+                    timeout:  Optional[float] = None
     ) -> int:
         """Closes a filled order.
 
@@ -368,6 +501,9 @@ class Exchange(QObject):
         lots : float, optional
             Lot size of the order to close. (default: whole order)
 
+        timeout : float, optional
+            Seconds to wait for the request to complete. (default: exchange-defined)
+
         Raises
         ------
         OrderNotFound
@@ -381,7 +517,7 @@ class Exchange(QObject):
 
         raise error.NotImplementedException(self.__class__, 'close_order')
 
-    def get_order(self, ticket: int) -> Order:
+    def get_order(self, ticket: int, timeout: Optional[float] = None) -> Order:
         """Retrieves information about an order.
 
         Description
@@ -404,6 +540,9 @@ class Exchange(QObject):
         ----------
         ticket : int
             Ticket that identifies an order.
+
+        timeout : float, optional
+            Seconds to wait for the request to complete. (default: exchange-defined)
         
         Raises
         ------
@@ -425,5 +564,197 @@ class Exchange(QObject):
     def orders(self) -> Dict[int, Order]:
         raise error.NotImplementedException(self.__class__, 'orders')
 
-    def process_events(self):
-        raise error.NotImplementedException(self.__class__, 'process_events')
\ No newline at end of file
+    def process_events(self,
+                       max_events: Optional[int]   = None,
+                       max_time:   Optional[float] = None
+    ) -> Tuple[int, bool]:
+        """Notifies the events received so far.
+
+        Description
+        -----------
+        By default, all events received are processed before this method returns,
+        which may take a while after a burst of events. A scheduler may instead
+        bound the work done by a call with `max_events` and `max_time`, and send
+        requests between calls, so that a burst of ticks does not delay order
+        management. Events which are not processed are kept, in order, until the
+        next call.
+
+        Parameters
+        ----------
+        max_events : int, optional
+            Maximum number of events to process. (default: no limit)
+
+        max_time : float, optional
+            Seconds after which to stop processing events. The event being processed
+            when the time is up is completed first. (default: no limit)
+
+        Returns
+        -------
+        Tuple[int, bool]
+            Number of events processed, and whether events are left to be processed.
+        """
+
+        raise error.NotImplementedException(self.__class__, 'process_events')
+
+    def wait_for_events(self, timeout: Optional[float] = None) -> bool:
+        """Blocks until events are ready to be processed by `process_events()`.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum number of seconds to wait. If `None`, waits indefinitely.
+
+        Returns
+        -------
+        bool
+            Whether events are ready. May be `False` before `timeout` seconds elapse
+            if `stop()` is called.
+        """
+
+        raise error.NotImplementedException(self.__class__, 'wait_for_events')
+
+    def run(self):
+        """Processes events as soon as they are received, until `stop()` is called."""
+
+        self.run_until()
+
+    def run_until(self,
+                  condition:  Optional[Callable[[], bool]] = None,
+                  timeout:    Optional[float] = None,
+                  max_events: Optional[int]   = None,
+                  max_time:   Optional[float] = None
+    ) -> bool:
+        """Processes events as soon as they are received, until `condition` is met.
+
+        Description
+        -----------
+        Rather than waking up at intervals, the calling thread sleeps in
+        `wait_for_events()` until an event is received, so events are notified
+        with about the latency of the connection to the exchange.
+
+        `condition` is checked after each round of events is processed, such that
+        a callback connected to an event may change what it tests. Events are
+        processed in rounds of at most `max_events` events and `max_time` seconds,
+        as by `process_events()`.
+
+        Parameters
+        ----------
+        condition : callable, optional
+            Function returning whether to stop running. If `None`, runs until
+            `stop()` is called or `timeout` seconds elapse.
+
+        timeout : float, optional
+            Maximum number of seconds to run. If `None`, runs indefinitely.
+
+        max_events : int, optional
+            Maximum number of events to process per round. (default: no limit)
+
+        max_time : float, optional
+            Seconds after which to end a round of events. (default: no limit)
+
+        Returns
+        -------
+        bool
+            `False` if `timeout` seconds elapsed, `True` if `condition` was met or
+            `stop()` was called.
+        """
+
+        deadline = None if timeout is None else monotonic() + timeout
+
+        try:
+            while True:
+                _, backlog_remains = self.process_events(max_events, max_time)
+
+                if self._stop_requested:
+                    return True
+
+                if condition is not None and condition():
+                    return True
+
+                remaining = None
+
+                if deadline is not None:
+                    remaining = deadline - monotonic()
+
+                    if remaining <= 0:
+                        return False
+
+                if not backlog_remains:
+                    self.wait_for_events(remaining)
+        finally:
+            self._stop_requested = False
+
+    def stop(self):
+        """Makes `run()` or `run_until()` return after the events being processed.
+
+        This method may be called from a callback or from another thread. If no
+        loop is running, the next call to `run()` or `run_until()` processes the
+        events already received and returns.
+        """
+
+        self._stop_requested = True
+
+    #===============================================================================
+    # Internals
+    #===============================================================================
+    def _get_history_result(self, request: HistoryRequest, timeout: Optional[float]) -> HistoryResult:
+        try:
+            bars = self.get_history_bars(
+                request.symbol(), request.start_time(), request.end_time(), request.timeframe(), timeout
+            )
+        except Exception as e:
+            return HistoryResult(request, error=e)
+
+        return HistoryResult(request, bars)
+
+    def _history_windows(self,
+                         symbol:     str,
+                         start_time: datetime,
+                         end_time:   Optional[datetime],
+                         timeframe:  Timeframe,
+                         chunk_size: int,
+                         timeout:    Optional[float]
+    ) -> Iterator[Tuple[datetime, Optional[datetime]]]:
+        """Yields the start and end times of windows of `chunk_size` bars covering a
+        range, whose last window ends at `end_time`."""
+
+        if chunk_size < 1:
+            raise ValueError('chunk size must be at least 1 (got: %s)' % chunk_size)
+
+        if end_time is None:
+            last_bar_start = self.get_current_bar(symbol, timeframe, timeout).time.timestamp()
+        else:
+            last_bar_start = end_time.timestamp()
+
+        return _split_history_range(start_time, end_time, last_bar_start, timeframe, chunk_size)
+
+def _split_history_range(start_time:     datetime,
+                         end_time:       Optional[datetime],
+                         last_bar_start: float,
+                         timeframe:      Timeframe,
+                         chunk_size:     int
+) -> Iterator[Tuple[datetime, Optional[datetime]]]:
+    """Yields the start and end times of windows of `chunk_size` bars, from `start_time`
+    up to the bar starting at `last_bar_start`, whose last window ends at `end_time`."""
+
+    window_start = start_time
+    bar_start    = timeframe.bar_start(start_time.timestamp())
+    seconds      = timeframe.seconds()
+
+    while True:
+        if seconds is not None:
+            next_start = bar_start + chunk_size * seconds
+        else:
+            next_start = bar_start
+
+            for _ in range(chunk_size):
+                next_start = timeframe.next_bar_start(next_start)
+
+        if next_start > last_bar_start:
+            yield window_start, end_time
+            return
+
+        yield window_start, datetime.fromtimestamp(next_start - 1, timezone.utc)
+
+        window_start = datetime.fromtimestamp(next_start, timezone.utc)
+        bar_start    = next_start
\ No newline at end of file
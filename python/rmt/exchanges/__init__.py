@@ -1 +1,24 @@
-from .mt4 import MetaTrader4
\ No newline at end of file
+import importlib
+from typing import Any, List
+
+# Exchange bindings, by the name of the submodule which defines them. A submodule
+# is imported on first access to one of its bindings.
+_lazy_attributes = {
+    'MetaTrader4':      'mt4',
+    'AsyncMetaTrader4': 'mt4',
+    'ReplayExchange':   'replay'
+}
+
+_lazy_submodules = {'mt4', 'replay'}
+
+def __getattr__(name: str) -> Any:
+    if name in _lazy_attributes:
+        return getattr(importlib.import_module('.' + _lazy_attributes[name], __name__), name)
+
+    if name in _lazy_submodules:
+        return importlib.import_module('.' + name, __name__)
+
+    raise AttributeError("module '%s' has no attribute '%s'" % (__name__, name))
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_lazy_attributes) | _lazy_submodules)
\ No newline at end of file
@@ -1,6 +1,43 @@
-from .content        import Content
-from .command_result import CommandResultCode
-from .operation_code import OperationCode
-from .raise_error    import raise_error
-from .               import events, requests, responses
-from .metatrader4    import MetaTrader4
\ No newline at end of file
+import importlib
+from typing             import Any, List
+from .content           import Content
+from .command_result    import CommandResultCode
+from .operation_code    import OperationCode
+from .raise_error       import raise_error
+from .json_codec        import JsonCodec, StdJsonCodec, OrjsonCodec
+from .                  import binary_format
+from .                  import events, requests, responses, message
+from .batch             import Batch, BatchResult
+from .timeout_profile   import TimeoutProfile
+from .retry_policy      import RetryPolicy
+from .socket_pool       import ReqSocketPool, SocketPoolMetrics
+from .tick_receiver     import TickReceiver, TickReceiverMetrics
+from .metatrader4       import MetaTrader4
+
+# Imported on first access, since they depend on asyncio or PyQt5, or are only
+# used by tests and benchmarks.
+_lazy_attributes = {
+    'AsyncMetaTrader4': 'async_metatrader4',
+    'StandInServer':    'stand_in_server',
+    'QtEventNotifier':  'qt_event_notifier'
+}
+
+def __getattr__(name: str) -> Any:
+    if name not in _lazy_attributes:
+        raise AttributeError("module '%s' has no attribute '%s'" % (__name__, name))
+
+    try:
+        value = getattr(importlib.import_module('.' + _lazy_attributes[name], __name__), name)
+    except ImportError:
+        if name != 'QtEventNotifier':
+            raise
+
+        # PyQt5 is only required to process events from a Qt event loop.
+        value = None
+
+    globals()[name] = value
+
+    return value
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_lazy_attributes))
\ No newline at end of file
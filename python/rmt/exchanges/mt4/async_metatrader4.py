@@ -0,0 +1,596 @@
+import asyncio
+import zmq
+import zmq.asyncio
+import logging
+from collections  import deque
+from datetime     import datetime
+from itertools    import count
+from typing       import AsyncIterator, Callable, Deque, Dict, Iterable, List, Optional, Set, Tuple, Union
+from rmt          import (error, Order, Side, OrderType,
+                          Exchange, Tick, Bar, Timeframe, Instrument, HistoryRequest, HistoryResult)
+from rmt.exchange import _split_history_range
+from . import *
+
+class AsyncMetaTrader4(Exchange):
+    """Asynchronous bindings for executing market operations on MetaTrader 4.
+
+    Description
+    -----------
+    This class provides the same operations as `MetaTrader4`, but as coroutines
+    which are run on an `asyncio` event loop.
+
+    Requests are sent on a DEALER socket rather than on a REQ socket, so any number
+    of requests may be in flight at the same time. Each request is prefixed with an
+    identifier frame, which the Expert's REP socket echoes back as part of the reply's
+    routing envelope, so responses are matched to their requests without requiring
+    any change to the Expert Server. Note that the Expert still executes requests one
+    at a time, in the order they are received.
+
+    Every request is subject to a deadline, which is given by the parameter `timeout`
+    of a method call or, if that's `None`, by `timeout_profile` according to the request's
+    command (see `TimeoutProfile`). Messages are serialized by `codec` (see `JsonCodec`),
+    and ticks and bars are transferred in binary format if `binary_format` is true and
+    the Expert Server supports it, as for `MetaTrader4`.
+    If a deadline expires before a response is received, `RequestTimeout` is raised.
+    A task awaiting on a request may also be cancelled. In either case, a response
+    that arrives afterwards is discarded. Note, however, that a request which has
+    already been sent may still be executed by the Expert.
+
+    Responses and tick events are received by tasks of their own, which are created
+    by `start()` or by the first request, so `tick_received` keeps being emitted
+    while requests are outstanding.
+
+    Although it derives from `Exchange`, this class does not provide the methods
+    of `Exchange` which block the calling thread, such as `run()`, and may not run
+    a `Strategy`, whose callbacks are not coroutines.
+    """
+
+    def __init__(self,
+                 protocol:        str = 'tcp',
+                 host:            str = 'localhost',
+                 req_port:        int = 32768,
+                 sub_port:        int = 32769,
+                 timeout_profile: Union[str, TimeoutProfile] = TimeoutProfile.LIVE,
+                 codec:           Optional[Union[str, JsonCodec]] = None,
+                 binary_format:   bool = False
+    ):
+        super().__init__()
+
+        ctx = zmq.asyncio.Context.instance()
+        self._dealer_socket = ctx.socket(zmq.DEALER)
+        self._sub_socket    = ctx.socket(zmq.SUB)
+
+        self._dealer_socket.setsockopt(zmq.LINGER, 0)
+
+        self._timeout_profile = TimeoutProfile.of(timeout_profile)
+        self._codec           = JsonCodec.of(codec)
+        self._binary_format: Optional[bool] = None if binary_format else False
+        self._negotiation:   Optional[asyncio.Future] = None
+        self._logger          = logging.getLogger(AsyncMetaTrader4.__name__)
+
+        self._subscribed_symbols: Set[str] = set()
+        self._subscribed_all = False
+
+        self._instruments: Dict[str, Instrument] = {}
+
+        self._orders: Dict[int, Order] = {}
+
+        self._request_ids = count(1)
+        self._pending_requests: Dict[bytes, asyncio.Future] = {}
+        self._tasks: List[asyncio.Task] = []
+
+        self._event_factory = {
+            'tick':  (events.TickEvent,       lambda e: self.tick_received.emit(e.symbol(), e.tick())),
+            'btick': (events.BinaryTickEvent, lambda e: self.tick_received.emit(e.symbol(), e.tick()))
+        }
+
+        self._event_topics: message.TopicCache = {}
+
+        self.connect(protocol, host, req_port, sub_port)
+
+    def connect(self,
+                protocol: str,
+                host: str,
+                req_port: int,
+                sub_port: int
+    ):
+        addr_prefix = protocol + '://' + host + ':%s'
+
+        req_addr = addr_prefix % req_port
+        self._dealer_socket.connect(req_addr)
+        self._logger.info('Ready to send commands on (DEALER) socket: %s', req_addr)
+
+        sub_addr = addr_prefix % sub_port
+        self._sub_socket.connect(sub_addr)
+        self._logger.info('Ready to receive quotes on (SUB) socket: %s', sub_addr)
+
+    def start(self):
+        """Starts receiving responses and events on the running event loop."""
+
+        if len(self._tasks) != 0:
+            return
+
+        self._tasks = [
+            asyncio.ensure_future(self._receive_responses()),
+            asyncio.ensure_future(self._receive_events())
+        ]
+
+    async def disconnect(self):
+        for task in self._tasks:
+            task.cancel()
+
+        for task in self._tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+        self._tasks.clear()
+
+        if self._negotiation is not None:
+            self._negotiation.cancel()
+
+        for future in self._pending_requests.values():
+            future.cancel()
+
+        self._pending_requests.clear()
+
+        self._dealer_socket.close()
+        self._sub_socket.close()
+
+    def timeout_profile(self) -> TimeoutProfile:
+        return self._timeout_profile
+
+    def set_timeout_profile(self, timeout_profile: Union[str, TimeoutProfile]):
+        self._timeout_profile = TimeoutProfile.of(timeout_profile)
+
+    def codec(self) -> JsonCodec:
+        return self._codec
+
+    async def uses_binary_format(self, timeout: Optional[float] = None) -> bool:
+        """See `MetaTrader4.uses_binary_format()`."""
+
+        if self._binary_format is None:
+            # Concurrent callers share a single getCapabilities request, which is
+            # shielded so that cancelling one of them does not cancel the others.
+            if self._negotiation is None:
+                self._negotiation = asyncio.ensure_future(self._negotiate_binary_format(timeout))
+                self._negotiation.add_done_callback(self._end_negotiation)
+
+            await asyncio.shield(self._negotiation)
+
+        return self._binary_format
+
+    async def __aenter__(self) -> 'AsyncMetaTrader4':
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.disconnect()
+
+    async def get_tick(self, symbol: str, timeout: Optional[float] = None) -> Tick:
+        request  = requests.GetTickRequest(symbol)
+        response = responses.GetTickResponse(await self._send_request(request, timeout))
+
+        return response.tick()
+
+    async def get_instrument(self, symbol: str, timeout: Optional[float] = None) -> Instrument:
+        if symbol not in self._instruments:
+            request  = requests.GetInstrumentRequest(symbol)
+            response = responses.GetInstrumentResponse(await self._send_request(request, timeout))
+
+            self._instruments[symbol] = response.instrument(symbol)
+
+        return self._instruments[symbol]
+
+    async def get_history_bars(self,
+                               symbol:     str,
+                               start_time: Optional[datetime] = None,
+                               end_time:   Optional[datetime] = None,
+                               timeframe:  Timeframe = Timeframe.M1,
+                               timeout:    Optional[float] = None
+    ) -> List[Bar]:
+        binary   = await self.uses_binary_format(timeout)
+        request  = requests.GetHistoryBarsRequest(symbol, start_time, end_time, timeframe, binary)
+        response = responses.GetHistoryBarsResponse(*await self._send_binary_request(request, timeout))
+
+        return response.bars()
+
+    async def get_history_bars_many(self,
+                                    requests:    Iterable[HistoryRequest],
+                                    max_workers: Optional[int]   = None,
+                                    timeout:     Optional[float] = None
+    ) -> AsyncIterator[HistoryResult]:
+        """Fetches the history bars of several symbols or timeframes, and yields the
+        result of each request as it completes, as an asynchronous generator. See
+        `Exchange.get_history_bars_many()`.
+
+        Requests are sent as tasks of their own, at most `max_workers` at a time,
+        or all at once if `max_workers` is `None`, since the DEALER socket allows
+        any number of requests in flight.
+        """
+
+        if max_workers is not None and max_workers < 1:
+            raise ValueError('max workers must be at least 1 (got: %s)' % max_workers)
+
+        semaphore = None if max_workers is None else asyncio.Semaphore(max_workers)
+        tasks     = [asyncio.ensure_future(self._get_history_result(request, semaphore, timeout)) for request in requests]
+
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            # Requests not yet completed are dropped if the consumer stops early.
+            for task in tasks:
+                task.cancel()
+
+    async def get_history_bar_series(self,
+                                     symbol:     str,
+                                     start_time: Optional[datetime] = None,
+                                     end_time:   Optional[datetime] = None,
+                                     timeframe:  Timeframe = Timeframe.M1,
+                                     timeout:    Optional[float] = None
+    ) -> 'BarSeries':
+        """Returns history bars as a `BarSeries`. See `MetaTrader4.get_history_bar_series()`."""
+
+        binary   = await self.uses_binary_format(timeout)
+        request  = requests.GetHistoryBarsRequest(symbol, start_time, end_time, timeframe, binary)
+        response = responses.GetHistoryBarsResponse(*await self._send_binary_request(request, timeout))
+
+        return response.bar_series()
+
+    async def iter_history_bars(self,
+                                symbol:     str,
+                                start_time: datetime,
+                                end_time:   Optional[datetime] = None,
+                                timeframe:  Timeframe = Timeframe.M1,
+                                chunk_size: int = 10000,
+                                timeout:    Optional[float] = None,
+                                prefetch:   int = 2
+    ) -> AsyncIterator[List[Bar]]:
+        """Yields the bars of an instrument in chunks, as an asynchronous generator.
+        See `Exchange.iter_history_bars()`.
+
+        Up to `prefetch` windows are requested ahead of the chunk being consumed, as
+        tasks of their own, so their requests are in flight at the same time.
+        """
+
+        if chunk_size < 1:
+            raise ValueError('chunk size must be at least 1 (got: %s)' % chunk_size)
+
+        if end_time is None:
+            last_bar_start = (await self.get_current_bar(symbol, timeframe, timeout)).time.timestamp()
+        else:
+            last_bar_start = end_time.timestamp()
+
+        pending: Deque[asyncio.Future] = deque()
+
+        try:
+            for window_start, window_end in _split_history_range(start_time, end_time, last_bar_start, timeframe, chunk_size):
+                pending.append(asyncio.ensure_future(
+                    self.get_history_bars(symbol, window_start, window_end, timeframe, timeout)
+                ))
+
+                if len(pending) > prefetch:
+                    bars = await pending.popleft()
+
+                    if bars:
+                        yield bars
+
+            while pending:
+                bars = await pending.popleft()
+
+                if bars:
+                    yield bars
+        finally:
+            # Windows not yet received are dropped if the consumer stops early.
+            for future in pending:
+                future.cancel()
+
+    async def get_history_bar(self,
+                              symbol:    str,
+                              time:      datetime,
+                              timeframe: Timeframe = Timeframe.M1,
+                              timeout:   Optional[float] = None
+    ) -> Optional[Bar]:
+        bars = await self.get_history_bars(symbol, time, time, timeframe, timeout)
+
+        if len(bars) == 0:
+            return None
+
+        return bars[0]
+
+    async def get_current_bar(self,
+                              symbol:    str,
+                              timeframe: Timeframe = Timeframe.M1,
+                              timeout:   Optional[float] = None
+    ) -> Bar:
+        request  = requests.GetCurrentBarRequest(symbol, timeframe)
+        response = responses.GetCurrentBarResponse(await self._send_request(request, timeout))
+
+        return response.bar()
+
+    async def subscribe(self, symbol: str, timeout: Optional[float] = None):
+        if symbol in self._subscribed_symbols:
+            return
+
+        request = requests.WatchSymbolRequest(symbol, await self.uses_binary_format(timeout))
+        await self._send_request(request, timeout)
+
+        self._sub_socket.subscribe(self._tick_topic() + symbol)
+        self._subscribed_symbols.add(symbol)
+
+    async def subscribe_all(self, timeout: Optional[float] = None):
+        request = requests.WatchSymbolRequest('*', await self.uses_binary_format(timeout))
+        await self._send_request(request, timeout)
+
+        # The Expert does not tell which symbols it watches, so subscribe to the
+        # topic prefix shared by tick events of all symbols.
+        self._sub_socket.subscribe(self._tick_topic())
+        self._subscribed_all = True
+
+    async def unsubscribe(self, symbol: str):
+        if symbol in self._subscribed_symbols:
+            self._sub_socket.unsubscribe(self._tick_topic() + symbol)
+            self._subscribed_symbols.remove(symbol)
+
+    async def unsubscribe_all(self):
+        for symbol in self._subscribed_symbols:
+            self._sub_socket.unsubscribe(self._tick_topic() + symbol)
+
+        if self._subscribed_all:
+            self._sub_socket.unsubscribe(self._tick_topic())
+            self._subscribed_all = False
+
+        self._subscribed_symbols.clear()
+
+    def subscriptions(self) -> Set[str]:
+        return self._subscribed_symbols.copy()
+
+    async def place_order(self,
+                          symbol:       str,
+                          side:         Side,
+                          order_type:   OrderType,
+                          lots:         float,
+                          price:        Optional[float] = None,
+                          slippage:     Optional[int]   = None,
+                          stop_loss:    Optional[float] = None,
+                          take_profit:  Optional[float] = None,
+                          comment:      str = '',
+                          magic_number: int = 0,
+                          expiration:   Optional[datetime] = None,
+                          timeout:      Optional[float]    = None
+    ) -> int:
+        if symbol == '':
+            raise ValueError('instrument symbol must not be empty')
+
+        opcode = OperationCode.from_order(side, order_type)
+
+        request = requests.PlaceOrderRequest(
+            symbol,
+            opcode,
+            lots,
+            price,
+            slippage,
+            stop_loss,
+            take_profit,
+            comment,
+            magic_number,
+            expiration
+        )
+
+        response = responses.PlaceOrderResponse(await self._send_request(request, timeout))
+        order    = response.order(request)
+
+        # See `MetaTrader4.place_order()` for why the order may be missing.
+        if order is not None:
+            self._orders[response.ticket()] = order
+
+        return response.ticket()
+
+    async def modify_order(self,
+                           ticket:      int,
+                           stop_loss:   Optional[float]    = None,
+                           take_profit: Optional[float]    = None,
+                           price:       Optional[float]    = None,
+                           expiration:  Optional[datetime] = None,
+                           timeout:     Optional[float]    = None
+    ):
+        request = requests.ModifyOrderRequest(
+            ticket,
+            stop_loss,
+            take_profit,
+            price,
+            expiration
+        )
+
+        await self._send_request(request, timeout)
+
+    async def close_order(self,
+                          ticket:   int,
+                          price:    Optional[float] = None,
+                          slippage: int             = 0,
+                          lots:     Optional[float] = None,
+                          timeout:  Optional[float] = None
+    ) -> int:
+        request  = requests.CloseOrderRequest(ticket, price, slippage, lots)
+        response = responses.CloseOrderResponse(await self._send_request(request, timeout))
+
+        if response.new_order():
+            ticket = response.new_order().ticket()
+
+        return ticket
+
+    async def get_order(self, ticket: int, timeout: Optional[float] = None) -> Order:
+        if ticket not in self._orders:
+            request  = requests.GetOrderRequest(ticket)
+            response = responses.GetOrderResponse(await self._send_request(request, timeout))
+
+            self._orders[ticket] = response.order()
+
+        return self._orders[ticket]
+
+    def orders(self) -> Dict[int, Order]:
+        return self._orders.copy()
+
+    async def process_events(self):
+        """Lets events received so far be notified.
+
+        Events are received and notified by a task started by `start()`, so this
+        method only has to yield control to the event loop once.
+        """
+
+        self.start()
+        await asyncio.sleep(0)
+
+    def wait_for_events(self, timeout: Optional[float] = None) -> bool:
+        """Not supported, as events are notified by tasks of the event loop rather
+        than by a thread waiting for them."""
+
+        raise error.NotImplementedException(self.__class__, 'wait_for_events')
+
+    def run(self):
+        """Not supported. Run the event loop instead, e.g. with `asyncio.run()`."""
+
+        raise error.NotImplementedException(self.__class__, 'run')
+
+    def run_until(self,
+                  condition:  Optional[Callable[[], bool]] = None,
+                  timeout:    Optional[float] = None,
+                  max_events: Optional[int]   = None,
+                  max_time:   Optional[float] = None
+    ) -> bool:
+        """Not supported. Run the event loop instead, e.g. with `asyncio.run()`."""
+
+        raise error.NotImplementedException(self.__class__, 'run_until')
+
+    #===============================================================================
+    # Internals
+    #===============================================================================
+    def _tick_topic(self) -> str:
+        return 'btick.' if self._binary_format else 'tick.'
+
+    async def _negotiate_binary_format(self, timeout: Optional[float]):
+        request = requests.GetCapabilitiesRequest()
+
+        try:
+            response = responses.GetCapabilitiesResponse(await self._send_request(request, timeout))
+            self._binary_format = binary_format.FORMAT_NAME in response.formats()
+        except error.UnknownCommand:
+            self._binary_format = False
+
+        self._logger.info('Using %s format for ticks and bars', 'binary' if self._binary_format else 'JSON')
+
+    def _end_negotiation(self, negotiation: asyncio.Future):
+        # A failed negotiation is retried by the next caller.
+        self._negotiation = None
+
+    async def _get_history_result(self,
+                                  request:   HistoryRequest,
+                                  semaphore: Optional[asyncio.Semaphore],
+                                  timeout:   Optional[float]
+    ) -> HistoryResult:
+        if semaphore is not None:
+            async with semaphore:
+                return await self._get_history_result(request, None, timeout)
+
+        try:
+            bars = await self.get_history_bars(
+                request.symbol(), request.start_time(), request.end_time(), request.timeframe(), timeout
+            )
+        except Exception as e:
+            return HistoryResult(request, error=e)
+
+        return HistoryResult(request, bars)
+
+    async def _send_request(self, request: requests.Request, timeout: Optional[float]) -> Content:
+        content, _ = await self._send_binary_request(request, timeout)
+
+        return content
+
+    async def _send_binary_request(self,
+                                   request: requests.Request,
+                                   timeout: Optional[float]
+    ) -> Tuple[Content, Optional[bytes]]:
+        self.start()
+
+        cmd        = request.command
+        request    = message.format_request(request, self._codec)
+        request_id = b'%d' % next(self._request_ids)
+        future     = asyncio.get_running_loop().create_future()
+
+        if timeout is None:
+            timeout = self._timeout_profile.timeout(cmd)
+
+        self._pending_requests[request_id] = future
+
+        try:
+            response = await asyncio.wait_for(self._round_trip(request_id, request, future), timeout)
+        except asyncio.TimeoutError:
+            raise error.RequestTimeout()
+        finally:
+            self._pending_requests.pop(request_id, None)
+
+        content = message.read_response(cmd, response[0], self._codec)
+        data    = response[1] if len(response) > 1 else None
+
+        return content, data
+
+    async def _round_trip(self, request_id: bytes, request: bytes, future: asyncio.Future) -> List[bytes]:
+        await self._dealer_socket.send_multipart([request_id, b'', request])
+        self._logger.debug('sent request %s: %s', request_id, request)
+
+        return await future
+
+    async def _receive_responses(self):
+        while True:
+            frames = await self._dealer_socket.recv_multipart()
+
+            # The reply is made up of the request identifier, an empty delimiter
+            # frame, and the frames of the response message.
+            if len(frames) < 3 or frames[1] != b'':
+                self._logger.warning('discarded malformed reply of %d frames: %s', len(frames), frames)
+                continue
+
+            request_id = frames[0]
+            response   = frames[2:]
+            future     = self._pending_requests.pop(request_id, None)
+
+            if future is None or future.done():
+                self._logger.debug('discarded response to expired request %s: %s', request_id, response[0])
+                continue
+
+            self._logger.debug('received response %s: %s', request_id, response[0])
+            future.set_result(response)
+
+    async def _receive_events(self):
+        while True:
+            event_frames = await self._sub_socket.recv_multipart(copy=False)
+
+            self._logger.debug('received event message: %s', event_frames)
+
+            try:
+                self._process_event(event_frames)
+            except (ValueError, TypeError) as e:
+                self._logger.warning('failed to read event msg: %s', e)
+            except Exception:
+                # Unlike `MetaTrader4.process_events()`, there is no caller to
+                # raise to, and letting the exception through would end the task,
+                # so that no further events would be received.
+                self._logger.exception('failed to notify event msg: %s', event_frames)
+
+    def _process_event(self, frames: List[zmq.Frame]):
+        static_name, dynamic_name, content = message.split_event_frames(frames, self._event_topics)
+
+        if static_name not in self._event_factory:
+            raise ValueError("received event message with unknown name '%s'" % static_name)
+
+        EventType, event_emitter = self._event_factory[static_name]
+
+        if not EventType.is_binary:
+            content = message.read_event_content(static_name, content, self._codec)
+
+        if dynamic_name is not None:
+            event_emitter(EventType(dynamic_name, content))
+        else:
+            event_emitter(EventType(static_name, content))
\ No newline at end of file
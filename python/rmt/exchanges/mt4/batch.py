@@ -0,0 +1,211 @@
+from typing import Any, Callable, Dict, List, Optional, Type
+from rmt    import error
+from .      import CommandResultCode, Content, raise_error, requests, responses
+
+_response_types: Dict[Type[requests.Request], Type[Any]] = {
+    requests.GetTickRequest:        responses.GetTickResponse,
+    requests.GetInstrumentRequest:  responses.GetInstrumentResponse,
+    requests.GetCurrentBarRequest:  responses.GetCurrentBarResponse,
+    requests.GetHistoryBarsRequest: responses.GetHistoryBarsResponse,
+    requests.GetOrderRequest:       responses.GetOrderResponse,
+    requests.PlaceOrderRequest:     responses.PlaceOrderResponse,
+    requests.CloseOrderRequest:     responses.CloseOrderResponse
+}
+
+class BatchResult:
+    """Result of a request sent as part of a `Batch`."""
+
+    def __init__(self, request: requests.Request):
+        self._request = request
+        self._content: Optional[Content] = None
+        self._error:   Optional[error.RMTError] = None
+
+    def request(self) -> requests.Request:
+        return self._request
+
+    def done(self) -> bool:
+        """Returns whether a result was received for the request."""
+
+        return self._content is not None or self._error is not None
+
+    def content(self) -> Content:
+        """Returns the content of the response to the request.
+
+        Raises
+        ------
+        RequestError
+            If the batch was not sent yet, or if the request was rejected.
+
+        ExecutionError
+            If the server failed to execute the request.
+        """
+
+        if self._error is not None:
+            raise self._error
+
+        if self._content is None:
+            raise error.RequestError('batch of request %s was not sent' % type(self._request))
+
+        return self._content
+
+    def response(self) -> Any:
+        """Returns the response object which matches the type of the request.
+
+        For requests which have no response type, such as `WatchSymbolRequest`,
+        returns the response's content instead.
+
+        Raises
+        ------
+        RequestError
+            If the batch was not sent yet, or if the request was rejected.
+
+        ExecutionError
+            If the server failed to execute the request.
+        """
+
+        content = self.content()
+
+        ResponseType = _response_types.get(type(self._request))
+
+        if ResponseType is None:
+            return content
+
+        return ResponseType(content)
+
+    def _set_content(self, content: Content):
+        self._content = content
+
+    def _set_error(self, e: error.RMTError):
+        self._error = e
+
+class Batch:
+    """Collects requests to be sent to the Expert Server in one round trip.
+
+    Description
+    -----------
+    Requests are added to a batch by `add()`, which returns an object that holds
+    the result of a request once the batch is sent by `send()`. If a batch is used
+    as a context manager, it is sent when the context exits without an error.
+
+        with exchange.batch() as batch:
+            eurusd = batch.add(requests.GetTickRequest('EURUSD'))
+            order  = batch.add(requests.GetOrderRequest(42))
+
+        tick = eurusd.response().tick()
+
+    Each request succeeds or fails on its own: an error of a request is raised
+    by `BatchResult.response()`, and does not affect the other requests. See
+    `BatchRequest` for the protocol.
+
+    If the server does not support batches, requests are sent one at a time.
+    """
+
+    def __init__(self, send_request: Callable[[requests.Request, Optional[float]], Content]):
+        self._send_request = send_request
+        self._results:   List[BatchResult] = []
+        self._callbacks: List[Optional[Callable[[Content], None]]] = []
+        self._sent = False
+
+    def add(self,
+            request:  requests.Request,
+            callback: Optional[Callable[[Content], None]] = None
+    ) -> BatchResult:
+        """Adds a request to the batch.
+
+        If `callback` is provided, it is called with the content of the response
+        to the request if the request succeeds.
+        """
+
+        if self._sent:
+            raise error.RequestError('cannot add request to batch which was already sent')
+
+        result = BatchResult(request)
+
+        self._results.append(result)
+        self._callbacks.append(callback)
+
+        return result
+
+    def results(self) -> List[BatchResult]:
+        return self._results.copy()
+
+    def send(self, timeout: Optional[float] = None):
+        """Sends all requests of the batch.
+
+        If the server does not support batches, `timeout` applies to each request.
+
+        Raises
+        ------
+        RequestError
+            If the batch could not be delivered to, or understood by the server.
+        """
+
+        if self._sent:
+            return
+
+        self._sent = True
+
+        if len(self._results) == 0:
+            return
+
+        request = requests.BatchRequest([result.request() for result in self._results])
+
+        try:
+            content  = self._send_request(request, timeout)
+            response = responses.BatchResponse(content, len(self._results))
+
+        except error.UnknownCommand:
+            self._send_one_by_one(timeout)
+            return
+
+        except (TypeError, ValueError) as e:
+            e = error.RequestError('invalid batch response: %s' % e)
+            self._fail(e)
+            raise e
+
+        except error.RMTError as e:
+            self._fail(e)
+            raise
+
+        for result, (result_code, sub_content) in zip(self._results, response.results()):
+            if sub_content is None:
+                sub_content = {}
+
+            if result_code == CommandResultCode.SUCCESS:
+                result._set_content(sub_content)
+                continue
+
+            try:
+                raise_error(result.request().command, result_code, sub_content)
+            except error.RMTError as e:
+                result._set_error(e)
+
+        self._run_callbacks()
+
+    def __enter__(self) -> 'Batch':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.send()
+
+    #===============================================================================
+    # Internals
+    #===============================================================================
+    def _send_one_by_one(self, timeout: Optional[float]):
+        for result in self._results:
+            try:
+                result._set_content(self._send_request(result.request(), timeout))
+            except error.RMTError as e:
+                result._set_error(e)
+
+        self._run_callbacks()
+
+    def _fail(self, e: error.RMTError):
+        for result in self._results:
+            result._set_error(e)
+
+    def _run_callbacks(self):
+        for result, callback in zip(self._results, self._callbacks):
+            if callback is not None and result._error is None:
+                callback(result._content)
@@ -0,0 +1,57 @@
+import struct
+from datetime import datetime, timezone
+from typing   import Iterable, List, Sequence
+from rmt      import Bar, Tick
+from rmt.bar  import _new_bar
+
+FORMAT_NAME = 'binary'
+
+# Little-endian layouts of ticks and bars, without padding:
+#
+#   tick: time (int64), bid (double), ask (double)
+#   bar:  time (int64), open, high, low, close (double), volume (int64)
+#
+# Times are seconds since the Unix epoch, as in JSON messages.
+TICK_STRUCT = struct.Struct('<qdd')
+BAR_STRUCT  = struct.Struct('<qddddq')
+
+def pack_tick(tick: Tick) -> bytes:
+    return TICK_STRUCT.pack(int(tick.server_time.timestamp()), tick.bid, tick.ask)
+
+def unpack_tick(data: bytes) -> Tick:
+    """Decodes a tick from the bytes of a binary tick event.
+
+    Raises
+    ------
+    ValueError
+        If `data` is not as long as a tick.
+    """
+
+    if len(data) != TICK_STRUCT.size:
+        raise ValueError('expected %s bytes of binary tick (got: %s)' % (TICK_STRUCT.size, len(data)))
+
+    timestamp, bid, ask = TICK_STRUCT.unpack(data)
+
+    return Tick(datetime.fromtimestamp(timestamp, timezone.utc), bid, ask)
+
+def pack_bars(bars: Iterable[Sequence]) -> bytes:
+    """Encodes bars given as sequences of time, open, high, low, close, and optional volume."""
+
+    return b''.join(BAR_STRUCT.pack(*bar) if len(bar) == 6 else BAR_STRUCT.pack(*bar, 0) for bar in bars)
+
+def unpack_bars(data: bytes) -> List[Bar]:
+    """Decodes bars from the bytes of a binary history response.
+
+    Raises
+    ------
+    ValueError
+        If the length of `data` is not a multiple of the size of a bar.
+    """
+
+    if len(data) % BAR_STRUCT.size != 0:
+        raise ValueError('expected multiple of %s bytes of binary bars (got: %s)' % (BAR_STRUCT.size, len(data)))
+
+    return [
+        _new_bar(datetime.fromtimestamp(t, timezone.utc), o, h, l, c, v)
+        for t, o, h, l, c, v in BAR_STRUCT.iter_unpack(data)
+    ]
\ No newline at end of file
@@ -1 +1,2 @@
-from .tick_event import TickEvent
\ No newline at end of file
+from .tick_event        import TickEvent
+from .binary_tick_event import BinaryTickEvent
\ No newline at end of file
@@ -0,0 +1,26 @@
+from rmt import Tick
+from ..  import binary_format
+
+class BinaryTickEvent:
+    """Tick event whose content is a tick in binary format.
+
+    Event: `btick.<symbol> <time, bid, ask as little-endian int64, double, double>`
+
+    Binary tick events of a symbol are published by the Expert Server only if
+    a client asked to watch it in binary format (see `WatchSymbolRequest`).
+    """
+
+    is_binary = True
+
+    def __init__(self, symbol: str, content: bytes):
+        if symbol == '':
+            raise ValueError("tick event name is missing instrument symbol")
+
+        self._symbol = symbol
+        self._tick   = binary_format.unpack_tick(content)
+
+    def symbol(self) -> str:
+        return self._symbol
+
+    def tick(self) -> Tick:
+        return self._tick
\ No newline at end of file
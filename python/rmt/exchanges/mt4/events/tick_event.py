@@ -3,6 +3,8 @@ from rmt      import jsonutil, Tick
 from ..       import Content
 
 class TickEvent:
+    is_binary = False
+
     def __init__(self, symbol: str, content: Content):
         if symbol == '':
             raise ValueError("tick event name is missing instrument symbol")
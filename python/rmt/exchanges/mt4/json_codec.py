@@ -0,0 +1,112 @@
+import json
+from typing import Any, Optional, Union
+from rmt    import error
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+class JsonCodec:
+    """Serializes the JSON content of messages exchanged with the Expert Server.
+
+    Description
+    -----------
+    A codec encodes the content of requests into bytes, and decodes the content of
+    responses and events straight from the bytes of a received ZMQ frame, so that
+    no intermediate `str` has to be created by the caller.
+
+    `JsonCodec.default()` returns a codec backed by `orjson` if it is installed,
+    and one backed by the standard `json` module otherwise.
+
+    Whichever library a codec is backed by, `dumps()` raises `TypeError` or
+    `ValueError` if an object is not serializable, and `loads()` raises `ValueError`
+    if a buffer is not valid UTF-8 encoded JSON.
+    """
+
+    def name(self) -> str:
+        raise error.NotImplementedException(self.__class__, 'name')
+
+    def dumps(self, obj: Any) -> bytes:
+        raise error.NotImplementedException(self.__class__, 'dumps')
+
+    def loads(self, data: Buffer) -> Any:
+        raise error.NotImplementedException(self.__class__, 'loads')
+
+    @staticmethod
+    def default() -> 'JsonCodec':
+        if orjson is not None:
+            return OrjsonCodec()
+
+        return StdJsonCodec()
+
+    @staticmethod
+    def named(name: str) -> 'JsonCodec':
+        """Returns a codec by the name of its library ('json' or 'orjson').
+
+        Raises
+        ------
+        ValueError
+            If `name` is unknown or its library is not installed.
+        """
+
+        if name == 'json':
+            return StdJsonCodec()
+
+        if name == 'orjson':
+            return OrjsonCodec()
+
+        raise ValueError("unknown JSON codec '%s'" % name)
+
+    @staticmethod
+    def of(codec: Optional[Union[str, 'JsonCodec']]) -> 'JsonCodec':
+        if codec is None:
+            return JsonCodec.default()
+
+        if isinstance(codec, JsonCodec):
+            return codec
+
+        return JsonCodec.named(codec)
+
+    def __str__(self) -> str:
+        return "JsonCodec('%s')" % self.name()
+
+class StdJsonCodec(JsonCodec):
+    """Codec backed by the standard `json` module."""
+
+    def __init__(self):
+        # Compact separators, as output by `orjson`.
+        self._encoder = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+        self._decoder = json.JSONDecoder()
+
+    def name(self) -> str:
+        return 'json'
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj).encode()
+
+    def loads(self, data: Buffer) -> Any:
+        # `json` decodes from `str` only, which costs a copy that `orjson` avoids.
+        # Copying a view into `bytes` first is faster than decoding it in place.
+        if not isinstance(data, str):
+            data = bytes(data).decode()
+
+        return self._decoder.decode(data)
+
+class OrjsonCodec(JsonCodec):
+    """Codec backed by `orjson`, which decodes from any bytes-like object."""
+
+    def __init__(self):
+        if orjson is None:
+            raise ValueError("JSON codec 'orjson' is not installed")
+
+    def name(self) -> str:
+        return 'orjson'
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def loads(self, data: Buffer) -> Any:
+        return orjson.loads(data)
\ No newline at end of file
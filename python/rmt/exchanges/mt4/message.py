@@ -0,0 +1,202 @@
+import sys
+import zmq
+from typing      import Dict, Optional, Sequence, Tuple
+from rmt         import error
+from .           import CommandResultCode, Content, raise_error
+from .json_codec import JsonCodec
+from .requests   import Request
+
+_default_codec = JsonCodec.default()
+
+def format_request(request: Request, codec: JsonCodec = _default_codec) -> bytes:
+    """Serializes a request object into a request message.
+
+    Raises
+    ------
+    RequestError
+        If request has an invalid command or its content could not be serialized.
+    """
+
+    cmd = request.command
+
+    if cmd == '':
+        raise error.RequestError("empty attribute 'command' of request object %s" % type(request))
+
+    if not cmd.isalpha():
+        raise error.RequestError("expected alphabetic command string (got: '%s')" % request.command)
+
+    try:
+        content = codec.dumps(request.content())
+    except (error.NotImplementedException, TypeError, ValueError) as e:
+        raise error.RequestError('failed to serialize JSON request: %s' % e)
+
+    return b'%s %s' % (cmd.encode(), content)
+
+def parse_response(response: bytes, codec: JsonCodec = _default_codec) -> Tuple[CommandResultCode, Optional[Content]]:
+    """Splits a response message into its result code and content.
+
+    The content is decoded by `codec` from a view of `response`, without copying it.
+    """
+
+    sep_index  = response.find(b' ')
+    cmd_result = None
+
+    if sep_index == -1:
+        cmd_result = response
+    else:
+        cmd_result = response[0:sep_index]
+
+    cmd_result = int(cmd_result)
+    content    = None
+
+    if sep_index != -1:
+        content = memoryview(response)[(sep_index + 1):]
+        content = codec.loads(content)
+
+        if not isinstance(content, (dict, list)):
+            raise ValueError(
+                'response content is not valid JSON (expected object or array, got: %s)'
+                % type(content)
+            )
+
+    return CommandResultCode(cmd_result), content
+
+def read_response(command: str, response: bytes, codec: JsonCodec = _default_codec) -> Content:
+    """Parses a response message and returns its content.
+
+    Raises
+    ------
+    RequestError
+        If the response message is malformed or the server rejected the request.
+
+    ExecutionError
+        If the server failed to execute the request.
+    """
+
+    cmd_result = None
+    content    = None
+
+    try:
+        cmd_result, content = parse_response(response, codec)
+    except ValueError as e:
+        raise error.RequestError('parsing of response message failed: %s' % e)
+
+    if content is None:
+        content = {}
+
+    if cmd_result != CommandResultCode.SUCCESS:
+        raise_error(command, cmd_result, content)
+
+    return content
+
+# Static and dynamic names of an event, keyed by the event's topic.
+TopicCache = Dict[bytes, Tuple[str, Optional[str]]]
+
+def parse_topic(topic: bytes, cache: Optional[TopicCache] = None) -> Tuple[str, Optional[str]]:
+    """Splits the topic of an event, e.g. `tick.EURUSD`, into its static and dynamic names.
+
+    The names are interned, and if `cache` is provided, they are stored in it and
+    returned by later calls for the same topic, such that the symbol of a tick
+    event is not created again for every tick.
+
+    Raises
+    ------
+    ValueError
+        If the static name is not alphabetic.
+    """
+
+    if cache is not None and topic in cache:
+        return cache[topic]
+
+    event_name = topic.decode()
+
+    static_name = None
+    dynamic_name = None
+    dynamic_name_index = event_name.find('.')
+
+    if dynamic_name_index != -1:
+        static_name  = sys.intern(event_name[0:dynamic_name_index])
+        dynamic_name = sys.intern(event_name[(dynamic_name_index + 1):])
+    else:
+        static_name = sys.intern(event_name)
+
+    if not static_name.isalpha():
+        raise ValueError("expected alphabetic static part of event name (got: '%s')" % static_name)
+
+    if cache is not None:
+        cache[topic] = (static_name, dynamic_name)
+
+    return static_name, dynamic_name
+
+def split_event(msg: bytes, cache: Optional[TopicCache] = None) -> Tuple[str, Optional[str], memoryview]:
+    """Splits an event message into its static name, dynamic name, and raw content.
+
+    Raises
+    ------
+    ValueError
+        If message name is invalid or message has no content.
+    """
+
+    content_index = msg.find(b' ')
+
+    if content_index == -1:
+        raise ValueError("missing content from event message '%s'" % msg)
+
+    static_name, dynamic_name = parse_topic(msg[:content_index], cache)
+
+    return static_name, dynamic_name, memoryview(msg)[(content_index + 1):]
+
+def split_event_frames(frames: Sequence[zmq.Frame], cache: Optional[TopicCache] = None) -> Tuple[str, Optional[str], memoryview]:
+    """Splits an event message received with `copy=False` into its static name,
+    dynamic name, and raw content.
+
+    An event message is made up of either a single frame, `<topic> <content>`, or
+    of a topic frame followed by a content frame. In the latter case, the content
+    is a view of the received frame, so it is not copied.
+
+    Raises
+    ------
+    ValueError
+        If message name is invalid or message has no content.
+    """
+
+    if len(frames) == 1:
+        return split_event(frames[0].bytes, cache)
+
+    if len(frames) != 2:
+        raise ValueError('expected 1 or 2 frames in event message (got: %s)' % len(frames))
+
+    static_name, dynamic_name = parse_topic(frames[0].bytes, cache)
+
+    return static_name, dynamic_name, frames[1].buffer
+
+def read_event_content(static_name: str, content: memoryview, codec: JsonCodec = _default_codec) -> Content:
+    """Decodes the raw JSON content of an event message.
+
+    Raises
+    ------
+    ValueError
+        If content is not a JSON object or array.
+    """
+
+    content = codec.loads(content)
+
+    if not isinstance(content, (dict, list)):
+        raise ValueError("content of event message '%s' is not valid JSON" % static_name)
+
+    return content
+
+def parse_event(msg: bytes, codec: JsonCodec = _default_codec, cache: Optional[TopicCache] = None) -> Tuple[str, Optional[str], Content]:
+    """Splits an event message into its static name, dynamic name, and content.
+
+    See `parse_topic()` for `cache`.
+
+    Raises
+    ------
+    ValueError
+        If message name is invalid or message body is not valid JSON.
+    """
+
+    static_name, dynamic_name, content = split_event(msg, cache)
+
+    return static_name, dynamic_name, read_event_content(static_name, content, codec)
\ No newline at end of file
@@ -1,68 +1,137 @@
 import zmq
-import json
+import math
 import logging
-from datetime import datetime
-from typing   import Dict, List, Optional, Set, Tuple
-from time     import sleep
+import threading
+from collections        import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime           import datetime
+from time               import monotonic
+from typing             import Deque, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 from rmt      import (error, Order, Side, OrderType,
-                      Exchange, Tick, Bar, OrderStatus,
-                      Timeframe, Instrument)
+                      Exchange, Tick, Bar,
+                      Timeframe, Instrument, HistoryRequest, HistoryResult)
 from . import *
 
 class MetaTrader4(Exchange):
-    """Bindings for executing market operations on MetaTrader 4."""
+    """Bindings for executing market operations on MetaTrader 4.
+
+    Requests are sent on a pool of up to `pool_size` REQ sockets, so that several
+    threads may send requests at the same time. Note that events are still received
+    only by the thread which calls `process_events()`, or `run()`, which waits for
+    events on a `zmq.Poller` and may be interrupted by `stop()` from any thread.
+    Alternatively, an application running a Qt event loop may call
+    `attach_to_qt_event_loop()` to have events processed by that loop as soon as
+    they are received.
+
+    If the application's thread may be busy for a while, e.g. waiting for history
+    bars, `start_tick_receiver()` makes ticks be received by a thread of its own
+    into bounded per-symbol buffers, which are then consumed by `process_events()`.
+    See `TickReceiver`. The receiver may not be used along with the Qt event loop.
+
+    If `conflate_ticks` is true, a strategy which falls behind is not notified of
+    stale ticks: each call to `process_events()` emits only the latest tick of each
+    symbol among those received since the previous call, and counts the others as
+    coalesced (see `coalesced_tick_count()`). Ticks are otherwise emitted one by one.
+
+    `process_events()` may be given a budget of events and time, so that a burst of
+    ticks does not delay requests sent by the same thread; see `Exchange.process_events()`.
+
+    If a request times out, the socket it was sent on is replaced by a new connection,
+    and the request is sent again if `retry_policy` allows it. By default, requests
+    which only read data are retried, whereas requests which place, modify, or close
+    orders are not. Pass `RetryPolicy(max_retries=0)` to disable retries.
+
+    Each request must complete within a time budget, which is given by the parameter
+    `timeout` of a method call or, if that's `None`, by `timeout_profile` according
+    to the request's command. The budget includes retries of the request. The default
+    profile, `TimeoutProfile.TESTER`, allows the Expert to be run by the MT4 Strategy
+    Tester at its slowest speed; use `TimeoutProfile.LIVE` to detect dead connections
+    more quickly when the Expert is attached to a chart.
+
+    Messages are serialized by `codec`, which defaults to the fastest JSON library
+    installed (see `JsonCodec.default()`). If `binary_format` is true and the Expert
+    Server advertises support for it, ticks and history bars are transferred in a
+    compact binary format instead (see `binary_format`). Otherwise, or if the server
+    does not know the command `getCapabilities`, JSON is used. The binary format is
+    opt-in, since asking an Expert which does not support it for its capabilities
+    costs a failed round trip.
+
+    If `bar_cache` is given, as a `BarCache` or the path of its directory, history
+    bars are stored on disk by `get_history_bars()` and `get_history_bar_series()`,
+    so that only the bars not yet stored are fetched from the Expert Server. The cache requires NumPy.
+    """
 
     def __init__(self,
-                 protocol: str = 'tcp',
-                 host:     str = 'localhost',
-                 req_port: int = 32768,
-                 sub_port: int = 32769
+                 protocol:        str = 'tcp',
+                 host:            str = 'localhost',
+                 req_port:        int = 32768,
+                 sub_port:        int = 32769,
+                 pool_size:       int = 1,
+                 retry_policy:    Optional[RetryPolicy] = None,
+                 timeout_profile: Union[str, TimeoutProfile] = TimeoutProfile.TESTER,
+                 codec:           Optional[Union[str, JsonCodec]] = None,
+                 binary_format:   bool = False,
+                 conflate_ticks:  bool = False,
+                 bar_cache:       Optional[Union[str, 'BarCache']] = None
     ):
         super().__init__()
 
         ctx = zmq.Context.instance()
-        self._req_socket = ctx.socket(zmq.REQ)
         self._sub_socket = ctx.socket(zmq.SUB)
 
-        ################################################################################
-        # Set the REP socket to wait for at most 30 seconds to send requests and at most
-        # 10 seconds to receive responses.
-        #
-        # This allows this Client to work well with the Expert Server when it is being
-        # run by the MT4 Strategy Tester.
-        #
-        # If the Strategy Tester is running the Expert Server on visual mode with a low
-        # speed, that will make the Tester invoke the Expert's `OnTick()` function very
-        # slowly, which will in turn slow down any calls to ZMQ socket functions on the
-        # Expert's end, and thus effectively reduce its receipt of Client's requests.
-        # 
-        # According to my measures, it seems that when set to the slowest possible speed,
-        # the Strategy Tester has a delay of 24 seconds between calls to `OnTick()`, so
-        # a value of 30 milliseconds to `zmq.SNDTIMEO` should suffice.
-        # 
-        # Since `OnTimer()` doesn't work while testing, this seems the only way to make
-        # this work. Otherwise, the Client will keep raising `error.RequestTimeout`.
-        #
-        # The receive timeout, on the other hand, is not affected by the Strategy Tester
-        # in any way. It is set here nonetheless just in case connection with the Expert
-        # drops, in which case a request won't take forever to complete. 10 milliseconds
-        # should be more than enough for that. But maybe turn this into a parameter for
-        # `__init__()`?
-        ################################################################################
-        self._req_socket.setsockopt(zmq.SNDTIMEO, 30000)
-        self._req_socket.setsockopt(zmq.RCVTIMEO, 10000)
+        # Wakes up a thread blocked in `wait_for_events()` when `stop()` is called.
+        wakeup_addr = 'inproc://rmt-mt4-wakeup-%s' % id(self)
+
+        self._wakeup_pull = ctx.socket(zmq.PULL)
+        self._wakeup_pull.bind(wakeup_addr)
+        self._wakeup_push = ctx.socket(zmq.PUSH)
+        self._wakeup_push.connect(wakeup_addr)
+        self._wakeup_lock = threading.Lock()
+
+        self._poller = zmq.Poller()
+        self._poller.register(self._sub_socket,  zmq.POLLIN)
+        self._poller.register(self._wakeup_pull, zmq.POLLIN)
+
+        self._req_pool        = ReqSocketPool(pool_size)
+        self._timeout_profile = TimeoutProfile.of(timeout_profile)
+        self._codec           = JsonCodec.of(codec)
+
+        # Whether to use the binary format, or `None` until the server is asked.
+        self._binary_format: Optional[bool] = None if binary_format else False
+
+        self._retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
 
         self._subscribed_symbols: Set[str] = set()
+        self._subscribed_all = False
         self._logger = logging.getLogger(MetaTrader4.__name__)
 
         self._instruments: Dict[str, Instrument] = {}
 
+        if isinstance(bar_cache, str):
+            from rmt.bar_cache import BarCache
+            bar_cache = BarCache(bar_cache)
+
+        self._bar_cache: Optional['BarCache'] = bar_cache
+
         self._orders: Dict[int, Order] = {}
 
         self._event_factory = {
-            'tick': (events.TickEvent, lambda e: self.tick_received.emit(e.symbol(), e.tick()))
+            'tick':  (events.TickEvent,       lambda e: self._on_tick(e.symbol(), e.tick())),
+            'btick': (events.BinaryTickEvent, lambda e: self._on_tick(e.symbol(), e.tick()))
         }
 
+        self._conflate_ticks = conflate_ticks
+
+        # Latest tick of each symbol, until emitted at the end of `process_events()`.
+        self._conflated_ticks: Dict[str, Tick] = {}
+        self._coalesced_ticks: Dict[str, int]  = {}
+
+        self._event_topics: message.TopicCache = {}
+
+        self._qt_notifier:   Optional['QtEventNotifier'] = None
+        self._tick_receiver: Optional[TickReceiver]      = None
+        self._sub_addr:      Optional[str]               = None
+
         self.connect(protocol, host, req_port, sub_port)
 
     def connect(self,
@@ -74,45 +143,92 @@ class MetaTrader4(Exchange):
         addr_prefix = protocol + '://' + host + ':%s'
 
         req_addr = addr_prefix % req_port
-        self._req_socket.connect(req_addr)
-        self._logger.info('Ready to send commands on (REQ) socket: %s', req_addr)
+        self._req_pool.connect(req_addr)
+        self._logger.info('Ready to send commands on (REQ) sockets: %s', req_addr)
 
         sub_addr = addr_prefix % sub_port
         self._sub_socket.connect(sub_addr)
+        self._sub_addr = sub_addr
         self._logger.info('Ready to receive quotes on (PULL) socket: %s', sub_addr)
 
     def disconnect(self):
-        self._req_socket.close()
+        self.detach_from_qt_event_loop()
+        self.stop_tick_receiver()
+        self._req_pool.close()
         self._sub_socket.close()
+        self._wakeup_pull.close()
+
+        with self._wakeup_lock:
+            self._wakeup_push.close(linger=0)
+
+    def timeout_profile(self) -> TimeoutProfile:
+        return self._timeout_profile
+
+    def set_timeout_profile(self, timeout_profile: Union[str, TimeoutProfile]):
+        self._timeout_profile = TimeoutProfile.of(timeout_profile)
+
+    def conflates_ticks(self) -> bool:
+        return self._conflate_ticks
+
+    def set_conflate_ticks(self, conflate_ticks: bool):
+        self._conflate_ticks = conflate_ticks
+
+    def coalesced_tick_count(self, symbol: Optional[str] = None) -> int:
+        """Number of ticks which were not emitted because a later tick of the same
+        symbol was processed at once, of `symbol` or of all symbols.
+        """
 
-    def get_tick(self, symbol: str) -> Tick:
+        if symbol is not None:
+            return self._coalesced_ticks.get(symbol, 0)
+
+        return sum(self._coalesced_ticks.values())
+
+    def codec(self) -> JsonCodec:
+        return self._codec
+
+    def bar_cache(self) -> Optional['BarCache']:
+        """Returns the cache of history bars, whose hit ratio tells how many bars
+        were read from disk instead of being fetched, or `None` if bars are not cached."""
+
+        return self._bar_cache
+
+    def uses_binary_format(self, timeout: Optional[float] = None) -> bool:
+        """Returns whether ticks and bars are transferred in binary format.
+
+        The first call asks the Expert Server for its capabilities, unless the binary
+        format was disabled on construction.
+        """
+
+        if self._binary_format is None:
+            request = requests.GetCapabilitiesRequest()
+
+            try:
+                response = responses.GetCapabilitiesResponse(self._send_request(request, timeout))
+                self._binary_format = binary_format.FORMAT_NAME in response.formats()
+            except error.UnknownCommand:
+                self._binary_format = False
+
+            self._logger.info('Using %s format for ticks and bars', 'binary' if self._binary_format else 'JSON')
+
+        return self._binary_format
+
+    def socket_pool_metrics(self) -> SocketPoolMetrics:
+        """Returns usage metrics of the pool of REQ sockets."""
+
+        return self._req_pool.metrics()
+
+    def get_tick(self, symbol: str, timeout: Optional[float] = None) -> Tick:
         request  = requests.GetTickRequest(symbol)
-        response = responses.GetTickResponse(self._send_request(request))
+        response = responses.GetTickResponse(self._send_request(request, timeout))
         
         return response.tick()
 
-    def get_instrument(self, symbol: str) -> Instrument:
+    def get_instrument(self, symbol: str, timeout: Optional[float] = None) -> Instrument:
         if symbol not in self._instruments:
             request  = requests.GetInstrumentRequest(symbol)
-            response = responses.GetInstrumentResponse(self._send_request(request))
-
-            instrument = Instrument(
-                symbol          = symbol,
-                description     = response.description(),
-                base_currency   = response.base_currency(),
-                profit_currency = response.profit_currency(),
-                margin_currency = response.margin_currency(),
-                decimal_places  = response.decimal_places(),
-                point           = response.point(),
-                tick_size       = response.tick_size(),
-                contract_size   = response.contract_size(),
-                lot_step        = response.lot_step(),
-                min_lot         = response.min_lot(),
-                max_lot         = response.max_lot(),
-                min_stop_level  = response.min_stop_level(),
-                freeze_level    = response.freeze_level(),
-                spread          = response.spread()
-            )
+            response = responses.GetInstrumentResponse(self._send_request(request, timeout))
+
+            instrument = response.instrument(symbol)
 
             self._instruments[symbol] = instrument
 
@@ -122,50 +238,167 @@ class MetaTrader4(Exchange):
                          symbol: str,
                          start_time: Optional[datetime] = None,
                          end_time:   Optional[datetime] = None,
-                         timeframe:  Timeframe = Timeframe.M1
+                         timeframe:  Timeframe = Timeframe.M1,
+                         timeout:    Optional[float] = None
     ) -> List[Bar]:
-        request  = requests.GetHistoryBarsRequest(symbol, start_time, end_time, timeframe)
-        response = responses.GetHistoryBarsResponse(self._send_request(request))
-        
-        return response.bars()
+        if self._bar_cache is not None:
+            return self.get_history_bar_series(symbol, start_time, end_time, timeframe, timeout).to_list()
+
+        return self._fetch_history_bars(symbol, start_time, end_time, timeframe, timeout)
+
+    def get_history_bars_many(self,
+                              requests:    Iterable[HistoryRequest],
+                              max_workers: Optional[int]   = None,
+                              timeout:     Optional[float] = None
+    ) -> Iterator[HistoryResult]:
+        """Fetches the history bars of several symbols or timeframes over concurrent
+        connections. See `Exchange.get_history_bars_many()`.
+
+        Each worker sends its requests on a socket of the pool, so at most `pool_size`
+        requests are in flight at once, and `max_workers` defaults to `pool_size`. The
+        Expert Server still handles requests one at a time, but their network round
+        trips overlap, which is where most of the time goes for small requests.
+        """
+
+        if max_workers is None:
+            max_workers = self._req_pool.size()
+
+        return super().get_history_bars_many(requests, max_workers, timeout)
+
+    def get_history_bar_series(self,
+                               symbol:     str,
+                               start_time: Optional[datetime] = None,
+                               end_time:   Optional[datetime] = None,
+                               timeframe:  Timeframe = Timeframe.M1,
+                               timeout:    Optional[float] = None
+    ) -> 'BarSeries':
+        """Returns history bars as a `BarSeries`, built straight from the response
+        without creating `Bar` objects. Requires NumPy."""
+
+        if self._bar_cache is not None:
+            return self._bar_cache.get_history_bar_series(
+                symbol, start_time, end_time, timeframe,
+                lambda start, end: self._history_bars_response(symbol, start, end, timeframe, timeout).bar_series()
+            )
+
+        return self._history_bars_response(symbol, start_time, end_time, timeframe, timeout).bar_series()
+
+    def iter_history_bars(self,
+                          symbol:     str,
+                          start_time: datetime,
+                          end_time:   Optional[datetime] = None,
+                          timeframe:  Timeframe = Timeframe.M1,
+                          chunk_size: int = 10000,
+                          timeout:    Optional[float] = None,
+                          prefetch:   int = 2
+    ) -> Iterator[List[Bar]]:
+        """Yields the bars of an instrument in chunks. See `Exchange.iter_history_bars()`.
+
+        Up to `prefetch` windows are requested ahead of the chunk being consumed, on
+        threads of their own, so that the round trip of a request overlaps with the
+        decoding of another and with the consumer's work. At most `prefetch` + 1
+        chunks are held at once. Requests are sent at the same time if the socket
+        pool has that many sockets; otherwise they queue for a socket.
+
+        Bars are fetched from the Expert Server, even if a bar cache is given.
+        """
+
+        windows = self._history_windows(symbol, start_time, end_time, timeframe, chunk_size, timeout)
+
+        if prefetch < 1:
+            for window_start, window_end in windows:
+                bars = self._fetch_history_bars(symbol, window_start, window_end, timeframe, timeout)
+
+                if bars:
+                    yield bars
+
+            return
+
+        executor = ThreadPoolExecutor(prefetch, thread_name_prefix='rmt-history')
+        pending: Deque[Future] = deque()
+
+        try:
+            for window_start, window_end in windows:
+                pending.append(executor.submit(
+                    self._fetch_history_bars, symbol, window_start, window_end, timeframe, timeout
+                ))
+
+                if len(pending) > prefetch:
+                    bars = pending.popleft().result()
+
+                    if bars:
+                        yield bars
+
+            while pending:
+                bars = pending.popleft().result()
+
+                if bars:
+                    yield bars
+        finally:
+            # Windows not yet requested are dropped if the consumer stops early.
+            for future in pending:
+                future.cancel()
+
+            executor.shutdown(wait=False)
 
     def get_current_bar(self,
                         symbol:    str,
-                        timeframe: Timeframe = Timeframe.M1
+                        timeframe: Timeframe = Timeframe.M1,
+                        timeout:   Optional[float] = None
     ) -> Bar:
         request  = requests.GetCurrentBarRequest(symbol, timeframe)
-        response = responses.GetCurrentBarResponse(self._send_request(request))
+        response = responses.GetCurrentBarResponse(self._send_request(request, timeout))
 
         return response.bar()
 
-    def subscribe(self, symbol: str):
+    def subscribe(self,
+                  symbol:  str,
+                  timeout: Optional[float] = None,
+                  batch:   Optional[Batch] = None
+    ):
+        """Begins to receive quote updates of an instrument.
+
+        If `batch` is provided, the subscription request is added to that batch
+        and takes effect once the batch is sent. See `Exchange.subscribe()`.
+        """
+
         if symbol in self._subscribed_symbols:
             return
 
-        request = requests.WatchSymbolRequest(symbol)
-        self._send_request(request)
+        request = requests.WatchSymbolRequest(symbol, self.uses_binary_format(timeout))
 
-        self._sub_socket.subscribe('tick.' + symbol)
-        self._subscribed_symbols.add(symbol)
+        if batch is not None:
+            batch.add(request, lambda _: self._add_subscription(symbol))
+            return
 
-    def subscribe_all(self):
-        request  = requests.WatchSymbolRequest('*')
-        response = responses.WatchSymbolResponse(self._send_request(request))
-        
-        for symbol in response.symbols():
-            if isinstance(symbol, str):
-                self._sub_socket.subscribe('tick.' + symbol)
-                self._subscribed_symbols.add(symbol)
+        self._send_request(request, timeout)
+        self._add_subscription(symbol)
+
+    def subscribe_all(self, timeout: Optional[float] = None):
+        if self._subscribed_all:
+            return
+
+        request = requests.WatchSymbolRequest('*', self.uses_binary_format(timeout))
+        self._send_request(request, timeout)
+
+        # The Expert does not tell which symbols it watches, so subscribe to the
+        # topic prefix shared by tick events of all symbols.
+        self._subscribe_topic(self._tick_topic())
+        self._subscribed_all = True
 
     def unsubscribe(self, symbol: str):
         if symbol in self._subscribed_symbols:
-            self._sub_socket.unsubscribe('tick.' + symbol)
+            self._unsubscribe_topic(self._tick_topic() + symbol)
             self._subscribed_symbols.remove(symbol)
 
     def unsubscribe_all(self):
         for symbol in self._subscribed_symbols:
-            self._sub_socket.unsubscribe('tick' + symbol)
-        
+            self._unsubscribe_topic(self._tick_topic() + symbol)
+
+        if self._subscribed_all:
+            self._unsubscribe_topic(self._tick_topic())
+            self._subscribed_all = False
+
         self._subscribed_symbols.clear()
 
     def subscriptions(self) -> Set[str]:
@@ -182,33 +415,13 @@ class MetaTrader4(Exchange):
                     take_profit:  Optional[float] = None,
                     comment:      str = '',
                     magic_number: int = 0,
-                    expiration:   Optional[datetime] = None
+                    expiration:   Optional[datetime] = None,
+                    timeout:      Optional[float]    = None
     ) -> int:
         if symbol == '':
             raise ValueError('instrument symbol must not be empty')
 
-        if side not in [Side.BUY, Side.SELL]:
-            raise ValueError(
-                "invalid value %s for type '%s'"
-                % (side, type(Side))
-            )
-
-        opcode = None
-
-        if order_type == OrderType.MARKET_ORDER:
-            opcode = OperationCode.BUY if side == Side.BUY else OperationCode.SELL
-
-        elif order_type == OrderType.LIMIT_ORDER:
-            opcode = OperationCode.BUY_LIMIT if side == Side.BUY else OperationCode.SELL_LIMIT
-
-        elif order_type == OrderType.STOP_ORDER:
-            opcode = OperationCode.BUY_STOP if side == Side.BUY else OperationCode.SELL_STOP
-
-        else:
-            raise ValueError(
-                "invalid value %s for type '%s'"
-                % (order_type, type(OrderType))
-            )
+        opcode = OperationCode.from_order(side, order_type)
 
         request = requests.PlaceOrderRequest(
             symbol,
@@ -223,9 +436,9 @@ class MetaTrader4(Exchange):
             expiration
         )
 
-        response = responses.PlaceOrderResponse(self._send_request(request))
+        response = responses.PlaceOrderResponse(self._send_request(request, timeout))
 
-        order_info = response.order_info()
+        order = response.order(request)
 
         ################################################################################
         # Add order to list of tracked orders if the response also contains information
@@ -244,37 +457,7 @@ class MetaTrader4(Exchange):
         # info about the order again from the server. In that case, if OrderSelect()
         # fails another time, *then* an exception is raised.
         ################################################################################
-        if order_info is not None:
-            status = None
-
-            if order_type == OrderType.MARKET_ORDER:
-                if order_info.lots() < lots:
-                    status = OrderStatus.PARTIALLY_FILLED
-                else:
-                    status = OrderStatus.FILLED
-            else:
-                status = OrderStatus.PENDING
-
-            order = Order(
-                symbol       = symbol,
-                side         = side,
-                type         = order_type,
-                lots         = order_info.lots(),
-                status       = status,
-                open_price   = order_info.open_price(),
-                open_time    = order_info.open_time(),
-                close_price  = None,
-                close_time   = None,
-                expiration   = expiration,
-                stop_loss    = stop_loss,
-                take_profit  = take_profit,
-                magic_number = int(magic_number),
-                comment      = str(comment),
-                commission   = order_info.commission(),
-                profit       = order_info.profit(),
-                swap         = order_info.swap(),
-            )
-
+        if order is not None:
             self._orders[response.ticket()] = order
 
         return response.ticket()
@@ -284,7 +467,8 @@ class MetaTrader4(Exchange):
                      stop_loss:   Optional[float]    = None,
                      take_profit: Optional[float]    = None,
                      price:       Optional[float]    = None,
-                     expiration:  Optional[datetime] = None
+                     expiration:  Optional[datetime] = None,
+                     timeout:     Optional[float]    = None
     ):
         request = requests.ModifyOrderRequest(
             ticket,
@@ -294,7 +478,7 @@ class MetaTrader4(Exchange):
             expiration
         )
 
-        self._send_request(request)
+        self._send_request(request, timeout)
 
         # order._stop_loss   = float(stop_loss)
         # order._take_profit = float(take_profit)
@@ -309,10 +493,11 @@ class MetaTrader4(Exchange):
                     ticket:   int,
                     price:    Optional[float] = None,
                     slippage: int             = 0,
-                    lots:     Optional[float] = None
+                    lots:     Optional[float] = None,
+                    timeout:  Optional[float] = None
     ) -> int:
         request  = requests.CloseOrderRequest(ticket, price, slippage, lots)
-        response = responses.CloseOrderResponse(self._send_request(request))
+        response = responses.CloseOrderResponse(self._send_request(request, timeout))
 
         # order._status      = OrderStatus.CLOSED
         # order._lots        = response.lots()
@@ -346,100 +531,350 @@ class MetaTrader4(Exchange):
 
         return ticket
 
-    def get_order(self, ticket: int) -> Order:
+    def get_order(self, ticket: int, timeout: Optional[float] = None) -> Order:
         if ticket not in self._orders:
             request  = requests.GetOrderRequest(ticket)
-            response = responses.GetOrderResponse(self._send_request(request))
+            response = responses.GetOrderResponse(self._send_request(request, timeout))
 
             self._orders[ticket] = response.order()
 
         return self._orders[ticket]
 
-    def process_events(self):
-        while True:
+    def batch(self) -> Batch:
+        """Returns a batch of requests to be sent in one round trip. See `Batch`."""
+
+        return Batch(self._send_request)
+
+    def process_events(self,
+                       max_events: Optional[int]   = None,
+                       max_time:   Optional[float] = None
+    ) -> Tuple[int, bool]:
+        """Notifies the events received so far. See `Exchange.process_events()`.
+
+        If ticks are conflated, the ticks processed are emitted once the budget is
+        spent, so at most one tick per symbol and no more than `max_events` ticks.
+        """
+
+        deadline = None if max_time is None else monotonic() + max_time
+
+        if self._tick_receiver is not None:
+            handled, backlog_remains = self._process_received_ticks(max_events, deadline)
+        else:
+            handled, backlog_remains = self._process_sub_socket_events(max_events, deadline)
+
+        if self._conflated_ticks:
+            self._emit_conflated_ticks()
+
+        return handled, backlog_remains
+
+    def attach_to_qt_event_loop(self,
+                                max_events: Optional[int]   = None,
+                                max_time:   Optional[float] = None
+    ):
+        """Processes events from the Qt event loop of the calling thread.
+
+        Events are processed as soon as they are received, without a polling timer,
+        for as long as the Qt event loop runs. See `QtEventNotifier`. Each iteration
+        of the Qt event loop processes at most `max_events` events and `max_time`
+        seconds of events, as by `process_events()`.
+        """
+
+        # Imported from the package, which imports PyQt5 on first use only.
+        from . import QtEventNotifier
+
+        if QtEventNotifier is None:
+            raise RuntimeError('cannot attach to Qt event loop without PyQt5 installed')
+
+        if self._tick_receiver is not None:
+            raise RuntimeError('cannot attach to Qt event loop while tick receiver is running')
+
+        if self._qt_notifier is None:
+            self._qt_notifier = QtEventNotifier(
+                self._sub_socket,
+                lambda: self.process_events(max_events, max_time)
+            )
+
+    def detach_from_qt_event_loop(self):
+        if self._qt_notifier is not None:
+            self._qt_notifier.set_enabled(False)
+            self._qt_notifier.deleteLater()
+            self._qt_notifier = None
+
+    def start_tick_receiver(self, capacity: int = 1024):
+        """Starts receiving ticks on a thread of its own, buffering up to `capacity`
+        ticks per symbol until they are processed by `process_events()`.
+
+        Ticks received but not yet processed when the receiver starts are discarded,
+        as they would otherwise be notified after the receiver's later ticks.
+        """
+
+        if self._tick_receiver is not None:
+            return
+
+        if self._qt_notifier is not None:
+            raise RuntimeError('tick receiver may not be started while attached to a Qt event loop')
+
+        self._tick_receiver = TickReceiver(self._sub_addr, capacity, self._codec)
+
+        # Moves subscriptions over to the receiver's socket, so that ticks are not
+        # received twice. `process_events()` reads only from the receiver from now
+        # on, so ticks queued on the former socket are dropped.
+        for topic in self._subscribed_topics():
+            self._sub_socket.unsubscribe(topic)
+            self._tick_receiver.subscribe(topic)
+
+        self._discard_sub_socket_events()
+        self._tick_receiver.start()
+
+    def stop_tick_receiver(self):
+        """Stops receiving ticks on a thread of its own. Buffered ticks are discarded."""
+
+        if self._tick_receiver is None:
+            return
+
+        receiver = self._tick_receiver
+        self._tick_receiver = None
+
+        # Ticks which reached the former socket before its unsubscription took effect
+        # are older than those received by the receiver, so they are dropped too.
+        self._discard_sub_socket_events()
+
+        for topic in self._subscribed_topics():
+            self._sub_socket.subscribe(topic)
+
+        receiver.stop()
+
+    def tick_receiver_metrics(self) -> Optional[TickReceiverMetrics]:
+        """Returns metrics of the tick receiver, or `None` if it is not started."""
+
+        if self._tick_receiver is None:
+            return None
+
+        return self._tick_receiver.metrics()
+
+    def wait_for_events(self, timeout: Optional[float] = None) -> bool:
+        if self._tick_receiver is not None:
+            return self._tick_receiver.wait(timeout)
+
+        # Round up, lest a wait shorter than a millisecond turns into a busy loop.
+        timeout_ms = None if timeout is None else math.ceil(max(0, timeout) * 1000)
+        sockets    = dict(self._poller.poll(timeout_ms))
+
+        if self._wakeup_pull in sockets:
             try:
-                event_msg = self._sub_socket.recv_string(zmq.DONTWAIT)
-                
-                self._logger.debug('received event message: %s', event_msg)
-                self._process_event(event_msg)
+                while True:
+                    self._wakeup_pull.recv(zmq.DONTWAIT)
+            except zmq.error.Again:
+                pass
+
+        return self._sub_socket in sockets
+
+    def stop(self):
+        super().stop()
 
+        receiver = self._tick_receiver
+
+        if receiver is not None:
+            receiver.interrupt()
+
+        with self._wakeup_lock:
+            if self._wakeup_push.closed:
+                return
+
+            try:
+                self._wakeup_push.send(b'', zmq.DONTWAIT)
             except zmq.error.Again:
-                break
-            except (ValueError, TypeError) as e:
-                self._logger.warning('failed to read event msg: %s', e)
+                # Enough wake-ups are queued already.
+                pass
 
     #===============================================================================
     # Internals (U Can't Touch This)
     #===============================================================================
-    def _parse_response(self, response: str) -> Tuple[CommandResultCode, Optional[Content]]:
-        sep_index  = response.find(' ')
-        cmd_result = None
+    def _fetch_history_bars(self,
+                            symbol:     str,
+                            start_time: Optional[datetime],
+                            end_time:   Optional[datetime],
+                            timeframe:  Timeframe,
+                            timeout:    Optional[float]
+    ) -> List[Bar]:
+        return self._history_bars_response(symbol, start_time, end_time, timeframe, timeout).bars()
+
+    def _history_bars_response(self,
+                               symbol:     str,
+                               start_time: Optional[datetime],
+                               end_time:   Optional[datetime],
+                               timeframe:  Timeframe,
+                               timeout:    Optional[float]
+    ) -> responses.GetHistoryBarsResponse:
+        binary  = self.uses_binary_format(timeout)
+        request = requests.GetHistoryBarsRequest(symbol, start_time, end_time, timeframe, binary)
+
+        return responses.GetHistoryBarsResponse(*self._send_binary_request(request, timeout))
+
+    def _tick_topic(self) -> str:
+        return 'btick.' if self._binary_format else 'tick.'
+
+    def _subscribed_topics(self) -> List[str]:
+        topics = [self._tick_topic() + symbol for symbol in self._subscribed_symbols]
+
+        if self._subscribed_all:
+            topics.append(self._tick_topic())
 
-        if sep_index == -1:
-            cmd_result = response
+        return topics
+
+    def _add_subscription(self, symbol: str):
+        self._subscribe_topic(self._tick_topic() + symbol)
+        self._subscribed_symbols.add(symbol)
+
+    def _subscribe_topic(self, topic: str):
+        if self._tick_receiver is not None:
+            self._tick_receiver.subscribe(topic)
         else:
-            cmd_result = response[0:sep_index]
+            self._sub_socket.subscribe(topic)
+            self._sub_socket_changed()
 
-        cmd_result = int(cmd_result)
-        content    = None
+    def _unsubscribe_topic(self, topic: str):
+        if self._tick_receiver is not None:
+            self._tick_receiver.unsubscribe(topic)
+        else:
+            self._sub_socket.unsubscribe(topic)
+            self._sub_socket_changed()
 
-        if sep_index != -1:
-            content = response[(sep_index + 1):]
-            content = json.loads(content)
+    def _sub_socket_changed(self):
+        # An operation on the SUB socket may consume the signal of its descriptor.
+        if self._qt_notifier is not None:
+            self._qt_notifier.check()
 
-            if not isinstance(content, (dict, list)):
-                raise ValueError(
-                    'response content is not valid JSON (expected object or array, got: %s)'
-                    % type(content)
-                )
-        
-        return CommandResultCode(cmd_result), content
+    def _send_request(self, request: requests.Request, timeout: Optional[float] = None) -> Content:
+        content, _ = self._send_binary_request(request, timeout)
 
-    def _send_request(self, request: requests.Request) -> Content:
-        cmd = request.command
+        return content
 
-        if cmd == '':
-            raise error.RequestError("empty attribute 'command' of request object %s" % type(request))
-        
-        if not cmd.isalpha():
-            raise error.RequestError("expected alphabetic command string (got: '%s')" % request.command)
+    def _send_binary_request(self,
+                             request: requests.Request,
+                             timeout: Optional[float] = None
+    ) -> Tuple[Content, Optional[bytes]]:
+        """Sends a request and returns the content of its response, along with the
+        binary data frame of the response, if any.
+        """
 
-        try:
-            content      = json.dumps(request.content())
-            request: str = '%s %s' % (cmd, content)            
-        except (error.NotImplementedException, ValueError) as e:
-            raise error.RequestError('failed to serialize JSON request: %s' % e)
+        cmd          = request.command
+        retry_policy = self._retry_policy if self._retry_policy.is_retryable(request) else None
+        request      = message.format_request(request, self._codec)
 
-        response: str = ''
+        if timeout is None:
+            timeout = self._timeout_profile.timeout(cmd)
 
-        try:
-            self._req_socket.send_string(request)
-            self._logger.debug('sent request: %s', request)
+        self._logger.debug('sending request: %s', request)
 
-            response = self._req_socket.recv_string()
-            self._logger.debug('received response: %s', response)
+        frames = self._req_pool.request(request, timeout, retry_policy)
 
-        except zmq.error.Again:
-            sleep(0.000000001)
-            raise error.RequestTimeout()
+        self._logger.debug('received response: %s', frames[0])
+
+        content = message.read_response(cmd, frames[0], self._codec)
+        data    = frames[1] if len(frames) > 1 else None
+
+        return content, data
+
+    def _on_tick(self, symbol: str, tick: Tick):
+        if not self._conflate_ticks:
+            self.tick_received.emit(symbol, tick)
+            return
+
+        if symbol in self._conflated_ticks:
+            self._coalesced_ticks[symbol] = self._coalesced_ticks.get(symbol, 0) + 1
+
+        self._conflated_ticks[symbol] = tick
+
+    def _emit_conflated_ticks(self):
+        ticks = self._conflated_ticks
+        self._conflated_ticks = {}
+
+        for symbol, tick in ticks.items():
+            self.tick_received.emit(symbol, tick)
+
+    def _process_sub_socket_events(self,
+                                   max_events: Optional[int],
+                                   deadline:   Optional[float]
+    ) -> Tuple[int, bool]:
+        handled = 0
+
+        while not self._budget_spent(handled, max_events, deadline):
+            try:
+                event_frames = self._sub_socket.recv_multipart(zmq.DONTWAIT, copy=False)
+            except zmq.error.Again:
+                return handled, False
+
+            handled += 1
+
+            try:
+                self._logger.debug('received event message: %s', event_frames)
+                self._process_event(event_frames)
+            except (ValueError, TypeError) as e:
+                self._logger.warning('failed to read event msg: %s', e)
+
+        return handled, bool(self._sub_socket.getsockopt(zmq.EVENTS) & zmq.POLLIN)
+
+    def _process_received_ticks(self,
+                                max_events: Optional[int],
+                                deadline:   Optional[float]
+    ) -> Tuple[int, bool]:
+        receiver = self._tick_receiver
 
-        cmd_result = None
-        content    = None
+        if max_events is None and deadline is None:
+            handled = 0
+
+            if not self._conflate_ticks:
+                for symbol, tick in receiver.drain():
+                    self.tick_received.emit(symbol, tick)
+                    handled += 1
+
+                return handled, False
+
+            for symbol, tick, coalesced in receiver.drain_latest():
+                if coalesced != 0:
+                    self._coalesced_ticks[symbol] = self._coalesced_ticks.get(symbol, 0) + coalesced
+
+                self._on_tick(symbol, tick)
+                handled += 1 + coalesced
+
+            return handled, False
+
+        handled = 0
+        ticks   = receiver.take()
+
+        while not self._budget_spent(handled, max_events, deadline):
+            item = next(ticks, None)
+
+            if item is None:
+                return handled, False
+
+            self._on_tick(*item)
+            handled += 1
+
+        return handled, receiver.has_ticks()
+
+    def _discard_sub_socket_events(self):
+        discarded = 0
 
         try:
-            cmd_result, content = self._parse_response(response)
-        except ValueError as e:
-            raise error.RequestError('parsing of response message failed: %s' % e)
+            while True:
+                self._sub_socket.recv_multipart(zmq.DONTWAIT, copy=False)
+                discarded += 1
+        except zmq.error.Again:
+            pass
 
-        if content is None:
-            content = {}
+        if discarded != 0:
+            self._logger.debug('discarded %s event messages queued on SUB socket', discarded)
 
-        if cmd_result != CommandResultCode.SUCCESS:
-            raise_error(cmd, cmd_result, content)
+    @staticmethod
+    def _budget_spent(handled: int, max_events: Optional[int], deadline: Optional[float]) -> bool:
+        if max_events is not None and handled >= max_events:
+            return True
 
-        return content
+        return deadline is not None and monotonic() >= deadline
 
-    def _process_event(self, msg: str):
+    def _process_event(self, frames: List[zmq.Frame]):
         """Parses, validates, and notifies an event message.
 
         Raises
@@ -451,36 +886,7 @@ class MetaTrader4(Exchange):
             If message body is of an invalid type or has a required value of an invalid type.
         """
 
-        content_index = msg.find(' ')
-        
-        if content_index == -1:
-            raise ValueError("missing content from event message '%s'" % msg)
-        
-        content = None
-
-        try:
-            content = msg[(content_index + 1):]
-        except:
-            raise ValueError("missing content from event message '%s'" % msg)
-
-        content    = json.loads(content)
-        event_name = msg[:content_index]
-
-        if not isinstance(content, (dict, list)):
-            raise ValueError("content of event message '%s' is not valid JSON", event_name)
-
-        static_name = None
-        dynamic_name = None
-        dynamic_name_index = event_name.find('.')
-
-        if dynamic_name_index != -1:
-            static_name  = event_name[0:dynamic_name_index]
-            dynamic_name = event_name[(dynamic_name_index + 1):]
-        else:
-            static_name = event_name
-
-        if not static_name.isalpha():
-            raise ValueError("expected alphabetic static part of event name (got: '%s')" % static_name)
+        static_name, dynamic_name, content = message.split_event_frames(frames, self._event_topics)
 
         if static_name not in self._event_factory:
             raise ValueError("received event message with unknown name '%s'" % static_name)
@@ -490,9 +896,12 @@ class MetaTrader4(Exchange):
         event_emitter = event_data[1]
         event_obj     = None
 
+        if not EventType.is_binary:
+            content = message.read_event_content(static_name, content, self._codec)
+
         if dynamic_name is not None:
             event_obj = EventType(dynamic_name, content)
         else:
             event_obj = EventType(static_name, content)
 
-        event_emitter(event_obj)
+        event_emitter(event_obj)
\ No newline at end of file
@@ -1,4 +1,5 @@
 from enum import IntEnum
+from rmt  import Side, OrderType
 
 class OperationCode(IntEnum):
     BUY        = 0
@@ -6,4 +7,49 @@ class OperationCode(IntEnum):
     BUY_LIMIT  = 2
     SELL_LIMIT = 3
     BUY_STOP   = 4
-    SELL_STOP  = 5
\ No newline at end of file
+    SELL_STOP  = 5
+
+    @staticmethod
+    def from_order(side: Side, order_type: OrderType) -> 'OperationCode':
+        """Returns the operation code of an order with a given side and type.
+
+        Raises
+        ------
+        ValueError
+            If `side` or `order_type` is invalid.
+        """
+
+        if side not in [Side.BUY, Side.SELL]:
+            raise ValueError(
+                "invalid value %s for type '%s'"
+                % (side, type(Side))
+            )
+
+        if order_type == OrderType.MARKET_ORDER:
+            return OperationCode.BUY if side == Side.BUY else OperationCode.SELL
+
+        elif order_type == OrderType.LIMIT_ORDER:
+            return OperationCode.BUY_LIMIT if side == Side.BUY else OperationCode.SELL_LIMIT
+
+        elif order_type == OrderType.STOP_ORDER:
+            return OperationCode.BUY_STOP if side == Side.BUY else OperationCode.SELL_STOP
+
+        else:
+            raise ValueError(
+                "invalid value %s for type '%s'"
+                % (order_type, type(OrderType))
+            )
+
+    def side(self) -> Side:
+        if self in [OperationCode.BUY, OperationCode.BUY_LIMIT, OperationCode.BUY_STOP]:
+            return Side.BUY
+        else:
+            return Side.SELL
+
+    def order_type(self) -> OrderType:
+        if self in [OperationCode.BUY, OperationCode.SELL]:
+            return OrderType.MARKET_ORDER
+        elif self in [OperationCode.BUY_LIMIT, OperationCode.SELL_LIMIT]:
+            return OrderType.LIMIT_ORDER
+        else:
+            return OrderType.STOP_ORDER
\ No newline at end of file
@@ -0,0 +1,90 @@
+import zmq
+from typing       import Callable, Optional
+from PyQt5.QtCore import QObject, QSocketNotifier, QTimer, pyqtSlot
+
+class QtEventNotifier(QObject):
+    """Processes events received on a ZMQ socket from the running Qt event loop.
+
+    Description
+    -----------
+    The file descriptor of a ZMQ socket, `zmq.FD`, is not readable whenever
+    messages are queued on the socket, as for a regular socket. Instead, it
+    signals that the state of the socket may have changed, and only does so on
+    edges. The actual state must then be read from `zmq.EVENTS`, which may in
+    turn consume a pending signal, as does any operation on the socket, such as
+    `recv()` or `subscribe()`.
+
+    This class thus reads `zmq.EVENTS` after the descriptor is signaled, and calls
+    `process_events` for as long as messages are queued, such that no signal is
+    missed. Between two calls, control returns to the Qt event loop, so a steady
+    flow of events does not starve other Qt objects. `check()` must be called
+    after any operation on the socket other than receiving messages, since that
+    operation may have consumed a signal.
+    """
+
+    def __init__(self,
+                 socket:         zmq.Socket,
+                 process_events: Callable[[], None],
+                 parent:         Optional[QObject] = None
+    ):
+        super().__init__(parent)
+
+        self._socket         = socket
+        self._process_events = process_events
+        self._check_pending  = False
+        self._enabled        = True
+
+        self._notifier = QSocketNotifier(socket.getsockopt(zmq.FD), QSocketNotifier.Read, self)
+        self._notifier.activated.connect(self._on_activated)
+
+        # Messages may have been queued before the notifier was created.
+        self.check()
+
+    def is_enabled(self) -> bool:
+        return self._enabled
+
+    def set_enabled(self, enabled: bool):
+        self._enabled = enabled
+        self._notifier.setEnabled(enabled)
+
+        if enabled:
+            self.check()
+
+    def check(self):
+        """Schedules a check for queued messages on the next iteration of the Qt event loop."""
+
+        if self._check_pending:
+            return
+
+        self._check_pending = True
+        QTimer.singleShot(0, self._on_check)
+
+    #===============================================================================
+    # Internals
+    #===============================================================================
+    @pyqtSlot()
+    def _on_check(self):
+        self._check_pending = False
+
+        if self._enabled:
+            self._on_activated()
+
+    @pyqtSlot()
+    def _on_activated(self):
+        # Prevents the notifier from being activated again by `process_events`.
+        self._notifier.setEnabled(False)
+
+        if self._socket.closed:
+            return
+
+        try:
+            if self._socket.getsockopt(zmq.EVENTS) & zmq.POLLIN:
+                self._process_events()
+        finally:
+            if self._enabled and not self._socket.closed:
+                self._notifier.setEnabled(True)
+
+                # Reading `zmq.EVENTS` here is required to rearm the descriptor. If
+                # more messages are queued, process them on the next iteration.
+                if self._socket.getsockopt(zmq.EVENTS) & zmq.POLLIN:
+                    self.check()
\ No newline at end of file
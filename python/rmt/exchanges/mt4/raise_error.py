@@ -6,7 +6,7 @@ def _raise_invalid_request(command: str, content: Dict) -> NoReturn:
     raise error.RequestError("Invalid request (command was '%s')" % command)
 
 def _raise_unknown_request_command(command: str, content: Dict) -> NoReturn:
-    raise error.RequestError("Server does not recognize command '%s'" % command)
+    raise error.UnknownCommand("Server does not recognize command '%s'" % command)
 
 def _raise_invalid_json(command: str, content: Dict) -> NoReturn:
     raise error.RequestError("Request content at command '%s' is not valid JSON" % command)
@@ -7,4 +7,6 @@ from .get_order        import GetOrderRequest
 from .watch_symbol     import WatchSymbolRequest
 from .place_order      import PlaceOrderRequest
 from .close_order      import CloseOrderRequest
-from .modify_order     import ModifyOrderRequest
\ No newline at end of file
+from .modify_order     import ModifyOrderRequest
+from .batch            import BatchRequest
+from .get_capabilities import GetCapabilitiesRequest
\ No newline at end of file
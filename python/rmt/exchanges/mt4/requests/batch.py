@@ -0,0 +1,42 @@
+from typing import List
+from ..     import Content
+from .      import Request
+
+class BatchRequest(Request):
+    """Request which carries several requests to be executed in one round trip.
+
+    Protocol
+    --------
+    The content of a batch request is an array with one element per sub-request,
+    each of which is an array holding the sub-request's command and content:
+
+        batch [["getTick", {"symbol": "EURUSD"}], ["getOrder", {"ticket": 42}]]
+
+    The server executes the sub-requests in order, as if each had been received
+    on its own, and responds with an array holding one element per sub-request,
+    in the same order. Each element is an array holding the sub-request's result
+    code and, if it has one, the content of its response:
+
+        0 [[0, {"time": 1650000000, "bid": 1.0812, "ask": 1.0813}], [4108]]
+
+    The result code of the batch itself is `SUCCESS` if its content is valid, even
+    if any sub-request failed. Sub-requests may not be batch requests themselves.
+    A server which does not support batches responds with `UNKNOWN_REQUEST_COMMAND`.
+    """
+
+    command = 'batch'
+
+    def __init__(self, requests: List[Request]):
+        super().__init__()
+
+        for request in requests:
+            if isinstance(request, BatchRequest):
+                raise ValueError('batch request must not contain another batch request')
+
+        self._requests = requests
+
+    def requests(self) -> List[Request]:
+        return self._requests
+
+    def content(self) -> Content:
+        return [[request.command, request.content()] for request in self._requests]
\ No newline at end of file
@@ -0,0 +1,18 @@
+from .. import Content
+from .  import Request
+
+class GetCapabilitiesRequest(Request):
+    """Asks the Expert Server which optional protocol features it supports.
+
+    Request: `getCapabilities {}`
+
+    Response: `0 {"formats": ["binary"]}`
+
+    Servers which predate this command answer `UNKNOWN_REQUEST_COMMAND`, in
+    which case clients must assume that no optional feature is supported.
+    """
+
+    command = 'getCapabilities'
+
+    def content(self) -> Content:
+        return {}
\ No newline at end of file
@@ -1,17 +1,27 @@
 from datetime import datetime
 from typing   import Optional
 from rmt      import Timeframe
-from ..       import Content
+from ..       import Content, binary_format
 from .        import Request
 
 class GetHistoryBarsRequest(Request):
+    """Asks the Expert Server for the bars of a symbol in a range of time.
+
+    If `binary` is true, the server answers with a message of two frames, where
+    the first frame is `0 {"format": "binary"}` and the second frame holds the
+    bars in binary format (see `binary_format.BAR_STRUCT`). This must only be
+    requested from a server which lists the binary format in its capabilities,
+    and not as part of a batch.
+    """
+
     command = 'getHistoryBars'
 
     def __init__(self,
                  symbol:     str,
                  start_time: Optional[datetime],
                  end_time:   Optional[datetime],
-                 timeframe:  Timeframe = Timeframe.M1
+                 timeframe:  Timeframe = Timeframe.M1,
+                 binary:     bool = False
     ):
         super().__init__()
 
@@ -22,6 +32,7 @@ class GetHistoryBarsRequest(Request):
         self._start_time = start_time
         self._end_time   = end_time
         self._timeframe  = str(timeframe.value)
+        self._binary     = binary
     
     def content(self) -> Content:
         msg = {
@@ -34,5 +45,8 @@ class GetHistoryBarsRequest(Request):
 
         if isinstance(self._end_time, datetime):
             msg['end_time'] = int(self._end_time.timestamp())
+
+        if self._binary:
+            msg['format'] = binary_format.FORMAT_NAME
         
-        return msg
+        return msg
\ No newline at end of file
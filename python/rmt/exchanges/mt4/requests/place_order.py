@@ -31,6 +31,30 @@ class PlaceOrderRequest(Request):
         self._magic_number = magic_number
         self._expiration   = expiration
 
+    def symbol(self) -> str:
+        return self._symbol
+
+    def opcode(self) -> OperationCode:
+        return self._opcode
+
+    def lots(self) -> float:
+        return self._lots
+
+    def stop_loss(self) -> Optional[float]:
+        return self._stop_loss
+
+    def take_profit(self) -> Optional[float]:
+        return self._take_profit
+
+    def comment(self) -> str:
+        return self._comment
+
+    def magic_number(self) -> int:
+        return self._magic_number
+
+    def expiration(self) -> Optional[datetime]:
+        return self._expiration
+
     def content(self) -> Content:
         msg = {
             'symbol': self._symbol,
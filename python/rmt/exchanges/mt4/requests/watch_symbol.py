@@ -1,18 +1,33 @@
-from .. import Content
+from .. import Content, binary_format
 from .  import Request
 
 class WatchSymbolRequest(Request):
+    """Asks the Expert Server to publish tick events of a symbol.
+
+    If `binary` is true, the server publishes binary tick events of the symbol
+    (see `BinaryTickEvent`) instead of JSON ones, unless JSON events of the symbol
+    were requested as well. This must only be requested from a server which lists
+    the binary format in its capabilities, since other servers ignore the key
+    `format`.
+    """
+
     command = 'watchSymbol'
 
-    def __init__(self, symbol: str):
+    def __init__(self, symbol: str, binary: bool = False):
         super().__init__()
 
         if symbol == '':
             raise ValueError('symbol must not be empty')
         
         self._symbol = symbol
+        self._binary = binary
     
     def content(self) -> Content:
-        return {
+        msg = {
             'symbol': self._symbol
-        }
\ No newline at end of file
+        }
+
+        if self._binary:
+            msg['format'] = binary_format.FORMAT_NAME
+
+        return msg
\ No newline at end of file
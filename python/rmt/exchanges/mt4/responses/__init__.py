@@ -4,4 +4,6 @@ from .get_current_bar  import GetCurrentBarResponse
 from .get_history_bars import GetHistoryBarsResponse
 from .get_order        import GetOrderResponse
 from .place_order      import PlaceOrderResponse
-from .close_order      import CloseOrderResponse
\ No newline at end of file
+from .close_order      import CloseOrderResponse
+from .batch            import BatchResponse
+from .get_capabilities import GetCapabilitiesResponse
\ No newline at end of file
@@ -0,0 +1,30 @@
+from typing import List, Optional, Tuple
+from rmt    import jsonutil
+from ..     import CommandResultCode, Content
+
+class BatchResponse:
+    def __init__(self, content: Content, expected_size: int):
+        if not isinstance(content, list):
+            raise TypeError('batch response content is of invalid type (expected: array, got: object)')
+
+        if len(content) != expected_size:
+            raise ValueError(
+                'expected %s elements in batch response array (got: %s)'
+                % (expected_size, len(content))
+            )
+
+        self._results: List[Tuple[int, Optional[Content]]] = []
+
+        for i, _ in enumerate(content):
+            result      = jsonutil.read_required(content, i,      list)
+            result_code = jsonutil.read_required(result,  0,      int)
+            sub_content = jsonutil.read_optional(result,  1,      (dict, list), None)
+
+            # Leave unknown result codes as is, so that `raise_error()` reports them.
+            if any(result_code == v for v in CommandResultCode):
+                result_code = CommandResultCode(result_code)
+
+            self._results.append((result_code, sub_content))
+
+    def results(self) -> List[Tuple[int, Optional[Content]]]:
+        return self._results
\ No newline at end of file
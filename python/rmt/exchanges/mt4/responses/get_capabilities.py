@@ -0,0 +1,14 @@
+from typing import List
+from rmt    import jsonutil
+from ..     import Content
+
+class GetCapabilitiesResponse:
+    def __init__(self, content: Content):
+        formats = jsonutil.read_optional(content, 'formats', list)
+
+        self._formats = [f for f in formats if isinstance(f, str)]
+
+    def formats(self) -> List[str]:
+        """Names of the wire formats supported in addition to JSON."""
+
+        return self._formats.copy()
\ No newline at end of file
@@ -1,11 +1,69 @@
 from datetime import datetime, timezone
-from typing   import List
+from typing   import List, Optional, Tuple
 from rmt      import Bar, jsonutil
-from ..       import Content
+from rmt.bar  import _new_bar
+from ..       import Content, binary_format
 
 class GetHistoryBarsResponse:
-    def __init__(self, content: Content):
-        self._bars: List[Bar] = []
+    """Reads the bars of a history response.
+
+    If the response has a second frame, `data`, its content must be the header
+    of a binary response and `data` must hold the bars in binary format.
+
+    The response is validated when it's created. Bars are decoded on demand, once,
+    either as `Bar` objects by `bars()` or as a `BarSeries` by `bar_series()`, which
+    is built straight from binary data.
+
+    Raises
+    ------
+    ValueError
+        If the content is not a list of bars, or if the length of binary data is
+        not a multiple of the size of a bar.
+    """
+
+    def __init__(self, content: Content, data: Optional[bytes] = None):
+        if data is not None and jsonutil.read_optional(content, 'format', str) != binary_format.FORMAT_NAME:
+            raise ValueError('history response has data frame but no binary format header')
+
+        if data is not None and len(data) % binary_format.BAR_STRUCT.size != 0:
+            raise ValueError('expected multiple of %s bytes of binary bars (got: %s)' % (binary_format.BAR_STRUCT.size, len(data)))
+
+        self._data = data
+        self._bars: Optional[List[Bar]] = None
+
+        # Read out of JSON content at once, which validates it, and shared by
+        # `bars()` and `bar_series()`.
+        self._rows = self._read_bars(content) if data is None else None
+
+    def bars(self) -> List[Bar]:
+        if self._bars is not None:
+            return self._bars
+
+        if self._data is not None:
+            self._bars = binary_format.unpack_bars(self._data)
+        else:
+            self._bars = [
+                _new_bar(datetime.fromtimestamp(t, timezone.utc), o, h, l, c, v)
+                for t, o, h, l, c, v in self._rows
+            ]
+
+        return self._bars
+
+    def bar_series(self) -> 'BarSeries':
+        """Returns the bars as a `BarSeries`. Requires NumPy."""
+
+        from rmt.bar_series import BarSeries
+
+        if self._data is not None:
+            return BarSeries.from_bytes(self._data)
+
+        return BarSeries.from_tuples(self._rows)
+
+    #===============================================================================
+    # Internals
+    #===============================================================================
+    def _read_bars(self, content: Content) -> List[Tuple[int, float, float, float, float, int]]:
+        bars = []
 
         for i, _ in enumerate(content):
             bar = jsonutil.read_required(content, i, list)
@@ -15,15 +73,6 @@ class GetHistoryBarsResponse:
             l   = jsonutil.read_required(bar,     3, float)
             c   = jsonutil.read_required(bar,     4, float)
 
-            bar = Bar(
-                time  = datetime.fromtimestamp(t, timezone.utc),
-                open  = o,
-                high  = h,
-                low   = l,
-                close = c
-            )
+            bars.append((t, o, h, l, c, 0))
 
-            self._bars.append(bar)
-
-    def bars(self) -> List[Bar]:
-        return self._bars
\ No newline at end of file
+        return bars
\ No newline at end of file
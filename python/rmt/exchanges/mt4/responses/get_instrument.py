@@ -1,4 +1,4 @@
-from rmt import jsonutil
+from rmt import jsonutil, Instrument
 from ..  import Content
 
 class GetInstrumentResponse:
@@ -58,4 +58,23 @@ class GetInstrumentResponse:
         return self._freeze_lvl
 
     def spread(self) -> int:
-        return self._spread
\ No newline at end of file
+        return self._spread
+
+    def instrument(self, symbol: str) -> Instrument:
+        return Instrument(
+            symbol          = symbol,
+            description     = self._description,
+            base_currency   = self._base_currency,
+            profit_currency = self._profit_currency,
+            margin_currency = self._margin_currency,
+            decimal_places  = self._decimal_places,
+            point           = self._point,
+            tick_size       = self._tick_size,
+            contract_size   = self._contract_size,
+            lot_step        = self._lot_step,
+            min_lot         = self._min_lot,
+            max_lot         = self._max_lot,
+            min_stop_level  = self._min_stop_lvl,
+            freeze_level    = self._freeze_lvl,
+            spread          = self._spread
+        )
\ No newline at end of file
@@ -1,7 +1,8 @@
 from datetime import datetime, timezone
 from typing   import Optional
-from rmt      import jsonutil
+from rmt      import jsonutil, Order, OrderType, OrderStatus
 from ..       import Content
+from ..requests import PlaceOrderRequest
 
 class PlaceOrderResponse:
     class OrderInfo:
@@ -47,4 +48,44 @@ class PlaceOrderResponse:
     def order_info(self) -> Optional[OrderInfo]:
         return self._order_info
 
-    
\ No newline at end of file
+    
+
+    def order(self, request: PlaceOrderRequest) -> Optional[Order]:
+        """Returns the order placed by `request`, if the response has information about it."""
+
+        order_info = self._order_info
+
+        if order_info is None:
+            return None
+
+        opcode     = request.opcode()
+        order_type = opcode.order_type()
+        status     = None
+
+        if order_type == OrderType.MARKET_ORDER:
+            if order_info.lots() < request.lots():
+                status = OrderStatus.PARTIALLY_FILLED
+            else:
+                status = OrderStatus.FILLED
+        else:
+            status = OrderStatus.PENDING
+
+        return Order(
+            symbol       = request.symbol(),
+            side         = opcode.side(),
+            type         = order_type,
+            lots         = order_info.lots(),
+            status       = status,
+            open_price   = order_info.open_price(),
+            open_time    = order_info.open_time(),
+            close_price  = None,
+            close_time   = None,
+            expiration   = request.expiration(),
+            stop_loss    = request.stop_loss(),
+            take_profit  = request.take_profit(),
+            magic_number = int(request.magic_number()),
+            comment      = str(request.comment()),
+            commission   = order_info.commission(),
+            profit       = order_info.profit(),
+            swap         = order_info.swap(),
+        )
\ No newline at end of file
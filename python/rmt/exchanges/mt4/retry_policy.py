@@ -0,0 +1,63 @@
+from typing    import Iterable, Optional
+from .requests import Request, BatchRequest
+
+class RetryPolicy:
+    """Defines which requests are sent again after a timeout, and how.
+
+    Description
+    -----------
+    A request which times out may or may not have been executed by the Expert
+    Server. Sending it again is thus only safe if executing it twice has the
+    same effect as executing it once. By default, only requests which read data
+    from the Expert are retried, whereas requests such as `placeOrder` and
+    `closeOrder` are not. A batch request is retried if all of its sub-requests
+    may be retried.
+
+    A request is sent again at most `max_retries` times. Before the n-th retry,
+    the client waits for `backoff * 2 ** (n - 1)` seconds, but no longer than
+    `max_backoff` seconds.
+    """
+
+    DEFAULT_RETRYABLE_COMMANDS = frozenset([
+        'getTick',
+        'getInstrument',
+        'getCurrentBar',
+        'getHistoryBars',
+        'getOrder',
+        'watchSymbol',
+        'getCapabilities'
+    ])
+
+    def __init__(self,
+                 max_retries:        int   = 3,
+                 backoff:            float = 0.1,
+                 max_backoff:        float = 2.0,
+                 retryable_commands: Optional[Iterable[str]] = None
+    ):
+        if max_retries < 0:
+            raise ValueError('maximum number of retries must not be negative (got: %s)' % max_retries)
+
+        if retryable_commands is None:
+            retryable_commands = RetryPolicy.DEFAULT_RETRYABLE_COMMANDS
+
+        self._max_retries        = max_retries
+        self._backoff            = backoff
+        self._max_backoff        = max_backoff
+        self._retryable_commands = frozenset(retryable_commands)
+
+    def max_retries(self) -> int:
+        return self._max_retries
+
+    def retryable_commands(self) -> frozenset:
+        return self._retryable_commands
+
+    def is_retryable(self, request: Request) -> bool:
+        if isinstance(request, BatchRequest):
+            return all(self.is_retryable(r) for r in request.requests())
+
+        return request.command in self._retryable_commands
+
+    def backoff(self, retry: int) -> float:
+        """Returns how many seconds to wait before the `retry`-th retry, starting at 1."""
+
+        return min(self._backoff * (2 ** (retry - 1)), self._max_backoff)
\ No newline at end of file
@@ -0,0 +1,318 @@
+import zmq
+import logging
+import threading
+from collections import deque
+from time        import monotonic, perf_counter, sleep
+from typing      import Deque, Dict, List, Optional
+from rmt         import error
+from .           import RetryPolicy
+
+class SocketPoolMetrics:
+    """Snapshot of the usage of a `ReqSocketPool`."""
+
+    def __init__(self,
+                 size:            int,
+                 connections:     int,
+                 acquisitions:    int,
+                 total_wait_time: float,
+                 max_wait_time:   float,
+                 busy_time:       float,
+                 elapsed_time:    float,
+                 reconnects:      int,
+                 retries:         int
+    ):
+        self._size            = size
+        self._connections     = connections
+        self._acquisitions    = acquisitions
+        self._total_wait_time = total_wait_time
+        self._max_wait_time   = max_wait_time
+        self._busy_time       = busy_time
+        self._elapsed_time    = elapsed_time
+        self._reconnects      = reconnects
+        self._retries         = retries
+
+    def size(self) -> int:
+        """Maximum number of connections of the pool."""
+
+        return self._size
+
+    def connections(self) -> int:
+        """Number of connections opened so far."""
+
+        return self._connections
+
+    def acquisitions(self) -> int:
+        """Number of times a connection was acquired from the pool."""
+
+        return self._acquisitions
+
+    def total_wait_time(self) -> float:
+        """Seconds spent by callers waiting for a connection to be released."""
+
+        return self._total_wait_time
+
+    def max_wait_time(self) -> float:
+        """Longest wait in seconds for a connection to be released."""
+
+        return self._max_wait_time
+
+    def mean_wait_time(self) -> float:
+        if self._acquisitions == 0:
+            return 0.0
+
+        return self._total_wait_time / self._acquisitions
+
+    def utilization(self) -> float:
+        """Fraction of time, from 0 to 1, that connections of the pool were in use."""
+
+        if self._elapsed_time <= 0:
+            return 0.0
+
+        return self._busy_time / (self._size * self._elapsed_time)
+
+    def reconnects(self) -> int:
+        """Number of connections replaced after a request timed out."""
+
+        return self._reconnects
+
+    def retries(self) -> int:
+        """Number of requests sent again after a timeout."""
+
+        return self._retries
+
+    def __str__(self) -> str:
+        return (
+            'SocketPoolMetrics(size: %s, connections: %s, acquisitions: %s, mean wait: %.6fs, max wait: %.6fs, utilization: %.1f%%, reconnects: %s, retries: %s)'
+            % (self._size, self._connections, self._acquisitions, self.mean_wait_time(), self._max_wait_time, self.utilization() * 100, self._reconnects, self._retries)
+        )
+
+class ReqSocketPool:
+    """Pool of REQ sockets connected to the same address.
+
+    Description
+    -----------
+    A REQ socket is not thread-safe and may only have one request in flight. This
+    class lets several threads send requests at the same time by handing each of
+    them a socket of its own for the duration of a call to `request()`. Sockets are
+    opened on demand, up to `size` sockets, after which callers wait for a socket
+    to be released. Released sockets are handed to waiting callers in the order
+    they started waiting, so that no caller starves.
+
+    Since no lock is held while a request is in flight, requests sent on different
+    sockets are not serialized by the pool.
+
+    If a request times out, its REQ socket is left waiting for a response that may
+    never arrive, and could not send any further request. The socket is thus closed
+    and replaced by a new connection, following the Lazy Pirate pattern of the ZMQ
+    guide, after which the request may be sent again as defined by a `RetryPolicy`.
+    """
+
+    def __init__(self, size: int = 1, options: Optional[Dict[int, int]] = None):
+        if size < 1:
+            raise ValueError('pool size must be at least 1 (got: %s)' % size)
+
+        self._ctx     = zmq.Context.instance()
+        self._size    = size
+        self._options = options if options is not None else {}
+        self._addr: Optional[str] = None
+
+        self._condition = threading.Condition()
+        self._idle_sockets: List[zmq.Socket] = []
+        self._sockets:      List[zmq.Socket] = []
+
+        # Slots of callers waiting for a socket, in the order they started waiting.
+        self._waiters: Deque[List[Optional[zmq.Socket]]] = deque()
+
+        self._acquisitions    = 0
+        self._total_wait_time = 0.0
+        self._max_wait_time   = 0.0
+        self._busy_time       = 0.0
+        self._start_time      = perf_counter()
+        self._reconnects      = 0
+        self._retries         = 0
+
+        self._logger = logging.getLogger(ReqSocketPool.__name__)
+
+    def size(self) -> int:
+        return self._size
+
+    def connect(self, addr: str):
+        with self._condition:
+            self._addr = addr
+
+            for socket in self._sockets:
+                socket.connect(addr)
+
+    def close(self):
+        with self._condition:
+            for socket in self._sockets:
+                socket.close()
+
+            self._sockets.clear()
+            self._idle_sockets.clear()
+            self._addr = None
+
+    def request(self,
+                request:      bytes,
+                timeout:      float,
+                retry_policy: Optional[RetryPolicy] = None
+    ) -> List[bytes]:
+        """Sends a request message and returns the frames of its response message.
+
+        The request fails if no response is received within `timeout` seconds,
+        which includes any time spent waiting for a socket of the pool and any
+        retries of the request. If the request times out and `retry_policy` is
+        provided, the request is sent again as defined by that policy, as long
+        as time remains. Each attempt is then given an equal share of the time
+        remaining for it and the retries left, so that an attempt which gets no
+        response does not use up the time of its retries.
+
+        Raises
+        ------
+        RequestTimeout
+            If no response was received in time.
+        """
+
+        deadline = monotonic() + timeout
+        retry    = 0
+
+        while True:
+            socket       = self._acquire(deadline)
+            acquire_time = perf_counter()
+            broken       = True
+
+            attempt_deadline = deadline
+
+            if retry_policy is not None:
+                attempt_deadline = monotonic() + (deadline - monotonic()) / (retry_policy.max_retries() - retry + 1)
+
+            try:
+                if socket.poll(self._remaining_ms(attempt_deadline), zmq.POLLOUT) != 0:
+                    socket.send(request, zmq.DONTWAIT)
+
+                    if socket.poll(self._remaining_ms(attempt_deadline), zmq.POLLIN) != 0:
+                        response = socket.recv_multipart(zmq.DONTWAIT)
+                        broken   = False
+
+                        return response
+
+            except zmq.error.Again:
+                pass
+
+            finally:
+                self._release(socket, perf_counter() - acquire_time, broken)
+
+            if retry_policy is None or retry == retry_policy.max_retries():
+                raise error.RequestTimeout()
+
+            retry  += 1
+            backoff = retry_policy.backoff(retry)
+
+            if monotonic() + backoff >= deadline:
+                raise error.RequestTimeout()
+
+            with self._condition:
+                self._retries += 1
+
+            self._logger.warning('request timed out, retrying in %.3fs (%s of %s)', backoff, retry, retry_policy.max_retries())
+            sleep(backoff)
+
+    def metrics(self) -> SocketPoolMetrics:
+        with self._condition:
+            return SocketPoolMetrics(
+                size            = self._size,
+                connections     = len(self._sockets),
+                acquisitions    = self._acquisitions,
+                total_wait_time = self._total_wait_time,
+                max_wait_time   = self._max_wait_time,
+                busy_time       = self._busy_time,
+                elapsed_time    = perf_counter() - self._start_time,
+                reconnects      = self._reconnects,
+                retries         = self._retries
+            )
+
+    def reset_metrics(self):
+        with self._condition:
+            self._acquisitions    = 0
+            self._total_wait_time = 0.0
+            self._max_wait_time   = 0.0
+            self._busy_time       = 0.0
+            self._start_time      = perf_counter()
+            self._reconnects      = 0
+            self._retries         = 0
+
+    #===============================================================================
+    # Internals
+    #===============================================================================
+    def _acquire(self, deadline: float) -> zmq.Socket:
+        wait_start = perf_counter()
+
+        with self._condition:
+            if len(self._idle_sockets) != 0:
+                socket = self._idle_sockets.pop()
+            elif len(self._sockets) < self._size:
+                socket = self._open_socket()
+            else:
+                waiter = [None]
+                self._waiters.append(waiter)
+
+                while waiter[0] is None:
+                    remaining = deadline - monotonic()
+
+                    if remaining <= 0:
+                        self._waiters.remove(waiter)
+                        raise error.RequestTimeout()
+
+                    self._condition.wait(remaining)
+
+                socket = waiter[0]
+
+            wait_time = perf_counter() - wait_start
+
+            self._acquisitions    += 1
+            self._total_wait_time += wait_time
+            self._max_wait_time    = max(self._max_wait_time, wait_time)
+
+            return socket
+
+    @staticmethod
+    def _remaining_ms(deadline: float) -> int:
+        return max(0, int((deadline - monotonic()) * 1000))
+
+    def _release(self, socket: zmq.Socket, busy_time: float, broken: bool):
+        with self._condition:
+            self._busy_time += busy_time
+
+            if socket not in self._sockets:
+                return
+
+            if broken:
+                # Discard any request still queued on the socket, so that closing
+                # it does not block, and connect again on a new socket.
+                socket.close(linger=0)
+                self._sockets.remove(socket)
+                self._reconnects += 1
+
+                if len(self._waiters) == 0:
+                    return
+
+                socket = self._open_socket()
+
+            if len(self._waiters) != 0:
+                self._waiters.popleft()[0] = socket
+                self._condition.notify_all()
+            else:
+                self._idle_sockets.append(socket)
+
+    def _open_socket(self) -> zmq.Socket:
+        socket = self._ctx.socket(zmq.REQ)
+
+        for option, value in self._options.items():
+            socket.setsockopt(option, value)
+
+        if self._addr is not None:
+            socket.connect(self._addr)
+
+        self._sockets.append(socket)
+
+        return socket
\ No newline at end of file
@@ -0,0 +1,514 @@
+import zmq
+import heapq
+import json
+import logging
+import math
+import threading
+import zlib
+from datetime  import datetime, timezone
+from itertools import count
+from time      import monotonic, time
+from typing    import Callable, Dict, List, Optional, Set, Tuple, Union
+from rmt       import Tick, Side, OrderType
+from .         import CommandResultCode, Content, OperationCode, binary_format
+
+# A handler's result is either JSON content or, for binary responses, raw bytes.
+CommandHandler = Callable[[Content], Tuple[CommandResultCode, Optional[Union[Content, bytes]]]]
+
+_PERIOD_SECONDS = {
+    'M1':  60,
+    'M5':  300,
+    'M15': 900,
+    'M30': 1800,
+    'H1':  3600,
+    'H4':  14400,
+    'D1':  86400,
+    'W1':  604800,
+    'MN1': 2592000
+}
+
+class StandInServer:
+    """Python stand-in for the Expert Server.
+
+    Description
+    -----------
+    This class speaks the same protocol as the MQL Expert Server, such that a
+    client, e.g. `MetaTrader4`, may be exercised without a running MT4 terminal.
+    Requests are answered from synthetic market data which is deterministic for
+    a given symbol and time, and tick events are published when requested with
+    `publish_tick()`.
+
+    The stand-in supports the binary format of ticks and bars, and advertises it
+    through the command `getCapabilities`. A server which does not support it may
+    be simulated with `set_handler('getCapabilities', None)`.
+
+    Events are published as single-frame messages `<topic> <content>`, like the
+    Expert does, or as a topic frame followed by a content frame if
+    `multipart_events` is true.
+
+    Requests are received on a ROUTER socket, which is wire-compatible with the
+    Expert's REP socket for REQ and DEALER clients. Unlike the Expert, however,
+    the stand-in does not serialize requests: if a `latency` is given, replies
+    are delayed by that many seconds without holding back other requests, which
+    simulates the round trip of a remote server.
+
+    The server runs on a thread of its own between calls to `start()` and `stop()`.
+    Handlers of commands may be replaced with `set_handler()`.
+    """
+
+    def __init__(self,
+                 protocol:         str   = 'tcp',
+                 host:             str   = '127.0.0.1',
+                 req_port:         int   = 0,
+                 sub_port:         int   = 0,
+                 latency:          float = 0.0,
+                 multipart_events: bool  = False
+    ):
+        self._ctx        = zmq.Context()
+        self._rep_socket = self._ctx.socket(zmq.ROUTER)
+        self._pub_socket = self._ctx.socket(zmq.PUB)
+        self._latency    = latency
+        self._multipart  = multipart_events
+        self._logger     = logging.getLogger(StandInServer.__name__)
+
+        self._req_port = self._bind(self._rep_socket, protocol, host, req_port)
+        self._sub_port = self._bind(self._pub_socket, protocol, host, sub_port)
+
+        control_addr = 'inproc://stand-in-server-%s' % id(self)
+
+        self._control_pull = self._ctx.socket(zmq.PULL)
+        self._control_pull.bind(control_addr)
+        self._control_push = self._ctx.socket(zmq.PUSH)
+        self._control_push.connect(control_addr)
+        self._control_lock = threading.Lock()
+
+        self._thread: Optional[threading.Thread] = None
+        self._dropped_replies = 0
+
+        self._ticks:   Dict[str, Tick] = {}
+        self._orders:  Dict[int, Dict] = {}
+        self._tickets  = count(1)
+
+        # Symbols watched in each format ('*' for all), so that a tick is only published
+        # in the formats which some client asked for.
+        self._json_symbols:   Set[str] = set()
+        self._binary_symbols: Set[str] = set()
+
+        self._handlers: Dict[str, CommandHandler] = {
+            'getTick':         self._get_tick,
+            'getInstrument':   self._get_instrument,
+            'getCurrentBar':   self._get_current_bar,
+            'getHistoryBars':  self._get_history_bars,
+            'getOrder':        self._get_order,
+            'watchSymbol':     self._watch_symbol,
+            'placeOrder':      self._place_order,
+            'modifyOrder':     self._modify_order,
+            'closeOrder':      self._close_order,
+            'batch':           self._batch,
+            'getCapabilities': self._get_capabilities
+        }
+
+    def req_port(self) -> int:
+        """Port on which requests are received."""
+
+        return self._req_port
+
+    def sub_port(self) -> int:
+        """Port on which events are published."""
+
+        return self._sub_port
+
+    def start(self):
+        if self._thread is not None:
+            return
+
+        self._thread = threading.Thread(target=self._run, name=StandInServer.__name__, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is None:
+            return
+
+        with self._control_lock:
+            self._control_push.send(b'stop')
+
+        self._thread.join()
+        self._thread = None
+
+        self._control_push.close(0)
+        self._ctx.destroy(0)
+
+    def handler(self, command: str) -> Optional[CommandHandler]:
+        """Returns the function which answers requests with command `command`, if
+        recognized, e.g. to wrap it in a handler which records requests."""
+
+        return self._handlers.get(command)
+
+    def set_handler(self, command: str, handler: Optional[CommandHandler]):
+        """Sets the function which answers requests with command `command`.
+
+        If `handler` is `None`, the server stops recognizing the command.
+        """
+
+        if handler is None:
+            self._handlers.pop(command, None)
+        else:
+            self._handlers[command] = handler
+
+    def drop_replies(self, count: int = 1):
+        """Makes the server execute the next `count` requests without replying to
+        them, which simulates replies lost on their way to the client."""
+
+        with self._control_lock:
+            self._dropped_replies += count
+
+    def set_tick(self, symbol: str, tick: Tick):
+        """Sets the last tick of a symbol, without publishing it."""
+
+        self._ticks[symbol] = tick
+
+    def publish_tick(self, symbol: str, tick: Tick):
+        """Sets the last tick of a symbol and publishes it as a tick event.
+
+        The tick is published in binary format if a client watches the symbol in
+        that format, and in JSON if a client watches it in JSON or if no client
+        watches it in binary format, so each format is only sent when needed.
+        """
+
+        self.set_tick(symbol, tick)
+
+        binary = symbol in self._binary_symbols or '*' in self._binary_symbols
+
+        if not binary or symbol in self._json_symbols or '*' in self._json_symbols:
+            content = [int(tick.server_time.timestamp()), tick.bid, tick.ask]
+            self._publish_event('tick.' + symbol, json.dumps(content).encode())
+
+        if binary:
+            self._publish_event('btick.' + symbol, binary_format.pack_tick(tick))
+
+    def publish(self, *frames: bytes):
+        """Publishes an event message made up of `frames`."""
+
+        with self._control_lock:
+            self._control_push.send_multipart([b'publish'] + list(frames))
+
+    def __enter__(self) -> 'StandInServer':
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    #===============================================================================
+    # Internals
+    #===============================================================================
+    @staticmethod
+    def _bind(socket: zmq.Socket, protocol: str, host: str, port: int) -> int:
+        if port == 0:
+            return socket.bind_to_random_port(protocol + '://' + host)
+
+        socket.bind('%s://%s:%s' % (protocol, host, port))
+        return port
+
+    def _publish_event(self, topic: str, content: bytes):
+        if self._multipart:
+            self.publish(topic.encode(), content)
+        else:
+            self.publish(b'%s %s' % (topic.encode(), content))
+
+    def _run(self):
+        poller = zmq.Poller()
+        poller.register(self._rep_socket,   zmq.POLLIN)
+        poller.register(self._control_pull, zmq.POLLIN)
+
+        # Replies waiting for their simulated latency to elapse, ordered by due time.
+        pending_replies: List[Tuple[float, int, List[bytes]]] = []
+        sequence = count()
+
+        while True:
+            timeout = None
+
+            if len(pending_replies) != 0:
+                timeout = max(0, (pending_replies[0][0] - monotonic()) * 1000)
+
+            sockets = dict(poller.poll(timeout))
+
+            if self._control_pull in sockets:
+                frames = self._control_pull.recv_multipart()
+
+                if frames[0] == b'stop':
+                    break
+
+                self._pub_socket.send_multipart(frames[1:])
+
+            if self._rep_socket in sockets:
+                frames = self._rep_socket.recv_multipart()
+
+                # Everything up to the last frame is the routing envelope, which must be
+                # sent back as is for the reply to reach the request's originator.
+                envelope = frames[:-1]
+                reply    = self._handle(frames[-1].decode())
+
+                with self._control_lock:
+                    dropped = self._dropped_replies > 0
+
+                    if dropped:
+                        self._dropped_replies -= 1
+
+                if not dropped:
+                    heapq.heappush(pending_replies, (monotonic() + self._latency, next(sequence), envelope + reply))
+
+            now = monotonic()
+
+            while len(pending_replies) != 0 and pending_replies[0][0] <= now:
+                _, _, frames = heapq.heappop(pending_replies)
+                self._rep_socket.send_multipart(frames)
+
+        self._rep_socket.close(0)
+        self._pub_socket.close(0)
+        self._control_pull.close(0)
+
+    def _handle(self, request: str) -> List[bytes]:
+        self._logger.debug('received request: %s', request)
+
+        sep_index = request.find(' ')
+        command   = request if sep_index == -1 else request[:sep_index]
+        content   = {}
+
+        if sep_index != -1:
+            try:
+                content = json.loads(request[(sep_index + 1):])
+            except ValueError:
+                return [str(CommandResultCode.INVALID_JSON.value).encode()]
+
+        result_code, result = self._execute(command, content)
+
+        if result is None:
+            return [str(result_code.value).encode()]
+
+        if isinstance(result, bytes):
+            header = {'format': binary_format.FORMAT_NAME}
+
+            return [('%s %s' % (result_code.value, json.dumps(header))).encode(), result]
+
+        return [('%s %s' % (result_code.value, json.dumps(result))).encode()]
+
+    def _execute(self, command: str, content: Content) -> Tuple[CommandResultCode, Optional[Union[Content, bytes]]]:
+        if command not in self._handlers:
+            return CommandResultCode.UNKNOWN_REQUEST_COMMAND, None
+
+        try:
+            return self._handlers[command](content)
+        except KeyError as e:
+            return CommandResultCode.MISSING_JSON_KEY, {'key': str(e.args[0])}
+        except (IndexError, TypeError, ValueError):
+            return CommandResultCode.INVALID_REQUEST, None
+
+    def _batch(self, content: Content) -> Tuple[CommandResultCode, Optional[Content]]:
+        if not isinstance(content, list):
+            return CommandResultCode.INVALID_REQUEST, None
+
+        results = []
+
+        for sub_request in content:
+            command, sub_content = sub_request
+
+            if command == 'batch':
+                result_code, result = CommandResultCode.INVALID_REQUEST, None
+            else:
+                result_code, result = self._execute(command, sub_content)
+
+                # Binary responses may not be part of a batch.
+                if isinstance(result, bytes):
+                    result_code, result = CommandResultCode.INVALID_REQUEST, None
+
+            if result is None:
+                results.append([result_code.value])
+            else:
+                results.append([result_code.value, result])
+
+        return CommandResultCode.SUCCESS, results
+
+    @staticmethod
+    def _price(symbol: str, timestamp: float) -> float:
+        base = 1.0 + (zlib.crc32(symbol.encode()) % 1000) / 10
+
+        return round(base * (1 + 0.01 * math.sin(timestamp / 3600)), 5)
+
+    def _last_tick(self, symbol: str) -> Tick:
+        if symbol not in self._ticks:
+            now = int(time())
+            bid = self._price(symbol, now)
+
+            self._ticks[symbol] = Tick(datetime.fromtimestamp(now, timezone.utc), bid, round(bid * 1.0001, 5))
+
+        return self._ticks[symbol]
+
+    def _bar(self, symbol: str, bar_time: int, period: int) -> List:
+        o = self._price(symbol, bar_time)
+        c = self._price(symbol, bar_time + period)
+
+        return [bar_time, o, max(o, c) * 1.0005, min(o, c) * 0.9995, c]
+
+    def _get_tick(self, content: Content) -> Tuple[CommandResultCode, Optional[Content]]:
+        tick = self._last_tick(content['symbol'])
+
+        return CommandResultCode.SUCCESS, {
+            'time': int(tick.server_time.timestamp()),
+            'bid':  tick.bid,
+            'ask':  tick.ask
+        }
+
+    def _get_instrument(self, content: Content) -> Tuple[CommandResultCode, Optional[Content]]:
+        symbol = content['symbol']
+
+        return CommandResultCode.SUCCESS, {
+            'desc':       symbol,
+            'bcurrency':  symbol[:3],
+            'pcurrency':  symbol[3:],
+            'mcurrency':  symbol[:3],
+            'ndecimals':  5,
+            'point':      0.00001,
+            'ticksz':     0.00001,
+            'contractsz': 100000.0,
+            'lotstep':    0.01,
+            'minlot':     0.01,
+            'maxlot':     100.0,
+            'minstop':    0,
+            'freezelvl':  0,
+            'spread':     0
+        }
+
+    def _get_current_bar(self, content: Content) -> Tuple[CommandResultCode, Optional[Content]]:
+        period   = _PERIOD_SECONDS[content['timeframe']]
+        bar_time = int(time()) // period * period
+
+        return CommandResultCode.SUCCESS, self._bar(content['symbol'], bar_time, period) + [0]
+
+    def _get_history_bars(self, content: Content) -> Tuple[CommandResultCode, Optional[Union[Content, bytes]]]:
+        symbol   = content['symbol']
+        period   = _PERIOD_SECONDS[content['timeframe']]
+        end_time = int(content.get('end_time', time())) // period * period
+
+        if 'start_time' in content:
+            start_time = -(-int(content['start_time']) // period) * period
+        else:
+            start_time = end_time - 99 * period
+
+        bars = [self._bar(symbol, t, period) for t in range(start_time, end_time + 1, period)]
+
+        if content.get('format') == binary_format.FORMAT_NAME:
+            return CommandResultCode.SUCCESS, binary_format.pack_bars(bars)
+
+        return CommandResultCode.SUCCESS, bars
+
+    def _get_capabilities(self, content: Content) -> Tuple[CommandResultCode, Optional[Content]]:
+        return CommandResultCode.SUCCESS, {'formats': [binary_format.FORMAT_NAME]}
+
+    def _watch_symbol(self, content: Content) -> Tuple[CommandResultCode, Optional[Content]]:
+        symbol = content['symbol']
+
+        if symbol != '*':
+            self._last_tick(symbol)
+
+        if content.get('format') == binary_format.FORMAT_NAME:
+            self._binary_symbols.add(symbol)
+        else:
+            self._json_symbols.add(symbol)
+
+        return CommandResultCode.SUCCESS, None
+
+    def _place_order(self, content: Content) -> Tuple[CommandResultCode, Optional[Content]]:
+        symbol = content['symbol']
+        opcode = OperationCode(content['opcode'])
+        tick   = self._last_tick(symbol)
+        ticket = next(self._tickets)
+
+        if opcode.order_type() == OrderType.MARKET_ORDER:
+            status     = 'filled'
+            open_price = tick.ask if opcode == OperationCode.BUY else tick.bid
+        else:
+            status     = 'pending'
+            open_price = content.get('price', tick.ask)
+
+        order = {
+            'opcode':     opcode.value,
+            'status':     status,
+            'symbol':     symbol,
+            'lots':       float(content['lots']),
+            'op':         open_price,
+            'ot':         int(tick.server_time.timestamp()),
+            'comment':    content.get('comment', ''),
+            'magic':      content.get('magic', 0),
+            'commission': 0.0,
+            'profit':     0.0,
+            'swap':       0.0
+        }
+
+        for key in ['sl', 'tp', 'expiration']:
+            if key in content:
+                order[key] = content[key]
+
+        self._orders[ticket] = order
+
+        return CommandResultCode.SUCCESS, {
+            'ticket':     ticket,
+            'lots':       order['lots'],
+            'op':         order['op'],
+            'ot':         order['ot'],
+            'commission': 0.0,
+            'profit':     0.0,
+            'swap':       0.0
+        }
+
+    def _get_order(self, content: Content) -> Tuple[CommandResultCode, Optional[Content]]:
+        ticket = content['ticket']
+
+        if ticket not in self._orders:
+            return CommandResultCode.INVALID_TICKET, None
+
+        return CommandResultCode.SUCCESS, self._orders[ticket]
+
+    def _modify_order(self, content: Content) -> Tuple[CommandResultCode, Optional[Content]]:
+        ticket = content['ticket']
+
+        if ticket not in self._orders:
+            return CommandResultCode.INVALID_TICKET, None
+
+        order = self._orders[ticket]
+
+        for key in ['sl', 'tp', 'expiration']:
+            if key in content:
+                order[key] = content[key]
+
+        if 'price' in content:
+            order['op'] = content['price']
+
+        return CommandResultCode.SUCCESS, None
+
+    def _close_order(self, content: Content) -> Tuple[CommandResultCode, Optional[Content]]:
+        ticket = content['ticket']
+
+        if ticket not in self._orders:
+            return CommandResultCode.INVALID_TICKET, None
+
+        order = self._orders[ticket]
+
+        if order['status'] != 'filled':
+            return CommandResultCode.INVALID_ORDER_STATUS, {'expected': 'filled', 'actual': order['status']}
+
+        tick = self._last_tick(order['symbol'])
+
+        order['status'] = 'closed'
+        order['cp']     = tick.bid if OperationCode(order['opcode']).side() == Side.BUY else tick.ask
+        order['ct']     = int(tick.server_time.timestamp())
+
+        return CommandResultCode.SUCCESS, {
+            'lots':       order['lots'],
+            'cp':         order['cp'],
+            'ct':         order['ct'],
+            'comment':    order['comment'],
+            'commission': 0.0,
+            'profit':     0.0,
+            'swap':       0.0
+        }
\ No newline at end of file
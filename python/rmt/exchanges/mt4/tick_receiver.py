@@ -0,0 +1,369 @@
+import zmq
+import logging
+import threading
+from collections import deque
+from time        import perf_counter
+from typing      import Deque, Dict, Iterator, List, Optional, Tuple
+from rmt         import Tick
+from .           import events, message
+from .json_codec import JsonCodec
+
+class TickReceiverMetrics:
+    """Snapshot of the ring buffers of a `TickReceiver`."""
+
+    def __init__(self,
+                 capacity: int,
+                 depths:   Dict[str, int],
+                 drops:    Dict[str, int],
+                 max_lags: Dict[str, float]
+    ):
+        self._capacity = capacity
+        self._depths   = depths
+        self._drops    = drops
+        self._max_lags = max_lags
+
+    def capacity(self) -> int:
+        """Maximum number of ticks buffered per symbol."""
+
+        return self._capacity
+
+    def symbols(self) -> List[str]:
+        return sorted(self._depths)
+
+    def depth(self, symbol: Optional[str] = None) -> int:
+        """Number of ticks waiting to be processed, of `symbol` or of all symbols."""
+
+        if symbol is not None:
+            return self._depths.get(symbol, 0)
+
+        return sum(self._depths.values())
+
+    def drops(self, symbol: Optional[str] = None) -> int:
+        """Number of ticks discarded because a buffer was full, of `symbol` or of all symbols."""
+
+        if symbol is not None:
+            return self._drops.get(symbol, 0)
+
+        return sum(self._drops.values())
+
+    def max_lag(self, symbol: Optional[str] = None) -> float:
+        """Longest time in seconds between the receipt of a tick and its processing."""
+
+        if symbol is not None:
+            return self._max_lags.get(symbol, 0.0)
+
+        return max(self._max_lags.values(), default=0.0)
+
+    def __str__(self) -> str:
+        return (
+            'TickReceiverMetrics(capacity: %s, symbols: %s, depth: %s, drops: %s, max lag: %.6fs)'
+            % (self._capacity, len(self._depths), self.depth(), self.drops(), self.max_lag())
+        )
+
+class _TickBuffer:
+    """Ring buffer of the ticks of a symbol, with one producer and one consumer.
+
+    `deque.append()` and `deque.popleft()` are atomic, so no lock is needed. Each
+    counter is only written by one side, from which the number of drops is derived.
+    A counter is updated after the deque, so the number of drops is exact when the
+    consumer reads it, but read from another thread while ticks are being appended
+    or consumed, it may be off by those ticks until both sides are done.
+    """
+
+    def __init__(self, capacity: int):
+        self.ticks: Deque[Tuple[float, Tick]] = deque(maxlen=capacity)
+        self.received = 0  # Written by the producer.
+        self.consumed = 0  # Written by the consumer.
+        self.max_lag  = 0.0
+
+    def drops(self) -> int:
+        return max(0, self.received - self.consumed - len(self.ticks))
+
+class TickReceiver:
+    """Receives tick events on a thread of its own into per-symbol ring buffers.
+
+    Description
+    -----------
+    Tick events are received and decoded as soon as they arrive, regardless of
+    what the application's thread is doing, so that they do not pile up in ZMQ's
+    queue and get dropped at its high-water mark while the application is busy,
+    e.g. waiting for a history request. Ticks are instead kept in a bounded ring
+    buffer per symbol, which discards the oldest ticks of a symbol when full.
+
+    The application consumes buffered ticks in batches with `drain()`, or only the
+    latest tick of each symbol with `drain_latest()`, or one at a time with `take()`,
+    and may block until ticks are available with `wait()`.
+
+    The receiver owns a SUB socket of its own, whose subscriptions are changed
+    by `subscribe()` and `unsubscribe()` from any thread. Its sockets are closed by
+    `stop()`, so a receiver may not be started again once stopped.
+    """
+
+    def __init__(self,
+                 addr:     str,
+                 capacity: int = 1024,
+                 codec:    Optional[JsonCodec] = None
+    ):
+        if capacity < 1:
+            raise ValueError('buffer capacity must be at least 1 (got: %s)' % capacity)
+
+        ctx = zmq.Context.instance()
+
+        self._capacity = capacity
+        self._codec    = JsonCodec.of(codec)
+        self._logger   = logging.getLogger(TickReceiver.__name__)
+
+        self._sub_socket = ctx.socket(zmq.SUB)
+        self._sub_socket.connect(addr)
+
+        control_addr = 'inproc://rmt-tick-receiver-%s' % id(self)
+
+        self._control_pull = ctx.socket(zmq.PULL)
+        self._control_pull.bind(control_addr)
+        self._control_push = ctx.socket(zmq.PUSH)
+        self._control_push.connect(control_addr)
+        self._control_lock = threading.Lock()
+
+        self._buffers: Dict[str, _TickBuffer] = {}
+        self._ready   = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+
+        self._event_types = {
+            'tick':  events.TickEvent,
+            'btick': events.BinaryTickEvent
+        }
+
+    def capacity(self) -> int:
+        return self._capacity
+
+    def start(self):
+        """Starts receiving ticks on a thread of its own.
+
+        Raises
+        ------
+        RuntimeError
+            If the receiver was stopped.
+        """
+
+        if self._stopped:
+            raise RuntimeError('cannot restart a stopped tick receiver; create a new one instead')
+
+        if self._thread is not None:
+            return
+
+        self._thread = threading.Thread(target=self._run, name=TickReceiver.__name__, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._stopped:
+            return
+
+        self._stopped = True
+
+        if self._thread is not None:
+            self._send_control(b'stop')
+            self._thread.join()
+            self._thread = None
+        else:
+            # Closed by the thread otherwise.
+            self._sub_socket.close(linger=0)
+            self._control_pull.close(linger=0)
+
+        with self._control_lock:
+            self._control_push.close(linger=0)
+
+    def subscribe(self, topic: str):
+        self._send_control(b'subscribe', topic.encode())
+
+    def unsubscribe(self, topic: str):
+        self._send_control(b'unsubscribe', topic.encode())
+
+    def drain(self) -> List[Tuple[str, Tick]]:
+        """Removes and returns all buffered ticks, in order of receipt per symbol."""
+
+        # Cleared before the buffers are emptied, so that a tick buffered meanwhile
+        # makes the next call to `wait()` return immediately.
+        self._ready.clear()
+
+        ticks = []
+        now   = perf_counter()
+
+        for symbol, buffer in list(self._buffers.items()):
+            count = len(buffer.ticks)
+
+            if count == 0:
+                continue
+
+            # The oldest tick, which comes first, waited the longest.
+            receive_time, tick = buffer.ticks.popleft()
+            ticks.append((symbol, tick))
+
+            for _ in range(count - 1):
+                ticks.append((symbol, buffer.ticks.popleft()[1]))
+
+            buffer.consumed += count
+            buffer.max_lag   = max(buffer.max_lag, now - receive_time)
+
+        return ticks
+
+    def drain_latest(self) -> List[Tuple[str, Tick, int]]:
+        """Empties the buffers, and returns the latest tick of each symbol along with
+        the number of older ticks of that symbol which were discarded.
+        """
+
+        self._ready.clear()
+
+        ticks = []
+        now   = perf_counter()
+
+        for symbol, buffer in list(self._buffers.items()):
+            count = len(buffer.ticks)
+
+            if count == 0:
+                continue
+
+            receive_time, tick = buffer.ticks.popleft()
+
+            for _ in range(count - 1):
+                tick = buffer.ticks.popleft()[1]
+
+            ticks.append((symbol, tick, count - 1))
+
+            buffer.consumed += count
+            buffer.max_lag   = max(buffer.max_lag, now - receive_time)
+
+        return ticks
+
+    def take(self) -> Iterator[Tuple[str, Tick]]:
+        """Removes and yields buffered ticks one at a time, taking the oldest tick of
+        each symbol in turn, so that a consumer which stops early does not starve the
+        symbols it would have reached last. Ticks which are not taken stay buffered.
+        """
+
+        self._ready.clear()
+
+        buffers = [buffer for buffer in list(self._buffers.items()) if len(buffer[1].ticks) != 0]
+
+        while buffers:
+            remaining = []
+
+            for symbol, buffer in buffers:
+                receive_time, tick = buffer.ticks.popleft()
+                buffer.consumed += 1
+                buffer.max_lag   = max(buffer.max_lag, perf_counter() - receive_time)
+
+                yield symbol, tick
+
+                if len(buffer.ticks) != 0:
+                    remaining.append((symbol, buffer))
+
+            buffers = remaining
+
+    def has_ticks(self) -> bool:
+        return any(len(buffer.ticks) != 0 for buffer in list(self._buffers.values()))
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Blocks until ticks are buffered or `interrupt()` is called, and returns
+        whether ticks are buffered.
+        """
+
+        # Ticks left by a consumer which stopped early do not set the event again.
+        if not self.has_ticks():
+            self._ready.wait(timeout)
+
+        return self.has_ticks()
+
+    def interrupt(self):
+        """Makes a thread blocked in `wait()` return."""
+
+        self._ready.set()
+
+    def metrics(self) -> TickReceiverMetrics:
+        """Returns the metrics of the buffers. Drops are exact when this is called by
+        the thread consuming ticks, and may be briefly off otherwise."""
+
+        buffers = list(self._buffers.items())
+
+        return TickReceiverMetrics(
+            capacity = self._capacity,
+            depths   = {symbol: len(buffer.ticks) for symbol, buffer in buffers},
+            drops    = {symbol: buffer.drops()    for symbol, buffer in buffers},
+            max_lags = {symbol: buffer.max_lag    for symbol, buffer in buffers}
+        )
+
+    #===============================================================================
+    # Internals
+    #===============================================================================
+    def _send_control(self, *frames: bytes):
+        with self._control_lock:
+            self._control_push.send_multipart(list(frames))
+
+    def _run(self):
+        poller = zmq.Poller()
+        poller.register(self._sub_socket,   zmq.POLLIN)
+        poller.register(self._control_pull, zmq.POLLIN)
+
+        topics: message.TopicCache = {}
+
+        while True:
+            sockets = dict(poller.poll())
+
+            if self._control_pull in sockets:
+                command, *args = self._control_pull.recv_multipart()
+
+                if command == b'stop':
+                    break
+                elif command == b'subscribe':
+                    self._sub_socket.subscribe(args[0])
+                elif command == b'unsubscribe':
+                    self._sub_socket.unsubscribe(args[0])
+
+            if self._sub_socket in sockets:
+                self._receive_ticks(topics)
+
+        self._sub_socket.close(linger=0)
+        self._control_pull.close(linger=0)
+
+    def _receive_ticks(self, topics: message.TopicCache):
+        received = False
+
+        while True:
+            try:
+                frames = self._sub_socket.recv_multipart(zmq.DONTWAIT, copy=False)
+            except zmq.error.Again:
+                break
+
+            try:
+                symbol, tick = self._read_tick(frames, topics)
+            except (ValueError, TypeError) as e:
+                self._logger.warning('failed to read event msg: %s', e)
+                continue
+
+            buffer = self._buffers.get(symbol)
+
+            if buffer is None:
+                buffer = _TickBuffer(self._capacity)
+                self._buffers[symbol] = buffer
+
+            buffer.ticks.append((perf_counter(), tick))
+            buffer.received += 1
+            received = True
+
+        if received:
+            self._ready.set()
+
+    def _read_tick(self, frames: List[zmq.Frame], topics: message.TopicCache) -> Tuple[str, Tick]:
+        static_name, dynamic_name, content = message.split_event_frames(frames, topics)
+
+        EventType = self._event_types.get(static_name)
+
+        if EventType is None:
+            raise ValueError("received event message with unknown name '%s'" % static_name)
+
+        if not EventType.is_binary:
+            content = message.read_event_content(static_name, content, self._codec)
+
+        event = EventType(dynamic_name if dynamic_name is not None else static_name, content)
+
+        return event.symbol(), event.tick()
\ No newline at end of file
@@ -0,0 +1,94 @@
+from typing import Dict, Optional, Union
+
+class TimeoutProfile:
+    """Defines how long requests may take before they time out.
+
+    Description
+    -----------
+    A timeout profile assigns a time budget, in seconds, to each command. The
+    budget of a request covers sending it, receiving its response and any retry
+    of it, such that a request fails at most `timeout` seconds after it is made.
+    Commands which have no budget of their own are given `default_timeout`.
+
+    The following profiles are predefined:
+
+    - `TimeoutProfile.LIVE`: for an Expert attached to a chart. Requests are
+      answered within milliseconds, so a dead connection is detected quickly,
+      while history requests are given more time.
+
+    - `TimeoutProfile.TESTER`: for an Expert run by the MT4 Strategy Tester. When
+      the Tester runs at its slowest speed in visual mode, it may take about 24
+      seconds between calls to the Expert's `OnTick()`, which is the only place
+      the Expert processes requests while testing (`OnTimer()` is not called by
+      the Tester). Requests are thus given 40 seconds.
+
+    - `TimeoutProfile.BULK_HISTORY`: like `LIVE`, but allows history requests of
+      large ranges to take several minutes.
+    """
+
+    LIVE:         'TimeoutProfile'
+    TESTER:       'TimeoutProfile'
+    BULK_HISTORY: 'TimeoutProfile'
+
+    def __init__(self,
+                 name:             str,
+                 default_timeout:  float,
+                 command_timeouts: Optional[Dict[str, float]] = None
+    ):
+        if default_timeout <= 0:
+            raise ValueError('timeout must be positive (got: %s)' % default_timeout)
+
+        self._name             = name
+        self._default_timeout  = default_timeout
+        self._command_timeouts = dict(command_timeouts) if command_timeouts is not None else {}
+
+    @staticmethod
+    def named(name: str) -> 'TimeoutProfile':
+        """Returns a predefined profile by its name ('live', 'tester', or 'bulk-history').
+
+        Raises
+        ------
+        ValueError
+            If `name` is not the name of a predefined profile.
+        """
+
+        for profile in [TimeoutProfile.LIVE, TimeoutProfile.TESTER, TimeoutProfile.BULK_HISTORY]:
+            if profile.name() == name:
+                return profile
+
+        raise ValueError("unknown timeout profile '%s'" % name)
+
+    @staticmethod
+    def of(profile: Union[str, 'TimeoutProfile']) -> 'TimeoutProfile':
+        if isinstance(profile, TimeoutProfile):
+            return profile
+
+        return TimeoutProfile.named(profile)
+
+    def name(self) -> str:
+        return self._name
+
+    def default_timeout(self) -> float:
+        return self._default_timeout
+
+    def timeout(self, command: str) -> float:
+        """Returns the time budget of requests with command `command`."""
+
+        return self._command_timeouts.get(command, self._default_timeout)
+
+    def __str__(self) -> str:
+        return "TimeoutProfile('%s', default: %ss, commands: %s)" % (self._name, self._default_timeout, self._command_timeouts)
+
+TimeoutProfile.LIVE = TimeoutProfile('live', 2.0, {
+    'getHistoryBars': 30.0,
+    'batch':          10.0
+})
+
+TimeoutProfile.TESTER = TimeoutProfile('tester', 40.0, {
+    'getHistoryBars': 60.0
+})
+
+TimeoutProfile.BULK_HISTORY = TimeoutProfile('bulk-history', 2.0, {
+    'getHistoryBars': 300.0,
+    'batch':          60.0
+})
@@ -0,0 +1,2 @@
+from .tick_source     import TickSource, recorded_ticks, csv_ticks
+from .replay_exchange import ReplayExchange
\ No newline at end of file
@@ -0,0 +1,258 @@
+import threading
+from datetime import datetime, timezone
+from time     import monotonic
+from typing   import Dict, Iterator, List, Optional, Set, Tuple
+from rmt      import error, Exchange, Tick, Bar, Timeframe, Order, BarAggregator
+from .tick_source import TickSource
+
+class ReplayExchange(Exchange):
+    """Replays recorded ticks through `tick_received`, for backtesting strategies.
+
+    Description
+    -----------
+    Ticks are taken from `ticks`, in order, such as those yielded by `recorded_ticks()`
+    or `csv_ticks()`, and emitted by `process_events()` or `run()` for the symbols
+    subscribed to. Ticks of other symbols are skipped, though they still advance
+    the clock and the bars of their symbol.
+
+    If `speed` is `None`, ticks are replayed as fast as they are processed. Otherwise,
+    they are paced by a simulated clock which runs `speed` times as fast as real
+    time, starting at the time of the first tick, so `speed=1` replays ticks in
+    real time and `speed=60` replays an hour in a minute. `time()` returns the
+    simulated time.
+
+    `get_tick()` returns the last tick replayed of a symbol, and `get_history_bars()`
+    and `get_current_bar()` return bars of any timeframe built by a `BarAggregator`
+    from the ticks replayed so far. Orders are not supported.
+
+    `stop()` makes `run()` or `run_until()` return after the tick being replayed,
+    and the replay may be resumed by running again. Once all ticks are replayed,
+    `run()` or `run_until()` returns as if `stop()` was called, and `is_finished()`
+    returns true.
+    """
+
+    def __init__(self, ticks: TickSource, speed: Optional[float] = None):
+        super().__init__()
+
+        if speed is not None and speed <= 0:
+            raise ValueError('replay speed must be positive (got: %s)' % speed)
+
+        self._ticks: Iterator[Tuple[str, Tick]] = iter(ticks)
+        self._speed = speed
+
+        # Next tick to be replayed, which was read ahead to know its time.
+        self._next_tick: Optional[Tuple[str, Tick]] = None
+        self._finished = False
+
+        self._subscribed_symbols: Set[str] = set()
+        self._subscribed_all = False
+
+        self._last_ticks: Dict[str, Tick] = {}
+        self._bars = BarAggregator(history=None)
+        self._replayed_count = 0
+
+        self._time: Optional[datetime] = None
+
+        # Simulated clock, started on the first call to `process_events()`.
+        self._start_timestamp: Optional[float] = None
+        self._start_monotonic: Optional[float] = None
+
+        self._wakeup = threading.Event()
+
+        # Incremented by `stop()`, so that `process_events()` only halts on a stop
+        # requested while it runs, rather than on a request already handled by
+        # `run_until()`, or left over from an earlier call.
+        self._stop_count = 0
+
+    def speed(self) -> Optional[float]:
+        return self._speed
+
+    def time(self) -> Optional[datetime]:
+        """Returns the simulated server time, or `None` before the replay begins.
+
+        If the replay is paced, this is the time of the simulated clock. Otherwise,
+        it's the time of the last tick replayed.
+        """
+
+        if self._speed is None or self._start_timestamp is None:
+            return self._time
+
+        return datetime.fromtimestamp(self._clock(), timezone.utc)
+
+    def is_finished(self) -> bool:
+        return self._finished
+
+    def replayed_count(self) -> int:
+        """Number of ticks replayed so far, of all symbols."""
+
+        return self._replayed_count
+
+    def get_tick(self, symbol: str, timeout: Optional[float] = None) -> Tick:
+        tick = self._last_ticks.get(symbol)
+
+        if tick is None:
+            raise error.ExecutionError("no tick of symbol '%s' was replayed yet" % symbol)
+
+        return tick
+
+    def get_history_bars(self,
+                         symbol:     str,
+                         start_time: Optional[datetime] = None,
+                         end_time:   Optional[datetime] = None,
+                         timeframe:  Timeframe = Timeframe.M1,
+                         timeout:    Optional[float] = None
+    ) -> List[Bar]:
+        """Returns the closed bars of a symbol from `start_time` to `end_time`, inclusive."""
+
+        self._check_replayed(symbol)
+
+        return self._bars.bars(symbol, timeframe, start_time, end_time)
+
+    def get_current_bar(self,
+                        symbol:    str,
+                        timeframe: Timeframe = Timeframe.M1,
+                        timeout:   Optional[float] = None
+    ) -> Bar:
+        self._check_replayed(symbol)
+
+        return self._bars.current_bar(symbol, timeframe)
+
+    def subscribe(self, symbol: str, timeout: Optional[float] = None):
+        self._subscribed_symbols.add(symbol)
+
+    def subscribe_all(self, timeout: Optional[float] = None):
+        self._subscribed_all = True
+
+    def unsubscribe(self, symbol: str):
+        self._subscribed_symbols.discard(symbol)
+
+    def unsubscribe_all(self):
+        self._subscribed_symbols.clear()
+        self._subscribed_all = False
+
+    def subscriptions(self) -> Set[str]:
+        return self._subscribed_symbols.copy()
+
+    def orders(self) -> Dict[int, Order]:
+        return {}
+
+    def process_events(self,
+                       max_events: Optional[int]   = None,
+                       max_time:   Optional[float] = None
+    ) -> Tuple[int, bool]:
+        """Replays the ticks which are due. See `Exchange.process_events()`.
+
+        Each tick replayed counts as an event, whether it's emitted or skipped. If
+        `stop()` is called while this method runs, e.g. by a callback, no more ticks
+        are replayed by this call.
+        """
+
+        if self._finished:
+            self.stop()
+            return 0, False
+
+        deadline   = None if max_time is None else monotonic() + max_time
+        handled    = 0
+        stop_count = self._stop_count
+
+        if self._speed is not None and self._start_timestamp is None:
+            self._start_clock()
+
+        # Ticks up to the simulated time are due, if paced.
+        due_timestamp = None if self._speed is None else self._clock()
+
+        while True:
+            if max_events is not None and handled >= max_events:
+                return handled, self._has_due_tick(due_timestamp)
+
+            if deadline is not None and monotonic() >= deadline:
+                return handled, self._has_due_tick(due_timestamp)
+
+            next_tick = self._peek()
+
+            if next_tick is None:
+                self._finished = True
+                self.stop()
+                return handled, False
+
+            symbol, tick = next_tick
+            timestamp    = tick.server_time.timestamp()
+
+            if due_timestamp is not None and timestamp > due_timestamp:
+                return handled, False
+
+            self._next_tick = None
+            self._replay(symbol, tick)
+            handled += 1
+
+            if self._stop_count != stop_count:
+                return handled, self._has_due_tick(due_timestamp)
+
+    def wait_for_events(self, timeout: Optional[float] = None) -> bool:
+        if self._finished:
+            return False
+
+        if self._speed is None or self._start_timestamp is None:
+            return True
+
+        next_tick = self._peek()
+
+        if next_tick is None:
+            return True
+
+        # Real time until the simulated clock reaches the next tick.
+        delay = (next_tick[1].server_time.timestamp() - self._clock()) / self._speed
+
+        if timeout is not None:
+            delay = min(delay, timeout)
+
+        if delay > 0:
+            self._wakeup.wait(delay)
+            self._wakeup.clear()
+
+        return next_tick[1].server_time.timestamp() <= self._clock()
+
+    def stop(self):
+        super().stop()
+        self._stop_count += 1
+        self._wakeup.set()
+
+    #===============================================================================
+    # Internals
+    #===============================================================================
+    def _peek(self) -> Optional[Tuple[str, Tick]]:
+        if self._next_tick is None:
+            self._next_tick = next(self._ticks, None)
+
+        return self._next_tick
+
+    def _has_due_tick(self, due_timestamp: Optional[float]) -> bool:
+        next_tick = self._peek()
+
+        return next_tick is not None and (due_timestamp is None or next_tick[1].server_time.timestamp() <= due_timestamp)
+
+    def _start_clock(self):
+        next_tick = self._peek()
+
+        if next_tick is not None:
+            self._start_timestamp = next_tick[1].server_time.timestamp()
+            self._start_monotonic = monotonic()
+
+    def _clock(self) -> float:
+        return self._start_timestamp + (monotonic() - self._start_monotonic) * self._speed
+
+    def _replay(self, symbol: str, tick: Tick):
+        # Bars are updated first, so that a strategy notified of the first tick of
+        # a bar finds the previous bar closed.
+        self._bars.add(symbol, tick)
+
+        self._last_ticks[symbol] = tick
+        self._time = tick.server_time
+        self._replayed_count += 1
+
+        if self._subscribed_all or symbol in self._subscribed_symbols:
+            self.tick_received.emit(symbol, tick)
+
+    def _check_replayed(self, symbol: str):
+        if symbol not in self._last_ticks:
+            raise error.ExecutionError("no tick of symbol '%s' was replayed yet" % symbol)
\ No newline at end of file
@@ -0,0 +1,99 @@
+import csv
+import heapq
+from datetime  import datetime, timezone
+from itertools import repeat
+from typing    import Iterable, Iterator, List, Optional, Tuple
+from rmt       import Tick
+
+TickSource = Iterable[Tuple[str, Tick]]
+"""Ticks to be replayed, as pairs of symbol and tick, in order of server time."""
+
+def recorded_ticks(directory:  str,
+                   symbols:    Optional[Iterable[str]] = None,
+                   start_time: Optional[datetime]      = None,
+                   end_time:   Optional[datetime]      = None
+) -> Iterator[Tuple[str, Tick]]:
+    """Yields the ticks of a recording made by `TickRecorder`, of all symbols or of
+    `symbols` only, from `start_time` to `end_time`, in order of server time.
+
+    Ticks of the same time are yielded in the order of `symbols`. Requires NumPy.
+    """
+
+    from rmt.tick_recorder import TickRecording
+
+    recording = TickRecording(directory)
+    symbols   = recording.symbols() if symbols is None else list(symbols)
+    streams   = [_symbol_ticks(recording, i, symbol, start_time, end_time) for i, symbol in enumerate(symbols)]
+
+    # The ticks of each symbol are in order already, so they're merged as they're
+    # read, a segment at a time, rather than read and sorted all together. Ties are
+    # broken by the index of the symbol, and `merge()` keeps the ticks of a symbol
+    # in their order of receipt.
+    for time, i, bid, ask in heapq.merge(*streams):
+        yield symbols[i], Tick(datetime.fromtimestamp(time, timezone.utc), bid, ask)
+
+def csv_ticks(path: str, symbol: Optional[str] = None) -> Iterator[Tuple[str, Tick]]:
+    """Yields the ticks of a CSV file, in the order of its rows.
+
+    Description
+    -----------
+    Rows are made of the columns `symbol,time,bid,ask`, or of `time,bid,ask` if
+    `symbol` is given, in which case all ticks are of that symbol. A header row,
+    whose first column is `symbol` or `time`, is skipped.
+
+    Time is either a POSIX timestamp in seconds, or an ISO 8601 date and time such
+    as `2020-09-13 12:26:40.250`, which is taken as UTC if it has no time zone.
+
+    Raises
+    ------
+    ValueError
+        If a row has too few columns, or a value is not valid.
+    """
+
+    with open(path, newline='') as file:
+        for line, row in enumerate(csv.reader(file), 1):
+            if len(row) == 0 or row[0].strip().lower() in ('symbol', 'time'):
+                continue
+
+            if symbol is None:
+                if len(row) < 4:
+                    raise ValueError('%s:%s: expected columns symbol,time,bid,ask' % (path, line))
+
+                yield row[0].strip(), _read_tick(row[1:4])
+            else:
+                if len(row) < 3:
+                    raise ValueError('%s:%s: expected columns time,bid,ask' % (path, line))
+
+                yield symbol, _read_tick(row[0:3])
+
+def _read_tick(row: List[str]) -> Tick:
+    time = row[0].strip()
+
+    try:
+        server_time = datetime.fromtimestamp(float(time), timezone.utc)
+    except ValueError:
+        server_time = datetime.fromisoformat(time)
+
+        if server_time.tzinfo is None:
+            server_time = server_time.replace(tzinfo=timezone.utc)
+
+    return Tick(server_time, float(row[1]), float(row[2]))
+
+def _symbol_ticks(recording:  'TickRecording',
+                  index:      int,
+                  symbol:     str,
+                  start_time: Optional[datetime],
+                  end_time:   Optional[datetime]
+) -> Iterator[Tuple[float, int, float, float]]:
+    # Converted in chunks, since `tolist()` is much faster than reading items one by one.
+    chunk_size = 65536
+
+    for window in recording.read_segments(symbol, start_time, end_time):
+        times = window.times()
+        bids  = window.bids()
+        asks  = window.asks()
+
+        for start in range(0, len(window), chunk_size):
+            end = start + chunk_size
+
+            yield from zip(times[start:end].tolist(), repeat(index), bids[start:end].tolist(), asks[start:end].tolist())
\ No newline at end of file
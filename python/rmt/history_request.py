@@ -0,0 +1,85 @@
+from datetime import datetime
+from typing   import List, Optional
+from rmt      import Bar, Timeframe
+
+class HistoryRequest:
+    """Identifies the history bars of a symbol in a timeframe to be fetched by
+    `Exchange.get_history_bars_many()`.
+
+    The arguments after `symbol` are keyword-only, so that they may not be passed
+    in an order other than that of `Exchange.get_history_bars()`.
+    """
+
+    __slots__ = ('_symbol', '_timeframe', '_start_time', '_end_time')
+
+    def __init__(self,
+                 symbol:     str,
+                 *,
+                 start_time: Optional[datetime] = None,
+                 end_time:   Optional[datetime] = None,
+                 timeframe:  Timeframe = Timeframe.M1
+    ):
+        self._symbol     = symbol
+        self._timeframe  = timeframe
+        self._start_time = start_time
+        self._end_time   = end_time
+
+    def symbol(self) -> str:
+        return self._symbol
+
+    def timeframe(self) -> Timeframe:
+        return self._timeframe
+
+    def start_time(self) -> Optional[datetime]:
+        return self._start_time
+
+    def end_time(self) -> Optional[datetime]:
+        return self._end_time
+
+    def __str__(self) -> str:
+        return 'HistoryRequest(%s %s, %s to %s)' % (self._symbol, self._timeframe.value, self._start_time, self._end_time)
+
+class HistoryResult:
+    """Outcome of a `HistoryRequest`: its bars, or the error which made it fail."""
+
+    __slots__ = ('_request', '_bars', '_error')
+
+    def __init__(self, request: HistoryRequest, bars: Optional[List[Bar]] = None, error: Optional[Exception] = None):
+        self._request = request
+        self._bars    = bars
+        self._error   = error
+
+    def request(self) -> HistoryRequest:
+        return self._request
+
+    def symbol(self) -> str:
+        return self._request.symbol()
+
+    def timeframe(self) -> Timeframe:
+        return self._request.timeframe()
+
+    def succeeded(self) -> bool:
+        return self._error is None
+
+    def bars(self) -> List[Bar]:
+        """Returns the bars fetched.
+
+        Raises
+        ------
+        Exception
+            The error which made the request fail, if it did.
+        """
+
+        if self._error is not None:
+            raise self._error
+
+        return self._bars
+
+    def error(self) -> Optional[Exception]:
+        return self._error
+
+    def __str__(self) -> str:
+        if self._error is not None:
+            return 'HistoryResult(%s %s, error: %s)' % (self.symbol(), self.timeframe().value, self._error)
+
+        return 'HistoryResult(%s %s, %s bars)' % (self.symbol(), self.timeframe().value, len(self._bars))
\ No newline at end of file
@@ -8,6 +8,24 @@ class Instrument:
     and ask prices, must be retrieved from an `Exchange`.
     """
 
+    __slots__ = (
+        '_symbol',
+        '_description',
+        '_base_currency',
+        '_profit_currency',
+        '_margin_currency',
+        '_decimal_places',
+        '_point',
+        '_tick_size',
+        '_contract_size',
+        '_lot_step',
+        '_min_lot',
+        '_max_lot',
+        '_min_stop_lvl',
+        '_freeze_lvl',
+        '_spread'
+    )
+
     def __init__(self,
                  symbol: str,
                  description: str,
@@ -178,4 +196,4 @@ class Instrument:
         return self.spread == 0
 
     def __repr__(self) -> str:
-        return pformat(vars(self), indent=4, width=1)
\ No newline at end of file
+        return pformat({name: getattr(self, name) for name in self.__slots__}, indent=4, width=1)
\ No newline at end of file
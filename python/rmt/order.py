@@ -29,6 +29,26 @@ class OrderStatus(IntEnum):
 class Order:
     """Stores information about an order."""
 
+    __slots__ = (
+        '_symbol',
+        '_side',
+        '_type',
+        '_lots',
+        '_status',
+        '_open_price',
+        '_open_time',
+        '_close_price',
+        '_close_time',
+        '_stop_loss',
+        '_take_profit',
+        '_expiration',
+        '_magic_number',
+        '_comment',
+        '_commission',
+        '_profit',
+        '_swap'
+    )
+
     def __init__(self,
                  symbol:       str,
                  side:         Side,
@@ -124,4 +144,4 @@ class Order:
             return datetime.now(timezone.utc) - self.open_time()
 
     def __repr__(self) -> str:
-        return pformat(vars(self), indent=4, width=1)
\ No newline at end of file
+        return pformat({name: getattr(self, name) for name in self.__slots__}, indent=4, width=1)
\ No newline at end of file
@@ -0,0 +1,94 @@
+from typing       import Any, Callable, Dict, List, Optional, Tuple
+from PyQt5.QtCore import QObject, pyqtSignal
+from rmt          import Signal
+
+class QtSignalBridge(QObject):
+    """Re-emits the signals of an object, such as an `Exchange`, as `pyqtSignal`s.
+
+    Description
+    -----------
+    Exchanges and strategies are plain classes whose signals are `Signal`s, which
+    call their callbacks directly from the emitting thread. Qt code which relies on
+    `QObject` signals, e.g. on queued connections across threads, connects to the
+    bridge instead, whose `pyqtSignal`s have the same names and arguments:
+
+        bridge = QtSignalBridge.of(exchange)
+        bridge.tick_received.connect(window.on_tick, Qt.QueuedConnection)
+
+    Bridges are created by `QtSignalBridge.of()`. Each emission costs one `pyqtSignal`
+    emission on top of the `Signal` one, so only the signals used by Qt code should
+    be bridged. Requires PyQt5.
+    """
+
+    _signal_names: Tuple[str, ...] = ()
+
+    def __init__(self, source: Any, names: Optional[List[str]] = None, parent: Optional[QObject] = None):
+        super().__init__(parent)
+
+        self._source = source
+
+        # Bound signals are created on each access, so their `emit` is kept to disconnect it.
+        self._slots: Dict[str, Callable[..., None]] = {
+            name: getattr(self, name).emit
+            for name in (self._signal_names if names is None else names)
+        }
+
+        for name, slot in self._slots.items():
+            getattr(source, name).connect(slot)
+
+    @staticmethod
+    def of(source: Any, names: Optional[List[str]] = None, parent: Optional[QObject] = None) -> 'QtSignalBridge':
+        """Returns a bridge re-emitting the signals of `source`, or only those in `names`.
+
+        Raises
+        ------
+        ValueError
+            If a name in `names` is not a signal of `source`.
+        """
+
+        bridge_type = _bridge_type(type(source))
+
+        if names is not None:
+            unknown = [name for name in names if name not in bridge_type._signal_names]
+
+            if unknown:
+                raise ValueError('not signals of %s: %s' % (type(source).__name__, ', '.join(unknown)))
+
+        return bridge_type(source, names, parent)
+
+    def source(self) -> Any:
+        return self._source
+
+    def detach(self):
+        """Stops re-emitting the signals of the source."""
+
+        for name, slot in self._slots.items():
+            getattr(self._source, name).disconnect(slot)
+
+        self._slots = {}
+
+#===============================================================================
+# Internals
+#===============================================================================
+_bridge_types: Dict[type, type] = {}
+
+def _bridge_type(source_type: type) -> type:
+    """Returns a subclass of `QtSignalBridge` declaring a `pyqtSignal` for each `Signal`
+    of `source_type`, since a `pyqtSignal` must be declared by a class."""
+
+    bridge_type = _bridge_types.get(source_type)
+
+    if bridge_type is None:
+        signals = {}
+
+        for cls in reversed(source_type.__mro__):
+            for name, value in vars(cls).items():
+                if isinstance(value, Signal):
+                    signals[name] = pyqtSignal(*value.types())
+
+        namespace = dict(signals, _signal_names=tuple(signals))
+        bridge_type = type(source_type.__name__ + 'QtSignalBridge', (QtSignalBridge,), namespace)
+
+        _bridge_types[source_type] = bridge_type
+
+    return bridge_type
@@ -0,0 +1,138 @@
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+Slot = Callable[..., Any]
+
+class Signal:
+    """Event of an object, to which callbacks are connected.
+
+    Description
+    -----------
+    Declared as a class attribute, like a `pyqtSignal`, and accessed through an
+    instance as a `BoundSignal`, which holds the callbacks connected to the event
+    of that instance:
+
+        class Exchange:
+            tick_received = Signal(str, Tick)
+
+        exchange.tick_received.connect(on_tick)
+        exchange.tick_received.connect(on_eurusd_tick, 'EURUSD')
+        exchange.tick_received.emit('EURUSD', tick)
+
+    Unlike a `pyqtSignal`, a signal requires no Qt object nor event loop, and its
+    arguments are passed to callbacks as is. Callbacks are always called by the
+    thread which emits the signal.
+
+    `types` document the arguments of the event, and are not checked.
+    """
+
+    def __init__(self, *types: type):
+        self._types = types
+        self._name: Optional[str] = None
+
+    def types(self) -> Tuple[type, ...]:
+        return self._types
+
+    def __set_name__(self, owner: type, name: str):
+        self._name = name
+
+    def __get__(self, instance: Any, owner: type):
+        if instance is None:
+            return self
+
+        # Stored in the instance's dictionary, which takes precedence over this
+        # descriptor on the next lookups, so only the first lookup calls `__get__`.
+        return instance.__dict__.setdefault(self._name, BoundSignal(self._types))
+
+class BoundSignal:
+    """Callbacks connected to the event of an object. See `Signal`.
+
+    Callbacks may be connected to any emission of the event, or only to emissions
+    whose first argument equals a key, such as a symbol, so that emitting the event
+    costs one dictionary lookup however many callbacks are connected to other keys.
+
+    Callbacks connected to any emission are called first, then those connected to
+    the key, each in the order they were connected. An exception raised by a callback
+    propagates to the caller of `emit()`, and the remaining callbacks are not called.
+
+    Callbacks may be connected and disconnected from any thread, and from a callback.
+    An emission which is under way calls the callbacks which were connected when it
+    began.
+    """
+
+    def __init__(self, types: Tuple[type, ...] = ()):
+        self._types = types
+        self._slots: Tuple[Slot, ...] = ()
+        self._keyed_slots: Dict[Hashable, Tuple[Slot, ...]] = {}
+
+        # Serializes changes to the slots, which are read by `emit()` without it.
+        self._lock = threading.Lock()
+
+    def types(self) -> Tuple[type, ...]:
+        return self._types
+
+    def connect(self, slot: Slot, key: Optional[Hashable] = None):
+        """Calls `slot` on each emission, or only on those whose first argument
+        equals `key` if it's not `None`.
+        """
+
+        # Tuples are replaced rather than changed, so that `emit()` needs no lock.
+        with self._lock:
+            if key is None:
+                self._slots = self._slots + (slot,)
+            else:
+                self._keyed_slots[key] = self._keyed_slots.get(key, ()) + (slot,)
+
+    def disconnect(self, slot: Optional[Slot] = None, key: Optional[Hashable] = None):
+        """Disconnects `slot` from emissions of `key`, or from any emission if `key`
+        is `None`. If `slot` is `None`, disconnects all callbacks of `key`, or all
+        callbacks if `key` is also `None`.
+
+        Raises
+        ------
+        ValueError
+            If `slot` is not connected.
+        """
+
+        with self._lock:
+            if slot is None:
+                if key is None:
+                    self._slots       = ()
+                    self._keyed_slots = {}
+                else:
+                    self._keyed_slots.pop(key, None)
+
+                return
+
+            slots = self._slots if key is None else self._keyed_slots.get(key, ())
+
+            if slot not in slots:
+                raise ValueError('slot is not connected')
+
+            index = slots.index(slot)
+            slots = slots[:index] + slots[(index + 1):]
+
+            if key is None:
+                self._slots = slots
+            elif len(slots) != 0:
+                self._keyed_slots[key] = slots
+            else:
+                self._keyed_slots.pop(key, None)
+
+    def receivers(self, key: Optional[Hashable] = None) -> int:
+        """Returns the number of callbacks called on an emission of `key`, or of
+        callbacks connected to any emission if `key` is `None`.
+        """
+
+        if key is None:
+            return len(self._slots)
+
+        return len(self._slots) + len(self._keyed_slots.get(key, ()))
+
+    def emit(self, *args: Any):
+        for slot in self._slots:
+            slot(*args)
+
+        if self._keyed_slots and args:
+            for slot in self._keyed_slots.get(args[0], ()):
+                slot(*args)
\ No newline at end of file
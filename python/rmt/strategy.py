@@ -1,9 +1,10 @@
-from datetime     import datetime, timedelta
-from typing       import Optional
-from PyQt5.QtCore import QObject, pyqtSlot
-from rmt          import Exchange, Tick, Bar
+import logging
+import warnings
+from datetime import datetime
+from typing   import Optional, Set, Tuple
+from rmt      import error, Exchange, Tick, Bar, Timeframe, BarAggregator
 
-class Strategy(QObject):
+class Strategy:
     """
     Building block of algorithmic trading.
 
@@ -14,16 +15,69 @@ class Strategy(QObject):
     The methods `Strategy.on_tick()` and `Strategy.on_bar_closed()` are provided for
     strategy-specific logic, and should be overloaded by subclasses.
 
-    After a bar closes, `Strategy.on_bar_closed()` is invoked immediately before
-    `Strategy.on_tick()`.
+    Bars are built from the ticks received by a `BarAggregator`, for each symbol in
+    each timeframe of `Strategy.timeframes`, which subclasses may override. A bar
+    closes when the first tick of a later bar is received, upon which
+    `Strategy.on_bar_closed()` is invoked, once per bar, immediately before
+    `Strategy.on_tick()`, without any request to the exchange.
+
+    The current bars and up to `Strategy.bar_history` closed bars of each symbol are
+    fetched from the exchange, so that the first bars closed are complete: those of
+    the symbols subscribed to when the strategy is created, and those of symbols
+    subscribed to with `Strategy.subscribe()`. As no request is sent while a tick is
+    handled, bars of other symbols, or of symbols whose bars the exchange can't
+    provide, start at their first tick. A tick received between fetching the bars
+    of a symbol and handling its ticks may be counted twice or missed, which
+    `BarAggregator.reconcile()` corrects.
+
+    Strategies were formerly `QObject`s, and no longer are; see `QtSignalBridge`.
+
+    A subclass overriding `on_bar_closed(symbol, bar)`, the signature of earlier
+    versions, is still supported if it declares a single timeframe, but is deprecated.
     """
 
+    timeframes: Tuple[Timeframe, ...] = (Timeframe.M1,)
+    """Timeframes of the bars reported to `Strategy.on_bar_closed()`."""
+
+    bar_history: int = 0
+    """Number of closed bars kept per symbol and timeframe by `Strategy.bar_aggregator`."""
+
     def __init__(self, exchange: Exchange):
-        super().__init__()
+        from inspect import Parameter, iscoroutinefunction, signature
+
+        # The callbacks of a strategy are called synchronously, so they may not await
+        # the requests of an asynchronous exchange, such as `AsyncMetaTrader4`.
+        if iscoroutinefunction(exchange.get_history_bars):
+            raise TypeError('a strategy may not run on an asynchronous exchange (got: %s)' % type(exchange).__name__)
 
         self._exchange = exchange
         self._exchange.tick_received.connect(self._on_tick_received)
-        self._last_closed_bar_time: Optional[datetime] = None
+
+        # Not attached to the exchange, so that bars are closed before `on_tick()`.
+        self._bar_aggregator = BarAggregator(timeframes=self.timeframes, history=self.bar_history)
+
+        positional = [
+            parameter for parameter in signature(self.on_bar_closed).parameters.values()
+            if parameter.kind in (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD, Parameter.VAR_POSITIONAL)
+        ]
+
+        if len(positional) == 2 and positional[-1].kind != Parameter.VAR_POSITIONAL:
+            if len(self.timeframes) != 1:
+                raise TypeError('on_bar_closed(symbol, bar) may not tell the timeframes of %s apart; '
+                                'override on_bar_closed(symbol, timeframe, bar) instead' % type(self).__name__)
+
+            warnings.warn('on_bar_closed(symbol, bar) of %s is deprecated; override '
+                          'on_bar_closed(symbol, timeframe, bar) instead' % type(self).__name__,
+                          DeprecationWarning, stacklevel=2)
+
+            self._bar_aggregator.bar_closed.connect(self._on_bar_closed_without_timeframe)
+        else:
+            self._bar_aggregator.bar_closed.connect(self._on_bar_closed)
+
+        self._logger = logging.getLogger(Strategy.__name__)
+
+        for symbol in self._subscriptions():
+            self._seed(symbol)
 
     @property
     def exchange(self) -> Exchange:
@@ -31,12 +85,28 @@ class Strategy(QObject):
 
         return self._exchange
 
+    @property
+    def bar_aggregator(self) -> BarAggregator:
+        """The aggregator building the bars of the strategy from ticks."""
+
+        return self._bar_aggregator
+
+    def subscribe(self, symbol: str, timeout: Optional[float] = None):
+        """Fetches the bars of a symbol, then subscribes to its ticks, unless already
+        subscribed. See `Exchange.subscribe()`."""
+
+        if symbol in self._subscriptions():
+            return
+
+        self._seed(symbol)
+        self._exchange.subscribe(symbol, timeout)
+
     def on_tick(self, symbol: str, server_time: datetime, bid: float, ask: float):
         """Method invoked when an instrument's new quotes is received."""
 
         pass
 
-    def on_bar_closed(self, symbol: str, bar: Bar):
+    def on_bar_closed(self, symbol: str, timeframe: Timeframe, bar: Bar):
         """Method invoked when an instrument's bar is closed."""
 
         pass
@@ -44,18 +114,24 @@ class Strategy(QObject):
     #===============================================================================
     # Internals
     #===============================================================================
-    @pyqtSlot(str, Tick)
     def _on_tick_received(self, symbol: str, tick: Tick):
-        last_closed_bar_time = tick.server_time.replace(second=0) - timedelta(0, 60, 0)
-
-        if self._last_closed_bar_time is None:
-            self._last_closed_bar_time = last_closed_bar_time
-        elif self._last_closed_bar_time != last_closed_bar_time:
-            self._last_closed_bar_time = last_closed_bar_time
-
-            closed_bar = self.exchange.get_history_bar(symbol, last_closed_bar_time)
-
-            if closed_bar is not None:
-                self.on_bar_closed(symbol, closed_bar)
-
-        self.on_tick(symbol, tick.server_time, tick.bid, tick.ask)
\ No newline at end of file
+        self._bar_aggregator.add(symbol, tick)
+        self.on_tick(symbol, tick.server_time, tick.bid, tick.ask)
+
+    def _on_bar_closed(self, symbol: str, timeframe: Timeframe, bar: Bar):
+        self.on_bar_closed(symbol, timeframe, bar)
+
+    def _on_bar_closed_without_timeframe(self, symbol: str, timeframe: Timeframe, bar: Bar):
+        self.on_bar_closed(symbol, bar)
+
+    def _subscriptions(self) -> Set[str]:
+        try:
+            return self._exchange.subscriptions()
+        except error.NotImplementedException:
+            return set()
+
+    def _seed(self, symbol: str):
+        try:
+            self._bar_aggregator.seed(symbol, self._exchange)
+        except error.RMTError as e:
+            self._logger.warning("Building bars of '%s' from its first tick, as they could not be fetched: %s", symbol, e)
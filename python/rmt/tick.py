@@ -2,7 +2,14 @@ from datetime import datetime, timezone
 from typing import Tuple
 
 class Tick:
-    """Stores the quotes of an instrument."""
+    """Stores the quotes of an instrument.
+
+    The fields of a tick are read-only properties, and ticks have no `__dict__`, so
+    that many of them may be held at little cost. Nothing stops code from assigning
+    the underlying slots, which must not be done.
+    """
+
+    __slots__ = ('_server_time', '_bid', '_ask')
 
     def __init__(self,
                  server_time: datetime = datetime.fromtimestamp(0, timezone.utc),
@@ -0,0 +1,436 @@
+import os
+import re
+import logging
+import numpy as np
+from array       import array
+from time        import monotonic
+from typing      import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from rmt         import Exchange, Tick
+from .tick_store import Time, TickWindow, _empty_window, _timestamp
+
+RECORD_DTYPE = np.dtype([
+    ('time',   '<f8'),
+    ('bid',    '<f8'),
+    ('ask',    '<f8'),
+    ('symbol', '<u4')
+])
+"""Layout of a tick record, 28 bytes without padding: server time as a POSIX timestamp
+in seconds, bid, ask, and the number of the symbol in the segment's symbol table."""
+
+_SEGMENT_NAME    = 'ticks-%06d'
+_SEGMENT_PATTERN = re.compile(r'^ticks-(\d{6})\.rec$')
+
+class TickRecorder:
+    """Records ticks into rotating segment files, for research and incident analysis.
+
+    Description
+    -----------
+    A recording is a directory of segments, each made of the following files:
+
+    - `ticks-NNNNNN.rec`: tick records laid out as `RECORD_DTYPE`, in order of receipt.
+    - `ticks-NNNNNN.symbols`: symbol table, one symbol per line, numbered from 0,
+      to which a symbol is added before its first record is written.
+    - `ticks-NNNNNN.idx.npz`: per-symbol index, written when the segment is sealed.
+      It holds the record numbers of each symbol, as `rows_<n>`, their times, as
+      `times_<n>`, and the first and last time of each symbol, as `time_range`.
+
+    Records are buffered, and written when `buffer_size` records are buffered or
+    when a record is appended `flush_interval` seconds or more after the oldest
+    buffered record. As the interval is only checked by `append()`, the records of
+    a stream which falls quiet stay buffered until the next tick, `flush()` or
+    `close()`; to bound their delay, call `flush()` from the thread appending ticks,
+    e.g. between calls to `process_events()`. Once a segment reaches `segment_size`
+    bytes, it is sealed and a new segment is begun. Segments of a previous recording
+    in the same directory are left untouched, and numbering carries on after them.
+
+    A segment which was not sealed, e.g. because the process was killed, is still
+    readable by `TickRecording`, which then scans its records instead of its index.
+
+    A recorder appends the ticks emitted by `tick_received` of the exchange it is
+    attached to, of all symbols or of `symbols` only. Ticks must be appended by one
+    thread at a time, and in order of time per symbol.
+    """
+
+    def __init__(self,
+                 directory:      str,
+                 exchange:       Optional[Exchange]      = None,
+                 symbols:        Optional[Iterable[str]] = None,
+                 segment_size:   int   = 64 * 2**20,
+                 buffer_size:    int   = 4096,
+                 flush_interval: float = 1.0
+    ):
+        if segment_size < RECORD_DTYPE.itemsize:
+            raise ValueError('segment size must be at least %s bytes (got: %s)' % (RECORD_DTYPE.itemsize, segment_size))
+
+        if buffer_size < 1:
+            raise ValueError('buffer size must be at least 1 (got: %s)' % buffer_size)
+
+        os.makedirs(directory, exist_ok=True)
+
+        self._directory      = directory
+        self._segment_size   = segment_size
+        self._flush_interval = flush_interval
+        self._logger         = logging.getLogger(TickRecorder.__name__)
+
+        self._buffer        = np.empty(buffer_size, RECORD_DTYPE)
+        self._buffered      = 0
+        self._buffered_time = 0.0
+
+        existing = _segment_numbers(directory)
+
+        self._segment_number = existing[-1] if existing else 0
+        self._records_file   = None
+        self._symbols_file   = None
+        self._symbol_ids:  Dict[str, int]    = {}
+        self._rows:        List[array]       = []
+        self._time_ranges: List[List[float]] = []
+        self._segment_records = 0
+        self._record_count    = 0
+
+        self._exchange: Optional[Exchange] = None
+        self._symbols:  Optional[List[str]] = None
+
+        if exchange is not None:
+            self.attach(exchange, symbols)
+
+    def directory(self) -> str:
+        return self._directory
+
+    def record_count(self) -> int:
+        """Number of ticks recorded since the recorder was created."""
+
+        return self._record_count
+
+    def attach(self, exchange: Exchange, symbols: Optional[Iterable[str]] = None):
+        """Records the ticks of `symbols`, or of all symbols, received by `exchange`."""
+
+        self.detach()
+
+        self._exchange = exchange
+        self._symbols  = None if symbols is None else list(symbols)
+
+        if self._symbols is None:
+            exchange.tick_received.connect(self.append)
+        else:
+            for symbol in self._symbols:
+                exchange.tick_received.connect(self.append, symbol)
+
+    def detach(self):
+        if self._exchange is None:
+            return
+
+        if self._symbols is None:
+            self._exchange.tick_received.disconnect(self.append)
+        else:
+            for symbol in self._symbols:
+                self._exchange.tick_received.disconnect(self.append, symbol)
+
+        self._exchange = None
+        self._symbols  = None
+
+    def append(self, symbol: str, tick: Tick):
+        if self._records_file is None:
+            self._begin_segment()
+
+        time      = tick.server_time.timestamp()
+        symbol_id = self._symbol_ids.get(symbol)
+
+        if symbol_id is None:
+            symbol_id = self._add_symbol(symbol, time)
+
+        if self._buffered == 0:
+            self._buffered_time = monotonic()
+
+        self._buffer[self._buffered] = (time, tick.bid, tick.ask, symbol_id)
+        self._buffered += 1
+
+        self._rows[symbol_id].append(self._segment_records)
+        self._time_ranges[symbol_id][1] = time
+
+        self._segment_records += 1
+        self._record_count    += 1
+
+        if self._buffered == len(self._buffer) or monotonic() - self._buffered_time >= self._flush_interval:
+            self.flush()
+
+        if self._segment_records * RECORD_DTYPE.itemsize >= self._segment_size:
+            self._seal_segment()
+
+    def flush(self):
+        """Writes buffered records to the current segment."""
+
+        if self._buffered == 0:
+            return
+
+        self._records_file.write(self._buffer[:self._buffered].tobytes())
+        self._records_file.flush()
+        self._buffered = 0
+
+    def close(self):
+        """Detaches the recorder, and seals the current segment."""
+
+        self.detach()
+
+        if self._records_file is not None:
+            self._seal_segment()
+
+    def __enter__(self) -> 'TickRecorder':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    #===============================================================================
+    # Internals
+    #===============================================================================
+    def _begin_segment(self):
+        self._segment_number += 1
+
+        path = os.path.join(self._directory, _SEGMENT_NAME % self._segment_number)
+
+        # Exclusive creation, so that a recording is never appended to by mistake.
+        self._records_file = open(path + '.rec', 'xb')
+        self._symbols_file = open(path + '.symbols', 'x', encoding='utf-8')
+
+        self._symbol_ids      = {}
+        self._rows            = []
+        self._time_ranges     = []
+        self._segment_records = 0
+
+        self._logger.info('Recording ticks to segment: %s', path)
+
+    def _add_symbol(self, symbol: str, time: float) -> int:
+        symbol_id = len(self._rows)
+
+        # Written ahead of the symbol's records, so that they can always be read.
+        self._symbols_file.write(symbol + '\n')
+        self._symbols_file.flush()
+
+        self._symbol_ids[symbol] = symbol_id
+        self._rows.append(array('I'))
+        self._time_ranges.append([time, time])
+
+        return symbol_id
+
+    def _seal_segment(self):
+        self.flush()
+
+        self._records_file.close()
+        self._symbols_file.close()
+        self._records_file = None
+        self._symbols_file = None
+
+        path   = os.path.join(self._directory, _SEGMENT_NAME % self._segment_number)
+        arrays = {'rows_%d' % i: np.frombuffer(rows, np.uint32) for i, rows in enumerate(self._rows)}
+
+        # Times are gathered once here, so that a reader finds a time range of a symbol
+        # by searching its times, without gathering them from all of its records.
+        if self._segment_records != 0:
+            records = np.memmap(path + '.rec', RECORD_DTYPE, 'r', shape=(self._segment_records,))
+
+            for i, rows in enumerate(self._rows):
+                arrays['times_%d' % i] = records['time'][np.frombuffer(rows, np.uint32)]
+
+            del records
+
+        arrays['time_range'] = np.array(self._time_ranges, np.float64).reshape(-1, 2)
+
+        # Written under a temporary name, lest a partial index be taken for a valid one.
+        with open(path + '.idx.tmp', 'wb') as file:
+            np.savez(file, **arrays)
+
+        os.replace(path + '.idx.tmp', path + '.idx.npz')
+
+class TickRecording:
+    """Reads the ticks of a recording made by `TickRecorder`.
+
+    Description
+    -----------
+    Segments are memory-mapped, so only the records of the requested symbol and
+    time range are read from disk. Within a sealed segment, the records of a symbol
+    are found by its index; those of the segment being recorded, or of a segment
+    which was not sealed, are found by scanning the segment.
+
+    A recording may be read while it is being recorded. Segments are listed when
+    the recording is opened, and on `refresh()`.
+    """
+
+    def __init__(self, directory: str):
+        self._directory = directory
+        self._segments: List[_Segment] = []
+
+        self.refresh()
+
+    def refresh(self):
+        """Lists the segments of the recording again, and rereads unsealed segments."""
+
+        sealed = {segment.number: segment for segment in self._segments if segment.is_sealed()}
+
+        self._segments = [
+            sealed.get(number) or _Segment(os.path.join(self._directory, _SEGMENT_NAME % number), number)
+            for number in _segment_numbers(self._directory)
+        ]
+
+    def segment_count(self) -> int:
+        return len(self._segments)
+
+    def symbols(self) -> List[str]:
+        symbols = set()
+
+        for segment in self._segments:
+            symbols.update(segment.symbol_ids)
+
+        return sorted(symbols)
+
+    def count(self, symbol: str) -> int:
+        return sum(len(segment.rows(symbol)) for segment in self._segments)
+
+    def read(self,
+             symbol:     str,
+             start_time: Optional[Time] = None,
+             end_time:   Optional[Time] = None
+    ) -> TickWindow:
+        """Returns the ticks of a symbol from `start_time` to `end_time`, inclusive,
+        or from the first or up to the last tick recorded if either is `None`.
+        """
+
+        parts = list(self.read_segments(symbol, start_time, end_time))
+
+        if not parts:
+            return _empty_window()
+
+        return TickWindow(
+            np.concatenate([part.times() for part in parts]),
+            np.concatenate([part.bids()  for part in parts]),
+            np.concatenate([part.asks()  for part in parts])
+        )
+
+    def read_segments(self,
+                      symbol:     str,
+                      start_time: Optional[Time] = None,
+                      end_time:   Optional[Time] = None
+    ) -> Iterator[TickWindow]:
+        """Yields the ticks returned by `read()` as one window per segment which has any,
+        such that only the ticks of one segment are held in memory at a time."""
+
+        start = -np.inf if start_time is None else _timestamp(start_time)
+        end   =  np.inf if end_time   is None else _timestamp(end_time)
+
+        for segment in self._segments:
+            part = segment.read(symbol, start, end)
+
+            if part is not None:
+                yield TickWindow(*part)
+
+class _Segment:
+    def __init__(self, path: str, number: int):
+        self.number = number
+        self.path   = path
+
+        with open(path + '.symbols', encoding='utf-8') as file:
+            self.symbol_ids = {line.rstrip('\n'): i for i, line in enumerate(file) if line.endswith('\n')}
+
+        size  = os.path.getsize(path + '.rec')
+        count = size // RECORD_DTYPE.itemsize
+
+        # A record being written when the recorder was killed is ignored.
+        if count != 0:
+            self.records = np.memmap(path + '.rec', RECORD_DTYPE, 'r', shape=(count,))
+        else:
+            self.records = np.empty(0, RECORD_DTYPE)
+
+        # Arrays of an index are read out as the symbols are read, so that only those
+        # of the symbols read are held in memory, and the file is not kept open.
+        self.index_path:  Optional[str]        = None
+        self.index_names: Set[str]             = set()
+        self.time_ranges: Optional[np.ndarray] = None
+
+        if os.path.exists(path + '.idx.npz'):
+            self.index_path = path + '.idx.npz'
+
+            with np.load(self.index_path) as npz:
+                self.index_names = set(npz.files)
+                self.time_ranges = npz['time_range']
+
+        self._rows:  Dict[str, np.ndarray] = {}
+        self._times: Dict[str, np.ndarray] = {}
+
+    def is_sealed(self) -> bool:
+        return self.index_path is not None
+
+    def index_array(self, name: str) -> Optional[np.ndarray]:
+        if name not in self.index_names:
+            return None
+
+        with np.load(self.index_path) as npz:
+            return npz[name]
+
+    def rows(self, symbol: str) -> np.ndarray:
+        rows = self._rows.get(symbol)
+
+        if rows is not None:
+            return rows
+
+        symbol_id = self.symbol_ids.get(symbol)
+
+        if symbol_id is None:
+            rows = np.empty(0, np.uint32)
+        elif self.is_sealed():
+            rows = self.index_array('rows_%d' % symbol_id)
+        else:
+            rows = np.flatnonzero(self.records['symbol'] == symbol_id)
+
+        self._rows[symbol] = rows
+
+        return rows
+
+    def times(self, symbol: str, symbol_id: int, rows: np.ndarray) -> np.ndarray:
+        times = self._times.get(symbol)
+
+        if times is not None:
+            return times
+
+        times = self.index_array('times_%d' % symbol_id)
+
+        # Indexes written by earlier versions have no times, so they are gathered once.
+        if times is None:
+            times = self.records['time'][rows]
+
+        self._times[symbol] = times
+
+        return times
+
+    def read(self, symbol: str, start: float, end: float) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        symbol_id = self.symbol_ids.get(symbol)
+
+        if symbol_id is None:
+            return None
+
+        if self.time_ranges is not None:
+            first, last = self.time_ranges[symbol_id]
+
+            if last < start or first > end:
+                return None
+
+        rows  = self.rows(symbol)
+        times = self.times(symbol, symbol_id, rows)
+        lo    = int(np.searchsorted(times, start, 'left'))
+        hi    = int(np.searchsorted(times, end,   'right'))
+
+        if lo >= hi:
+            return None
+
+        rows = rows[lo:hi]
+
+        return times[lo:hi], self.records['bid'][rows], self.records['ask'][rows]
+
+def _segment_numbers(directory: str) -> List[int]:
+    numbers = []
+
+    for name in os.listdir(directory):
+        match = _SEGMENT_PATTERN.match(name)
+
+        if match is not None:
+            numbers.append(int(match.group(1)))
+
+    return sorted(numbers)
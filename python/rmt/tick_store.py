@@ -0,0 +1,304 @@
+import numpy as np
+from datetime import datetime, timezone
+from typing   import Dict, Iterable, List, Optional, Union
+from rmt      import Exchange, Tick
+
+Time = Union[datetime, float]
+
+class TickWindow:
+    """Read-only view of consecutive ticks of a symbol in a `TickStore`.
+
+    The arrays of a window share memory with the store, and are never changed by
+    ticks appended afterwards, so a window may be kept for as long as needed. Note
+    that a kept window also keeps alive the block of memory it was taken from.
+    """
+
+    def __init__(self, times: np.ndarray, bids: np.ndarray, asks: np.ndarray):
+        self._times = times
+        self._bids  = bids
+        self._asks  = asks
+
+    def times(self) -> np.ndarray:
+        """Server times, as POSIX timestamps in seconds."""
+
+        return self._times
+
+    def bids(self) -> np.ndarray:
+        return self._bids
+
+    def asks(self) -> np.ndarray:
+        return self._asks
+
+    def tick(self, index: int) -> Tick:
+        return Tick(
+            datetime.fromtimestamp(float(self._times[index]), timezone.utc),
+            float(self._bids[index]),
+            float(self._asks[index])
+        )
+
+    def __len__(self) -> int:
+        return len(self._times)
+
+    def __str__(self) -> str:
+        if len(self) == 0:
+            return 'TickWindow(0 ticks)'
+
+        return 'TickWindow(%s ticks, %s to %s)' % (len(self), self.tick(0).server_time, self.tick(-1).server_time)
+
+class _TickColumns:
+    """Time, bid and ask arrays of a symbol, of which `[start:end]` holds its ticks.
+
+    Ticks are appended at `end`. When `end` reaches the length of the arrays, the
+    ticks are moved to the start of new arrays, twice as long if more than half
+    full, so that appending costs O(1) on average. Once `capacity` ticks are held,
+    the oldest tick is dropped on each append by moving `start`, and since the
+    arrays are then twice as long as `capacity`, they are replaced at most once
+    every `capacity` appends. Slots `[start:end]` are never written again, which
+    is what lets windows share memory with the store.
+    """
+
+    INITIAL_LENGTH = 1024
+
+    def __init__(self, capacity: Optional[int]):
+        length = self.INITIAL_LENGTH if capacity is None else min(self.INITIAL_LENGTH, 2 * capacity)
+
+        self.capacity = capacity
+        self.times    = np.empty(length, np.float64)
+        self.bids     = np.empty(length, np.float64)
+        self.asks     = np.empty(length, np.float64)
+        self.start    = 0
+        self.end      = 0
+
+    def append(self, time: float, bid: float, ask: float):
+        if self.end == len(self.times):
+            self._reallocate(1)
+
+        end = self.end
+
+        self.times[end] = time
+        self.bids[end]  = bid
+        self.asks[end]  = ask
+        self.end        = end + 1
+
+        if self.capacity is not None and end + 1 - self.start > self.capacity:
+            self.start += 1
+
+    def extend(self, times: np.ndarray, bids: np.ndarray, asks: np.ndarray):
+        count = len(times)
+
+        if self.capacity is not None and count > self.capacity:
+            times = times[-self.capacity:]
+            bids  = bids[-self.capacity:]
+            asks  = asks[-self.capacity:]
+            count = self.capacity
+
+        if self.end + count > len(self.times):
+            self._reallocate(count)
+
+        end = self.end
+
+        self.times[end:(end + count)] = times
+        self.bids[end:(end + count)]  = bids
+        self.asks[end:(end + count)]  = asks
+        self.end = end + count
+
+        if self.capacity is not None and self.end - self.start > self.capacity:
+            self.start = self.end - self.capacity
+
+    def window(self, start: int, end: int) -> TickWindow:
+        columns = []
+
+        for column in (self.times, self.bids, self.asks):
+            view = column[start:end]
+            view.flags.writeable = False
+            columns.append(view)
+
+        return TickWindow(*columns)
+
+    def _reallocate(self, count: int):
+        held   = self.end - self.start
+        length = len(self.times)
+
+        if self.capacity is not None:
+            # Ticks beyond the capacity would be dropped anyway.
+            held = min(held, self.capacity - count)
+
+        # Grows if more than half full, so that at least half of the new arrays is free.
+        while 2 * held > length or held + count > length:
+            length *= 2
+
+        if self.capacity is not None:
+            length = max(min(length, 2 * self.capacity), held + count)
+
+        start = self.end - held
+
+        # New arrays rather than moving ticks in place, which windows may share.
+        for name in ('times', 'bids', 'asks'):
+            column = np.empty(length, np.float64)
+            column[:held] = getattr(self, name)[start:self.end]
+            setattr(self, name, column)
+
+        self.start = 0
+        self.end   = held
+
+class TickStore:
+    """Keeps the recent ticks of each symbol in NumPy arrays, one per field.
+
+    Description
+    -----------
+    Ticks are stored as columns of `float64`: server time as a POSIX timestamp in
+    seconds, bid, and ask. A strategy may thus compute over the ticks of a symbol
+    with vectorized operations, rather than hold a `Tick` object for each.
+
+    If `capacity` is `None`, the ticks of a symbol are kept indefinitely. Otherwise,
+    at most `capacity` ticks are kept per symbol, and the oldest tick is dropped as
+    a new one is appended, which caps the memory of a symbol at `48 * capacity` bytes
+    plus the memory of windows still referenced. Appending a tick costs O(1) on
+    average.
+
+    `last()`, `between()` and `window()` return `TickWindow` views of the store,
+    without copying ticks.
+
+    A store appends the ticks emitted by `tick_received` of the exchange it is
+    attached to, of all symbols or of `symbols` only. Ticks must be appended by
+    one thread at a time, and in order of time per symbol.
+    """
+
+    def __init__(self,
+                 exchange: Optional[Exchange]      = None,
+                 capacity: Optional[int]           = 65536,
+                 symbols:  Optional[Iterable[str]] = None
+    ):
+        if capacity is not None and capacity < 1:
+            raise ValueError('tick store capacity must be at least 1 (got: %s)' % capacity)
+
+        self._capacity = capacity
+        self._columns: Dict[str, _TickColumns] = {}
+
+        self._exchange: Optional[Exchange] = None
+        self._symbols:  Optional[List[str]] = None
+
+        if exchange is not None:
+            self.attach(exchange, symbols)
+
+    def capacity(self) -> Optional[int]:
+        return self._capacity
+
+    def attach(self, exchange: Exchange, symbols: Optional[Iterable[str]] = None):
+        """Appends the ticks of `symbols`, or of all symbols, received by `exchange`."""
+
+        self.detach()
+
+        self._exchange = exchange
+        self._symbols  = None if symbols is None else list(symbols)
+
+        if self._symbols is None:
+            exchange.tick_received.connect(self.append)
+        else:
+            for symbol in self._symbols:
+                exchange.tick_received.connect(self.append, symbol)
+
+    def detach(self):
+        if self._exchange is None:
+            return
+
+        if self._symbols is None:
+            self._exchange.tick_received.disconnect(self.append)
+        else:
+            for symbol in self._symbols:
+                self._exchange.tick_received.disconnect(self.append, symbol)
+
+        self._exchange = None
+        self._symbols  = None
+
+    def append(self, symbol: str, tick: Tick):
+        self._columns_of(symbol).append(tick.server_time.timestamp(), tick.bid, tick.ask)
+
+    def extend(self, symbol: str, times: Iterable[float], bids: Iterable[float], asks: Iterable[float]):
+        """Appends ticks of a symbol given as columns, such as those of a recording."""
+
+        times = np.asarray(times, np.float64)
+        bids  = np.asarray(bids,  np.float64)
+        asks  = np.asarray(asks,  np.float64)
+
+        if not (len(times) == len(bids) == len(asks)):
+            raise ValueError('tick columns differ in length (%s, %s, %s)' % (len(times), len(bids), len(asks)))
+
+        self._columns_of(symbol).extend(times, bids, asks)
+
+    def symbols(self) -> List[str]:
+        return sorted(self._columns)
+
+    def count(self, symbol: str) -> int:
+        columns = self._columns.get(symbol)
+
+        if columns is None:
+            return 0
+
+        return columns.end - columns.start
+
+    def window(self, symbol: str) -> TickWindow:
+        """Returns all ticks kept of a symbol."""
+
+        return self.last(symbol, None)
+
+    def last(self, symbol: str, count: Optional[int]) -> TickWindow:
+        """Returns the last `count` ticks of a symbol, or all of them if `count` is `None`."""
+
+        columns = self._columns.get(symbol)
+
+        if columns is None:
+            return _empty_window()
+
+        start = columns.start
+
+        if count is not None:
+            start = max(start, columns.end - max(0, count))
+
+        return columns.window(start, columns.end)
+
+    def between(self, symbol: str, start_time: Time, end_time: Time) -> TickWindow:
+        """Returns the ticks of a symbol from `start_time` to `end_time`, inclusive."""
+
+        columns = self._columns.get(symbol)
+
+        if columns is None:
+            return _empty_window()
+
+        times = columns.times[columns.start:columns.end]
+        start = columns.start + int(np.searchsorted(times, _timestamp(start_time), 'left'))
+        end   = columns.start + int(np.searchsorted(times, _timestamp(end_time),   'right'))
+
+        return columns.window(start, max(start, end))
+
+    def clear(self, symbol: Optional[str] = None):
+        """Discards the ticks of `symbol`, or of all symbols."""
+
+        if symbol is None:
+            self._columns.clear()
+        else:
+            self._columns.pop(symbol, None)
+
+    #===============================================================================
+    # Internals
+    #===============================================================================
+    def _columns_of(self, symbol: str) -> _TickColumns:
+        columns = self._columns.get(symbol)
+
+        if columns is None:
+            columns = _TickColumns(self._capacity)
+            self._columns[symbol] = columns
+
+        return columns
+
+def _timestamp(time: Time) -> float:
+    if isinstance(time, datetime):
+        return time.timestamp()
+
+    return float(time)
+
+def _empty_window() -> TickWindow:
+    empty = np.empty(0, np.float64)
+    empty.flags.writeable = False
+
+    return TickWindow(empty, empty, empty)
\ No newline at end of file
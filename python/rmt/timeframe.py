@@ -1,4 +1,6 @@
-from enum import Enum
+from datetime import datetime, timezone
+from enum     import Enum
+from typing   import Optional
 
 class Timeframe(Enum):
     M1  = 'M1'
@@ -9,4 +11,51 @@ class Timeframe(Enum):
     H4  = 'H4'
     D1  = 'D1'
     W1  = 'W1'
-    MN1 = 'MN1'
\ No newline at end of file
+    MN1 = 'MN1'
+
+    def seconds(self) -> Optional[int]:
+        """Duration of a bar in seconds, or `None` for `MN1`, whose bars vary in length."""
+
+        return _SECONDS.get(self.value)
+
+    def bar_start(self, timestamp: float) -> int:
+        """Returns the open time of the bar which contains a server time, as POSIX
+        timestamps in seconds.
+
+        As in MT4, weekly bars open on Sunday and monthly bars on the first day of
+        the month, at midnight server time.
+        """
+
+        if self is Timeframe.MN1:
+            time = datetime.fromtimestamp(timestamp, timezone.utc)
+            return int(datetime(time.year, time.month, 1, tzinfo=timezone.utc).timestamp())
+
+        seconds = _SECONDS[self.value]
+        offset  = _WEEK_OFFSET if self is Timeframe.W1 else 0
+
+        return (int(timestamp) - offset) // seconds * seconds + offset
+
+    def next_bar_start(self, bar_start: int) -> int:
+        """Returns the open time of the bar following the bar opened at `bar_start`."""
+
+        if self is Timeframe.MN1:
+            time = datetime.fromtimestamp(bar_start, timezone.utc)
+            year, month = (time.year + 1, 1) if time.month == 12 else (time.year, time.month + 1)
+
+            return int(datetime(year, month, 1, tzinfo=timezone.utc).timestamp())
+
+        return bar_start + _SECONDS[self.value]
+
+_SECONDS = {
+    'M1':  60,
+    'M5':  300,
+    'M15': 900,
+    'M30': 1800,
+    'H1':  3600,
+    'H4':  14400,
+    'D1':  86400,
+    'W1':  604800
+}
+
+# The epoch fell on a Thursday, three days before the Sunday on which weeks begin.
+_WEEK_OFFSET = 3 * 86400
\ No newline at end of file
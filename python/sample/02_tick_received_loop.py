@@ -1,6 +1,5 @@
 import logging
 import rmt
-from time import sleep
 
 logging.basicConfig()
 logging.getLogger().setLevel(logging.INFO)
@@ -12,6 +11,5 @@ exchange.subscribe('EURUSD')
 
 exchange.tick_received.connect(lambda symbol, tick: print(symbol, tick))
 
-for i in range(10):
-    exchange.process_events()
-    sleep(1)
\ No newline at end of file
+# Notifies ticks as soon as they are received, for 10 seconds.
+exchange.run_until(timeout=10)
\ No newline at end of file
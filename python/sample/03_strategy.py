@@ -4,8 +4,10 @@ import rmt
 from time import sleep
 
 class MyStrategy(rmt.Strategy):
-    def on_bar_closed(self, symbol: str, bar: rmt.Bar):
-        print('on_bar_closed:', symbol, bar)
+    timeframes = (rmt.Timeframe.M1, rmt.Timeframe.M5)
+
+    def on_bar_closed(self, symbol: str, timeframe: rmt.Timeframe, bar: rmt.Bar):
+        print('on_bar_closed:', symbol, timeframe.value, bar)
 
     def on_tick(self, symbol: str, server_time: datetime, bid: float, ask: float):
         print('on_tick:', symbol, server_time, bid, ask)
@@ -0,0 +1,26 @@
+import asyncio
+import logging
+import rmt
+
+logging.basicConfig()
+logging.getLogger().setLevel(logging.INFO)
+
+async def main():
+    async with rmt.exchanges.AsyncMetaTrader4() as exchange:
+        exchange.tick_received.connect(lambda symbol, tick: print(symbol, tick))
+
+        await exchange.subscribe('US100')
+
+        # Both requests are in flight at the same time, and ticks keep being
+        # received while they are outstanding.
+        bars, tick = await asyncio.gather(
+            exchange.get_history_bars('US100', timeframe=rmt.Timeframe.H1),
+            exchange.get_tick('US100', timeout=1)
+        )
+
+        print('H1 bars:', len(bars))
+        print('tick:', tick)
+
+        await asyncio.sleep(5)
+
+asyncio.run(main())
\ No newline at end of file
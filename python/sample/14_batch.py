@@ -0,0 +1,25 @@
+import logging
+import rmt
+from rmt.exchanges.mt4 import requests
+
+logging.basicConfig()
+logging.getLogger().setLevel(logging.INFO)
+
+exchange = rmt.exchanges.MetaTrader4()
+
+symbols = ['US100', 'XAUUSD', 'EURUSD']
+ticks   = {}
+
+# Sends all requests below in a single round trip.
+with exchange.batch() as batch:
+    for symbol in symbols:
+        ticks[symbol] = batch.add(requests.GetTickRequest(symbol))
+        exchange.subscribe(symbol, batch=batch)
+
+for symbol, result in ticks.items():
+    try:
+        print(symbol, result.response().tick())
+    except rmt.error.RMTError as e:
+        print(symbol, 'failed:', e)
+
+print('subscriptions:', exchange.subscriptions())
\ No newline at end of file
@@ -0,0 +1,23 @@
+import logging
+import sys
+import rmt
+from PyQt5.QtCore import QCoreApplication, QTimer
+
+logging.basicConfig()
+logging.getLogger().setLevel(logging.INFO)
+
+app = QCoreApplication(sys.argv)
+
+exchange = rmt.exchanges.MetaTrader4()
+exchange.subscribe('EURUSD')
+exchange.subscribe('XAUUSD')
+
+exchange.tick_received.connect(lambda symbol, tick: print(symbol, tick))
+
+# Ticks are notified by Qt's event loop as soon as they are received, with no polling timer.
+exchange.attach_to_qt_event_loop()
+
+QTimer.singleShot(10000, app.quit)
+app.exec_()
+
+exchange.disconnect()
\ No newline at end of file
@@ -0,0 +1,63 @@
+import shutil
+import tempfile
+import unittest
+from datetime          import datetime, timedelta, timezone
+from rmt               import Timeframe
+from rmt.exchanges.mt4 import MetaTrader4, StandInServer
+
+START = datetime(2020, 9, 14, 12, 0, tzinfo=timezone.utc)
+END   = START + timedelta(hours=1)
+
+class BarCacheTest(unittest.TestCase):
+    """Smoke tests of history bars cached on disk, fetched from the stand-in server."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+        self.server   = StandInServer()
+        self.requests = []
+
+        get_history_bars = self.server.handler('getHistoryBars')
+
+        def count(content):
+            self.requests.append((content.get('start_time'), content.get('end_time')))
+            return get_history_bars(content)
+
+        self.server.set_handler('getHistoryBars', count)
+        self.server.start()
+        self.addCleanup(self.server.stop)
+
+        self.exchange = MetaTrader4(req_port=self.server.req_port(), sub_port=self.server.sub_port(), bar_cache=self.directory)
+        self.addCleanup(self.exchange.disconnect)
+
+    def test_cached_bars_are_not_fetched_again(self):
+        cache = self.exchange.bar_cache()
+        first = self.exchange.get_history_bar_series('EURUSD', START, END, Timeframe.M1)
+
+        self.assertEqual(len(first), 61)
+        self.assertEqual((cache.hit_count(), cache.miss_count()), (0, 61))
+
+        # All bars but the last, which may have been open when fetched, are cached.
+        self.assertEqual(cache.coverage('EURUSD', Timeframe.M1), (START, END - timedelta(seconds=1)))
+
+        second = self.exchange.get_history_bar_series('EURUSD', START, END, Timeframe.M1)
+
+        self.assertEqual((cache.hit_count(), cache.miss_count()), (60, 62))
+        self.assertEqual(second.closes().tolist(), first.closes().tolist())
+        self.assertEqual(self.requests[-1], (int(END.timestamp()), int(END.timestamp())))
+
+    def test_only_missing_bars_are_fetched(self):
+        self.exchange.get_history_bar_series('EURUSD', START, END, Timeframe.M1)
+
+        bars = self.exchange.get_history_bars('EURUSD', START - timedelta(minutes=30), END, Timeframe.M1)
+
+        self.assertEqual(len(bars), 91)
+        self.assertEqual(bars[0].time, START - timedelta(minutes=30))
+        self.assertEqual(self.requests[1:], [
+            (int((START - timedelta(minutes=30)).timestamp()), int(START.timestamp()) - 1),
+            (int(END.timestamp()), int(END.timestamp()))
+        ])
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
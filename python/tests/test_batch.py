@@ -0,0 +1,61 @@
+import unittest
+from rmt               import error
+from rmt.exchanges.mt4 import MetaTrader4, StandInServer, requests
+
+class BatchTest(unittest.TestCase):
+    """Smoke tests of batches, sent in one round trip or one request at a time."""
+
+    def setUp(self):
+        self.server   = StandInServer()
+        self.commands = []
+
+        for command in ['batch', 'getTick', 'getOrder']:
+            self.server.set_handler(command, self.counting(command, self.server.handler(command)))
+
+        self.server.start()
+
+        self.exchange = MetaTrader4(req_port=self.server.req_port(), sub_port=self.server.sub_port())
+
+    def tearDown(self):
+        self.exchange.disconnect()
+        self.server.stop()
+
+    def counting(self, command, handler):
+        def count(content):
+            self.commands.append(command)
+            return handler(content)
+
+        return count
+
+    def send_batch(self):
+        with self.exchange.batch() as batch:
+            eurusd = batch.add(requests.GetTickRequest('EURUSD'))
+            order  = batch.add(requests.GetOrderRequest(42))
+
+        return eurusd, order
+
+    def test_batch_is_sent_in_one_round_trip(self):
+        eurusd, order = self.send_batch()
+
+        # The requests of a batch are handled within the batch command.
+        self.assertEqual(self.commands[0], 'batch')
+        self.assertEqual(self.commands.count('batch'), 1)
+        self.assertGreater(eurusd.response().tick().bid, 0)
+
+        # A failed request does not affect the others.
+        with self.assertRaises(error.RMTError):
+            order.response()
+
+    def test_batch_falls_back_to_one_request_at_a_time(self):
+        self.server.set_handler('batch', None)
+
+        eurusd, order = self.send_batch()
+
+        self.assertEqual(self.commands, ['getTick', 'getOrder'])
+        self.assertGreater(eurusd.response().tick().bid, 0)
+
+        with self.assertRaises(error.RMTError):
+            order.response()
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
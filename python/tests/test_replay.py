@@ -0,0 +1,90 @@
+import unittest
+from datetime      import datetime, timedelta, timezone
+from rmt           import Tick, Timeframe, Strategy
+from rmt.exchanges import replay
+
+START = datetime(2020, 9, 14, 12, 0, tzinfo=timezone.utc)
+
+def ticks(count: int):
+    """Ticks of EURUSD and GBPUSD, in turn, 20 seconds apart."""
+
+    for i in range(count):
+        symbol = 'EURUSD' if i % 2 == 0 else 'GBPUSD'
+
+        yield symbol, Tick(START + timedelta(seconds=20 * i), 1.17 + i * 1e-5, 1.1702 + i * 1e-5)
+
+class CountingStrategy(Strategy):
+    def __init__(self, exchange, stop_after=None):
+        super().__init__(exchange)
+
+        self.ticks       = []
+        self.bars_closed = []
+        self.stop_after  = stop_after
+
+    def on_tick(self, symbol, server_time, bid, ask):
+        self.ticks.append((symbol, server_time))
+
+        if self.stop_after is not None and len(self.ticks) == self.stop_after:
+            self.exchange.stop()
+
+    def on_bar_closed(self, symbol, timeframe, bar):
+        self.bars_closed.append((symbol, timeframe, bar.time))
+
+class ReplayExchangeTest(unittest.TestCase):
+    """Smoke tests of the replay of ticks to a strategy."""
+
+    def test_replays_ticks_of_subscribed_symbols(self):
+        exchange = replay.ReplayExchange(ticks(30))
+        strategy = CountingStrategy(exchange)
+
+        # No tick was replayed yet, so bars start at the first tick.
+        with self.assertLogs('Strategy', 'WARNING'):
+            strategy.subscribe('EURUSD')
+
+        exchange.run()
+
+        self.assertTrue(exchange.is_finished())
+        self.assertEqual(exchange.replayed_count(), 30)
+        self.assertEqual(len(strategy.ticks), 15)
+        self.assertTrue(all(symbol == 'EURUSD' for symbol, _ in strategy.ticks))
+
+        # Ticks span 10 minutes, whose bars all close but the last one.
+        self.assertEqual(
+            [server_time for _, _, server_time in strategy.bars_closed],
+            [START + timedelta(minutes=i) for i in range(9)]
+        )
+
+        self.assertEqual(exchange.get_tick('GBPUSD').server_time, START + timedelta(seconds=20 * 29))
+        self.assertEqual(exchange.get_current_bar('EURUSD', Timeframe.M1).time, START + timedelta(minutes=9))
+
+    def test_stopped_replay_resumes(self):
+        exchange = replay.ReplayExchange(ticks(30))
+        strategy = CountingStrategy(exchange, stop_after=5)
+
+        exchange.subscribe_all()
+        exchange.run()
+
+        self.assertFalse(exchange.is_finished())
+        self.assertEqual(len(strategy.ticks), 5)
+        self.assertEqual(exchange.replayed_count(), 5)
+
+        strategy.stop_after = None
+        exchange.run()
+
+        self.assertTrue(exchange.is_finished())
+        self.assertEqual(len(strategy.ticks), 30)
+        self.assertEqual([time for _, time in strategy.ticks], [tick.server_time for _, tick in ticks(30)])
+
+    def test_process_events_replays_after_stop(self):
+        exchange = replay.ReplayExchange(ticks(10))
+        exchange.subscribe_all()
+
+        # A stop requested before `process_events()` does not halt it.
+        exchange.stop()
+
+        self.assertEqual(exchange.process_events(max_events=4), (4, True))
+        self.assertEqual(exchange.process_events(), (6, False))
+        self.assertTrue(exchange.is_finished())
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
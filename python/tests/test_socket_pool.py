@@ -0,0 +1,72 @@
+import threading
+import time
+import unittest
+from rmt               import error
+from rmt.exchanges.mt4 import MetaTrader4, RetryPolicy, StandInServer
+
+class ReqSocketPoolTest(unittest.TestCase):
+    """Smoke tests of the REQ socket pool and of the retry policy of `MetaTrader4`."""
+
+    def setUp(self):
+        self.server = StandInServer(latency=0.05)
+        self.server.start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def exchange(self, **kwargs) -> MetaTrader4:
+        exchange = MetaTrader4(req_port=self.server.req_port(), sub_port=self.server.sub_port(), **kwargs)
+        self.addCleanup(exchange.disconnect)
+
+        return exchange
+
+    def test_requests_of_threads_overlap(self):
+        exchange = self.exchange(pool_size=4)
+        ticks    = []
+
+        def get_tick():
+            ticks.append(exchange.get_tick('EURUSD', timeout=5.0))
+
+        threads = [threading.Thread(target=get_tick) for _ in range(8)]
+        start   = time.monotonic()
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        # 8 round trips of 50 ms, 4 at a time, rather than one after the other.
+        self.assertEqual(len(ticks), 8)
+        self.assertLess(time.monotonic() - start, 0.35)
+        self.assertLessEqual(exchange.socket_pool_metrics().connections(), 4)
+
+    def test_lost_reply_is_retried(self):
+        exchange = self.exchange(retry_policy=RetryPolicy(max_retries=1, backoff=0.01))
+
+        self.server.drop_replies(1)
+        tick = exchange.get_tick('EURUSD', timeout=2.0)
+
+        self.assertGreater(tick.bid, 0)
+        self.assertEqual(exchange.socket_pool_metrics().retries(), 1)
+        self.assertEqual(exchange.socket_pool_metrics().reconnects(), 1)
+
+    def test_lost_reply_times_out_without_retries(self):
+        exchange = self.exchange(retry_policy=RetryPolicy(max_retries=0))
+
+        self.server.drop_replies(1)
+
+        with self.assertRaises(error.RequestTimeout):
+            exchange.get_tick('EURUSD', timeout=0.3)
+
+        # The socket was replaced, so the next request gets through.
+        self.assertGreater(exchange.get_tick('EURUSD', timeout=2.0).bid, 0)
+
+    def test_orders_are_not_retried_by_default(self):
+        policy = RetryPolicy()
+        self.assertNotIn('placeOrder', policy.retryable_commands())
+        self.assertIn('getTick', policy.retryable_commands())
+        self.assertEqual([policy.backoff(n) for n in (1, 2, 3)], [0.1, 0.2, 0.4])
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
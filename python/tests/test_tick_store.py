@@ -0,0 +1,105 @@
+import shutil
+import tempfile
+import unittest
+from datetime          import datetime, timedelta, timezone
+from rmt               import Tick
+from rmt.exchanges     import replay
+from rmt.tick_recorder import RECORD_DTYPE, TickRecorder, TickRecording
+from rmt.tick_store    import TickStore
+
+START = datetime(2020, 9, 14, 12, 0, tzinfo=timezone.utc)
+
+def ticks(count: int):
+    """Ticks of EURUSD, GBPUSD and USDJPY, in turn, a second apart."""
+
+    symbols = ['EURUSD', 'GBPUSD', 'USDJPY']
+
+    for i in range(count):
+        yield symbols[i % 3], Tick(START + timedelta(seconds=i), 1.0 + i, 2.0 + i)
+
+class TickStoreTest(unittest.TestCase):
+    def test_store_keeps_last_ticks(self):
+        store = TickStore(capacity=4)
+
+        for symbol, tick in ticks(30):
+            store.append(symbol, tick)
+
+        self.assertEqual(store.symbols(), ['EURUSD', 'GBPUSD', 'USDJPY'])
+        self.assertEqual(store.count('EURUSD'), 4)
+        self.assertEqual(store.last('EURUSD', 2).bids().tolist(), [25.0, 28.0])
+
+        window = store.between('GBPUSD', START + timedelta(seconds=20), START + timedelta(seconds=25))
+
+        self.assertEqual(window.bids().tolist(), [23.0, 26.0])
+        self.assertEqual(window.tick(0).server_time, START + timedelta(seconds=22))
+
+    def test_store_appends_ticks_of_exchange(self):
+        exchange = replay.ReplayExchange(ticks(30))
+        store    = TickStore(exchange, symbols=['USDJPY'])
+
+        exchange.subscribe_all()
+        exchange.run()
+
+        self.assertEqual(store.symbols(), ['USDJPY'])
+        self.assertEqual(store.count('USDJPY'), 10)
+
+class TickRecorderTest(unittest.TestCase):
+    """Round trips of ticks through a recording of several segments."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def record(self, count: int, **kwargs) -> TickRecorder:
+        # Segments of 16 records.
+        recorder = TickRecorder(self.directory, segment_size=16 * RECORD_DTYPE.itemsize, buffer_size=5, **kwargs)
+
+        for symbol, tick in ticks(count):
+            recorder.append(symbol, tick)
+
+        return recorder
+
+    def test_recording_reads_ticks_of_each_segment(self):
+        self.record(100).close()
+
+        recording = TickRecording(self.directory)
+
+        self.assertEqual(recording.segment_count(), 7)
+        self.assertEqual(recording.symbols(), ['EURUSD', 'GBPUSD', 'USDJPY'])
+        self.assertEqual(recording.count('EURUSD'), 34)
+
+        window = recording.read('GBPUSD')
+
+        self.assertEqual(window.bids().tolist(), [1.0 + i for i in range(1, 100, 3)])
+        self.assertEqual(window.times().tolist(), [(START + timedelta(seconds=i)).timestamp() for i in range(1, 100, 3)])
+
+        segments = list(recording.read_segments('GBPUSD', START + timedelta(seconds=10), START + timedelta(seconds=40)))
+
+        self.assertEqual([len(segment) for segment in segments], [2, 6, 3])
+        self.assertEqual(segments[0].tick(0).bid, 11.0)
+        self.assertEqual(segments[-1].tick(2).bid, 41.0)
+
+    def test_recording_reads_unsealed_segment(self):
+        recorder = self.record(20)
+        recorder.flush()
+
+        recording = TickRecording(self.directory)
+
+        self.assertEqual(recording.segment_count(), 2)
+        self.assertEqual(recording.read('USDJPY').bids().tolist(), [1.0 + i for i in range(2, 20, 3)])
+
+        recorder.close()
+
+    def test_recorded_ticks_are_merged_in_order(self):
+        self.record(100).close()
+
+        replayed = list(replay.recorded_ticks(self.directory, ['USDJPY', 'EURUSD']))
+
+        self.assertEqual(len(replayed), 67)
+        self.assertEqual(
+            [(symbol, tick.server_time, tick.bid) for symbol, tick in replayed],
+            [(symbol, tick.server_time, tick.bid) for symbol, tick in ticks(100) if symbol != 'GBPUSD']
+        )
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file